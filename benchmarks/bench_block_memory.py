@@ -0,0 +1,102 @@
+"""
+Memory held by parsed block trees, in bytes per block.
+
+Parses a generated graph, then copies every page's block tree into the
+current Block layout and into the previous one (a plain dataclass with a
+per-instance __dict__, a fresh properties dict, children list and links list
+on every block and a separate string per property key). Both copies share
+the content strings; tracemalloc measures what each copy holds.
+
+Run with: PYTHONPATH=src python benchmarks/bench_block_memory.py [--files 2000]
+"""
+import argparse
+import gc
+import tempfile
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from graph_generator import generate_graph
+
+from logseq_converter.logseq.models import EMPTY_BLOCKS, EMPTY_LINKS, EMPTY_PROPERTIES, Block
+from logseq_converter.logseq.parser import LogSeqParser
+from logseq_converter.utils import trim_empty_bullets
+
+
+@dataclass
+class LegacyBlock:
+    content: str
+    id: Optional[str] = None
+    properties: Dict[str, str] = field(default_factory=dict)
+    children: List["LegacyBlock"] = field(default_factory=list)
+    cleaned_content: str = ""
+    span: Optional[Tuple[int, int]] = None
+    links: list = field(default_factory=list)
+
+
+def to_legacy(block) -> LegacyBlock:
+    # Fresh strings, as a parser creating them per block would
+    return LegacyBlock(
+        content=block.content,
+        id=block.id,
+        properties={"".join(key): value for key, value in block.properties.items()},
+        children=[to_legacy(child) for child in block.children],
+        cleaned_content=block.cleaned_content,
+        span=block.span,
+        links=list(block.links),
+    )
+
+
+def to_current(block) -> Block:
+    return Block(
+        content=block.content,
+        id=block.id,
+        properties=dict(block.properties) if block.properties else EMPTY_PROPERTIES,
+        children=[to_current(child) for child in block.children] if block.children else EMPTY_BLOCKS,
+        cleaned_content=block.cleaned_content,
+        span=block.span,
+        links=list(block.links) if block.links else EMPTY_LINKS,
+    )
+
+
+def count_blocks(blocks) -> int:
+    return sum(1 + count_blocks(block.children) for block in blocks)
+
+
+def measure(build) -> Tuple[object, int]:
+    """Returns what build() made and the bytes it still holds."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, held
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--files", type=int, default=2_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--parser", choices=("mistletoe", "fast"), default="fast")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        generate_graph(Path(workdir), args.files, args.seed)
+        documents = [trim_empty_bullets(path.read_text(encoding="utf-8")) for path in Path(workdir).glob("*/*.md")]
+
+    logseq_parser = LogSeqParser(args.parser)
+    trees = [logseq_parser._parse_blocks(content) for content in documents]
+    blocks = sum(count_blocks(tree) for tree in trees)
+    _, legacy = measure(lambda: [[to_legacy(block) for block in tree] for tree in trees])
+    _, current = measure(lambda: [[to_current(block) for block in tree] for tree in trees])
+
+    print(f"{blocks} blocks in {len(documents)} files")
+    print(f"  previous layout: {legacy / blocks:>7.0f} bytes/block")
+    print(f"  current layout:  {current / blocks:>7.0f} bytes/block ({legacy / current:.2f}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark ObsidianConverter.convert_content against the previous multi-pass
+pipeline on large generated pages.
+
+Run with: PYTHONPATH=src python benchmarks/bench_convert_content.py [--blocks N]
+"""
+import argparse
+import sys
+import time
+from functools import partial
+from pathlib import Path
+
+from logseq_converter.logseq.parser import BlockReferenceScanner
+from logseq_converter.obsidian.converter import ObsidianConverter
+
+# The previous pipeline lives on as the reference of the differential test
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "tests" / "unit"))
+from test_content_transform import reference_convert_content as multi_pass_convert_content  # noqa: E402
+
+UUID_TEMPLATE = "64a1b2c3-0000-4000-8000-{:012x}"
+
+
+LOGBOOK = ["  :LOGBOOK:", "  CLOCK: [2024-01-01 Mon 10:00]--[2024-01-01 Mon 11:00] =>  01:00:00", "  :END:"]
+
+
+def generate_page(blocks: int, links: bool) -> str:
+    """
+    A large page with properties, logbooks and block IDs. With links, every
+    block also carries wiki links and a block reference; date parsing of the
+    links then dominates both pipelines.
+    """
+    lines = ["title:: Large page", "tags:: benchmark, generated", "collapsed:: true", ""]
+    for i in range(blocks):
+        if links:
+            lines.append(f"- Block {i} mentions [[Page {i % 50}]] and [[2024-01-{i % 28 + 1:02d}]]")
+        else:
+            lines.append(f"- Block {i} with some plain text")
+        if i % 3 == 0:
+            lines.append(f"  id:: {UUID_TEMPLATE.format(i)}")
+        if links and i % 5 == 0:
+            lines.append(f"  - See (({UUID_TEMPLATE.format(i - i % 3)})) for details")
+        if i % 7 == 0:
+            lines.extend(LOGBOOK)
+        if i % 11 == 0:
+            lines.append("  collapsed:: true")
+        lines.append("  - Plain child text without any markup")
+    return "\n".join(lines)
+
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--blocks", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    scanner = BlockReferenceScanner()
+    for i in range(0, max(args.blocks), 3):
+        scanner.block_map[UUID_TEMPLATE.format(i)] = Path("pages/Large page.md")
+    converter = ObsidianConverter(scanner)
+
+    print(f"{'page':>10} {'blocks':>8} {'size':>10} {'multi-pass':>12} {'single-pass':>12} {'speedup':>8}")
+    for links in (False, True):
+        for blocks in args.blocks:
+            content = generate_page(blocks, links)
+            assert converter.convert_content(content) == multi_pass_convert_content(converter, content)
+
+            multi = best_of(partial(multi_pass_convert_content, converter, content), args.repeat)
+            single = best_of(partial(converter.convert_content, content), args.repeat)
+            print(
+                f"{'links' if links else 'structure':>10} {blocks:>8} {len(content) / 1024:>8.0f}KB "
+                f"{multi * 1000:>10.1f}ms {single * 1000:>10.1f}ms {multi / single:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Tree walks on a pathologically deep outline.
+
+Builds a single chain of blocks (10,000 levels by default, far past Python's
+recursion limit) and times each operation that walks block or Tana node
+trees: flattening sub-items, Tana conversion and summary counts, and Blinko
+Markdown conversion. Also parses a deep outline with the fast backend and
+writes a deep Tana node as JSON; the indentation of both grows with depth,
+so they are kept shallower.
+
+Run with: PYTHONPATH=src python benchmarks/bench_deep_outline.py [--depth 10000] [--parse-depth 2000]
+"""
+import argparse
+import io
+import time
+
+from logseq_converter.blinko.converter import BlinkoConverter
+from logseq_converter.logseq.models import Block, Page
+from logseq_converter.logseq.parser import LogSeqParser
+from logseq_converter.logseq.walk import walk
+from logseq_converter.tana.converter import TanaConverter
+from logseq_converter.tana.writer import TanaStreamWriter
+
+
+def chain(depth: int) -> Block:
+    root = node = Block(content="Level 0 [[Page]] #tag")
+    for level in range(1, depth):
+        child = Block(content=f"Level {level} [[Page]] #tag")
+        node.children = [child]
+        node = child
+    return root
+
+
+def timed(label: str, operation) -> None:
+    start = time.perf_counter()
+    operation()
+    print(f"  {label:<28} {(time.perf_counter() - start) * 1000:>9.1f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--depth", type=int, default=10_000)
+    parser.add_argument("--parse-depth", type=int, default=2_000)
+    args = parser.parse_args()
+
+    root = chain(args.depth)
+    page = Page(filename="Deep.md", content="", blocks=[root])
+    tana = TanaConverter()
+    node = tana.convert_block(root)
+
+    print(f"{args.depth} levels")
+    timed("walk (pre-order)", lambda: sum(1 for _ in walk([root])))
+    timed("walk (post-order)", lambda: sum(1 for _ in walk([root], post_order=True)))
+    timed("flatten sub-items", lambda: LogSeqParser()._flatten_block_content_with_indent([root]))
+    timed("tana convert_block", lambda: tana.convert_block(root))
+    timed("tana summary counts", lambda: tana.create_tana_file_from_nodes([node]))
+    timed("blinko convert_page", lambda: BlinkoConverter().convert_page(page))
+
+    content = "\n".join(f"{'  ' * level}- Level {level}" for level in range(args.parse_depth))
+    print(f"{args.parse_depth} levels, {len(content) / 1024 / 1024:.1f}MB of text")
+    timed("parse (fast backend)", lambda: LogSeqParser("fast")._parse_blocks(content))
+    shallow = tana.convert_block(chain(args.parse_depth))
+    timed("tana write_node", lambda: TanaStreamWriter(io.StringIO()).write_node(shallow))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""
+End-to-end conversion benchmark on generated graphs.
+
+For every graph size a synthetic graph is generated (see graph_generator.py)
+and each command runs in its own Python process, so peak RSS is measured per
+command. Phases are delimited by the progress messages the commands already
+print ("Scanning for block IDs...", "Processing files...", ...).
+
+Run with: PYTHONPATH=src python benchmarks/bench_end_to_end.py [--sizes 1000 10000 100000]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from graph_generator import generate_graph
+
+COMMANDS = ("obsidian", "tolaria", "tana", "blinko")
+# Progress messages that start a phase; other messages belong to the current phase
+PHASE_MESSAGES = {
+    "Converting '": "convert",
+    "Scanning for block IDs": "block-id scan",
+    "Copying assets": "assets",
+    "Processing files": "convert",
+    "Writing output": "write output",
+    "Conversion complete": "finalize",
+}
+# BlinkoClient only checks that the token looks like a JWT; --dry-run never sends it
+FAKE_BLINKO_TOKEN = "benchmark.fake.token"
+
+
+def _peak_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_child(command: str, source: Path, destination: Path) -> dict:
+    """Runs one command in this process and returns its timings."""
+    from logseq_converter import cli
+
+    marks = []
+    original_log_progress = cli.log_progress
+
+    def timed_log_progress(message: str) -> None:
+        for prefix, phase in PHASE_MESSAGES.items():
+            if message.startswith(prefix):
+                marks.append((time.perf_counter(), phase))
+                break
+        original_log_progress(message)
+
+    cli.log_progress = timed_log_progress
+    # Plugin downloads would measure the network, not the converter
+    from logseq_converter.obsidian import configurator
+
+    configurator.configure_community_plugins = lambda destination: None
+
+    args = {
+        "obsidian": ["obsidian", str(source), str(destination / "obsidian")],
+        "tolaria": ["tolaria", str(source), str(destination / "tolaria")],
+        "tana": ["tana", str(source), str(destination / "tana.json")],
+        "blinko": ["blinko", str(source), "http://localhost:1", "--dry-run"],
+    }[command]
+
+    sys.argv = ["logseq-converter", *args]
+    start = time.perf_counter()
+    result = cli.main()
+    end = time.perf_counter()
+
+    phases = {}
+    boundaries = [(start, "startup")] + marks + [(end, None)]
+    for (began, name), (finished, _) in zip(boundaries, boundaries[1:], strict=False):
+        if name is not None:
+            phases[name] = phases.get(name, 0.0) + finished - began
+
+    return {"exit_code": result, "wall_seconds": end - start, "phases": phases, "peak_rss_mb": _peak_rss_mb()}
+
+
+def run_command(command: str, source: Path, destination: Path) -> dict:
+    env = dict(os.environ)
+    env.update(
+        {
+            "LSC_LLM": "none",
+            "BLINKO_TOKEN": FAKE_BLINKO_TOKEN,
+            # A fresh cache directory, so the persistent block index starts cold
+            "XDG_CACHE_HOME": str(destination / f"cache-{command}"),
+        }
+    )
+    completed = subprocess.run(
+        [sys.executable, __file__, "--child", command, str(source), str(destination)],
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="End-to-end conversion benchmark on generated graphs")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000], help="Files per graph")
+    parser.add_argument("--commands", nargs="+", choices=COMMANDS, default=list(COMMANDS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workdir", type=Path, help="Where to generate graphs (default: a temporary directory)")
+    parser.add_argument("--json", type=Path, help="Also write the results to this file")
+    parser.add_argument("--child", nargs=3, metavar=("COMMAND", "SOURCE", "DEST"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        command, source, destination = args.child
+        print(json.dumps(run_child(command, Path(source), Path(destination))))
+        return
+
+    results = []
+    with tempfile.TemporaryDirectory(dir=args.workdir) as workdir:
+        for size in args.sizes:
+            source = Path(workdir) / f"graph-{size}"
+            start = time.perf_counter()
+            summary = generate_graph(source, size, args.seed)
+            print(
+                f"\nGraph: {summary.files} files ({summary.size_bytes / 1024 / 1024:.1f} MB), "
+                f"generated in {time.perf_counter() - start:.1f}s"
+            )
+            print(f"{'command':>10} {'wall':>9} {'files/s':>9} {'peak RSS':>10}  phases")
+
+            for command in args.commands:
+                destination = Path(workdir) / f"out-{size}"
+                destination.mkdir(exist_ok=True)
+                result = run_command(command, source, destination)
+                result.update({"command": command, "files": summary.files, "size": size})
+                result["files_per_second"] = summary.files / result["wall_seconds"]
+                results.append(result)
+
+                phases = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in result["phases"].items())
+                rss = f"{result['peak_rss_mb']:.0f}MB" if result["peak_rss_mb"] is not None else "n/a"
+                print(
+                    f"{command:>10} {result['wall_seconds']:>8.2f}s {result['files_per_second']:>9.0f} "
+                    f"{rss:>10}  {phases}"
+                )
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
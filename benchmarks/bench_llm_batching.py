@@ -0,0 +1,109 @@
+"""
+LLM filename generation against a local fake endpoint.
+
+Serves an OpenAI-compatible chat completions endpoint on localhost that
+answers after a fixed round-trip latency plus a per-note generation time,
+and names every note it is given (a JSON array for batch prompts). Each batch
+size resolves the same notes with OllamaLLMClient pointed at that endpoint
+and reports the requests sent and the wall time per 1,000 notes.
+
+Run with: PYTHONPATH=src python benchmarks/bench_llm_batching.py [--items 1000] [--batch-sizes 1 5 10 20]
+"""
+import argparse
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from logseq_converter.llm import OllamaLLMClient
+
+_NOTE_PATTERN = re.compile(r"^Note \d+:$", re.MULTILINE)
+
+
+class FakeEndpoint(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, latency: float, per_note: float):
+        super().__init__(("127.0.0.1", 0), FakeCompletionHandler)
+        self.latency = latency
+        self.per_note = per_note
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def count_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+
+class FakeCompletionHandler(BaseHTTPRequestHandler):
+    def do_POST(self) -> None:
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        prompt = body["messages"][-1]["content"]
+        notes = len(_NOTE_PATTERN.findall(prompt))
+        self.server.count_request()
+        time.sleep(self.server.latency + self.server.per_note * max(1, notes))
+
+        if notes:
+            content = json.dumps([f"Generated Note {number}" for number in range(1, notes + 1)])
+        else:
+            content = "Generated Note"
+        payload = json.dumps(
+            {
+                "id": "bench",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body["model"],
+                "choices": [
+                    {"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}
+                ],
+            }
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=1_000, help="Notes to name per batch size")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 5, 10, 20])
+    parser.add_argument("--latency", type=float, default=0.05, help="Seconds per request before generating")
+    parser.add_argument("--per-note", type=float, default=0.005, help="Seconds of generation per note")
+    parser.add_argument("--max-concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    items = [(f"Learned about topic {i}", [f"- detail {i}", f"- more on {i}"]) for i in range(args.items)]
+    server = FakeEndpoint(args.latency, args.per_note)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host = f"http://127.0.0.1:{server.server_address[1]}"
+
+    print(f"{args.items} notes, {args.latency * 1000:.0f}ms per request + {args.per_note * 1000:.0f}ms per note")
+    print(f"{'batch':>6} {'requests':>9} {'wall':>9} {'requests/1k':>12} {'wall/1k':>9}")
+    try:
+        for batch_size in args.batch_sizes:
+            client = OllamaLLMClient(ollama_host=host, model="bench")
+            client.set_concurrency(maximum=args.max_concurrency)
+            client.batch_size = batch_size
+            server.requests = 0
+
+            start = time.perf_counter()
+            client.resolve_batch(items)
+            wall = time.perf_counter() - start
+
+            scale = 1_000 / args.items
+            print(
+                f"\r{batch_size:>6} {server.requests:>9} {wall:>8.2f}s "
+                f"{server.requests * scale:>12.0f} {wall * scale:>8.2f}s"
+            )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Benchmark the fast outline parser against the mistletoe backend on generated graphs.
+
+Every page and journal is parsed by both backends; the block trees must be
+identical. Reports parse time per backend, the speedup and how many files
+the fast backend handed back to mistletoe.
+
+Run with: PYTHONPATH=src python benchmarks/bench_parser.py [--files 1000 10000]
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from graph_generator import generate_graph
+
+from logseq_converter.logseq.outline import UnsupportedOutline, parse_outline
+from logseq_converter.logseq.parser import LogSeqParser
+from logseq_converter.utils import trim_empty_bullets
+
+
+def block_tree(blocks) -> list:
+    return [
+        (block.content, block.cleaned_content, block.properties, block.id, block.span, block_tree(block.children))
+        for block in blocks
+    ]
+
+
+def parse_all(parser: LogSeqParser, documents: list[str]) -> float:
+    start = time.perf_counter()
+    for content in documents:
+        parser._parse_blocks(content)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--files", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    mistletoe_parser, fast_parser = LogSeqParser(), LogSeqParser("fast")
+    print(f"{'files':>8} {'size':>8} {'mistletoe':>11} {'fast':>11} {'speedup':>8} {'fallbacks':>10}")
+    for files in args.files:
+        with tempfile.TemporaryDirectory() as workdir:
+            summary = generate_graph(Path(workdir), files, args.seed)
+            paths = sorted(Path(workdir).glob("*/*.md"))
+            # parse() trims empty bullets before parsing blocks
+            documents = [trim_empty_bullets(path.read_text(encoding="utf-8")) for path in paths]
+
+        fallbacks = 0
+        for content in documents:
+            assert block_tree(fast_parser._parse_blocks(content)) == block_tree(mistletoe_parser._parse_blocks(content))
+            try:
+                parse_outline(mistletoe_parser._extract_frontmatter(content)[1].splitlines())
+            except UnsupportedOutline:
+                fallbacks += 1
+
+        slow = parse_all(mistletoe_parser, documents)
+        fast = parse_all(fast_parser, documents)
+        print(
+            f"{files:>8} {summary.size_bytes / 1024 / 1024:>6.1f}MB {slow:>10.2f}s {fast:>10.2f}s "
+            f"{slow / fast:>7.2f}x {fallbacks:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
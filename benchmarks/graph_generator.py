@@ -0,0 +1,181 @@
+"""
+Generates synthetic LogSeq graphs for benchmarks.
+
+The graphs are deterministic for a given size and seed and contain the
+features the converters spend time on: namespaced pages (A___B___C.md),
+YYYY_MM_DD journals, blocks with id:: properties and ((uuid)) references to
+them, page and date links, #links/#learnings/#achievements sections in
+journals, :LOGBOOK: drawers, page properties and assets.
+
+Run with: PYTHONPATH=src python benchmarks/graph_generator.py DEST --files N
+"""
+import argparse
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List
+
+NAMESPACES = ["Projects", "Areas", "Resources", "People", "Books", "Meetings"]
+WORDS = (
+    "alpha beta gamma delta graph note block page journal link vault query index cache parser token "
+    "render export import design review release deploy metric latency memory budget worker queue"
+).split()
+LOGBOOK = [
+    ":LOGBOOK:",
+    "CLOCK: [2024-01-01 Mon 10:00:00]--[2024-01-01 Mon 11:30:00] =>  01:30:00",
+    ":END:",
+]
+
+
+@dataclass
+class GraphSummary:
+    pages: int
+    journals: int
+    assets: int
+    block_ids: int
+    block_refs: int
+    size_bytes: int
+
+    @property
+    def files(self) -> int:
+        return self.pages + self.journals
+
+
+class _GraphWriter:
+    def __init__(self, root: Path, rng: random.Random, page_names: List[str], asset_names: List[str]):
+        self.root = root
+        self.rng = rng
+        self.page_names = page_names
+        self.asset_names = asset_names
+        self.block_ids: List[str] = []
+        self.block_refs = 0
+        self.size_bytes = 0
+
+    def sentence(self, words: int = 8) -> str:
+        return " ".join(self.rng.choice(WORDS) for _ in range(words)).capitalize()
+
+    def new_block_id(self) -> str:
+        block_id = str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+        self.block_ids.append(block_id)
+        return block_id
+
+    def inline_markup(self) -> str:
+        roll = self.rng.random()
+        if roll < 0.25:
+            return f" [[{self.rng.choice(self.page_names).replace('___', '/')}]]"
+        if roll < 0.35:
+            day = date(2020, 1, 1) + timedelta(days=self.rng.randrange(1500))
+            return f" [[{day.strftime('%b %d, %Y')}]]"
+        if roll < 0.45 and self.block_ids:
+            self.block_refs += 1
+            return f" (({self.rng.choice(self.block_ids)}))"
+        if roll < 0.5:
+            return f" #{self.rng.choice(WORDS)}"
+        if roll < 0.53 and self.asset_names:
+            return f" ![image](../assets/{self.rng.choice(self.asset_names)})"
+        return ""
+
+    def blocks(self, count: int, indent: str = "") -> List[str]:
+        lines = []
+        for _ in range(count):
+            lines.append(f"{indent}- {self.sentence()}{self.inline_markup()}")
+            if self.rng.random() < 0.15:
+                lines.append(f"{indent}  id:: {self.new_block_id()}")
+            if self.rng.random() < 0.05:
+                lines.append(f"{indent}  collapsed:: true")
+            if self.rng.random() < 0.08:
+                lines.extend(f"{indent}  {line}" for line in LOGBOOK)
+            if len(indent) < 8 and self.rng.random() < 0.3:
+                lines.extend(self.blocks(self.rng.randint(1, 3), indent + "  "))
+        return lines
+
+    def write(self, path: Path, lines: List[str]) -> None:
+        content = "\n".join(lines) + "\n"
+        path.write_text(content, encoding="utf-8")
+        self.size_bytes += len(content.encode("utf-8"))
+
+    def page(self, name: str) -> None:
+        lines = []
+        if self.rng.random() < 0.5:
+            lines.append(f"tags:: {self.rng.choice(WORDS)}, {self.rng.choice(WORDS)}")
+            lines.append(f"type:: {self.rng.choice(NAMESPACES)}")
+            lines.append("")
+        lines.extend(self.blocks(self.rng.randint(3, 12)))
+        self.write(self.root / "pages" / f"{name}.md", lines)
+
+    def journal(self, day: date) -> None:
+        lines = self.blocks(self.rng.randint(2, 8))
+        if self.rng.random() < 0.3:
+            lines.append("- ## #links")
+            for _ in range(self.rng.randint(1, 3)):
+                topic = self.rng.choice(WORDS)
+                lines.append(f"  - [{self.sentence(4)}](https://example.com/{topic}/{self.rng.randrange(10**6)})")
+                lines.append(f"    - {self.sentence()}")
+        if self.rng.random() < 0.3:
+            section = self.rng.choice(["learnings", "achievements", "highlights"])
+            lines.append(f"- ## #{section}")
+            for _ in range(self.rng.randint(1, 3)):
+                lines.append(f"  - {self.sentence(6)}")
+                lines.append(f"    - {self.sentence()}")
+        self.write(self.root / "journals" / f"{day.strftime('%Y_%m_%d')}.md", lines)
+
+
+def generate_graph(root: Path, files: int, seed: int = 0, journal_ratio: float = 0.4) -> GraphSummary:
+    """
+    Writes a graph of `files` pages and journals (plus assets) below root.
+    The same size and seed always produce the same graph.
+    """
+    rng = random.Random(seed)
+    journals = int(files * journal_ratio)
+    pages = files - journals
+    assets = max(1, files // 50)
+
+    for directory in ("pages", "journals", "assets"):
+        (root / directory).mkdir(parents=True, exist_ok=True)
+
+    page_names = []
+    for i in range(pages):
+        depth = rng.choice([0, 0, 1, 2])
+        parts = [rng.choice(NAMESPACES) for _ in range(depth)] + [f"{rng.choice(WORDS).capitalize()} {i}"]
+        page_names.append("___".join(parts))
+
+    asset_names = [f"image_{i}.png" for i in range(assets)]
+    for name in asset_names:
+        (root / "assets" / name).write_bytes(rng.randbytes(2048))
+
+    writer = _GraphWriter(root, rng, page_names, asset_names)
+    start = date(2015, 1, 1)
+    for i in range(journals):
+        writer.journal(start + timedelta(days=i))
+    for name in page_names:
+        writer.page(name)
+
+    return GraphSummary(
+        pages=pages,
+        journals=journals,
+        assets=assets,
+        block_ids=len(writer.block_ids),
+        block_refs=writer.block_refs,
+        size_bytes=writer.size_bytes,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic LogSeq graph")
+    parser.add_argument("destination", type=Path, help="Directory to create the graph in")
+    parser.add_argument("--files", type=int, default=1000, help="Number of pages and journals")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    summary = generate_graph(args.destination, args.files, args.seed)
+    print(
+        f"Generated {summary.pages} pages, {summary.journals} journals, {summary.assets} assets, "
+        f"{summary.block_ids} block IDs, {summary.block_refs} block refs "
+        f"({summary.size_bytes / 1024 / 1024:.1f} MB of markdown) in '{args.destination}'"
+    )
+
+
+if __name__ == "__main__":
+    main()
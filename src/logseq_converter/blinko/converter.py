@@ -1,7 +1,8 @@
 import re
-from typing import List, Union
+from typing import Iterable, List, Optional, Union
 
 from logseq_converter.logseq.models import Block, Journal, Page
+from logseq_converter.logseq.walk import walk
 
 
 class BlinkoConverter:
@@ -9,10 +10,12 @@ class BlinkoConverter:
     Converts Logseq Page/Journal models to Blinko-compatible Markdown content.
     """
 
-    def convert_page(self, page: Union[Page, Journal]) -> str:
+    def convert_page(self, page: Union[Page, Journal], blocks: Optional[Iterable[Block]] = None) -> str:
         """
         Converts a Page or Journal to a single Markdown string.
         Title is added as the first line if it's a Page.
+        blocks replaces page.blocks, e.g. with the root blocks streamed by
+        LogSeqParser.parse_streaming; each is converted and dropped in turn.
         """
         lines = []
 
@@ -33,26 +36,24 @@ class BlinkoConverter:
         lines.append(f"# {title}")
         lines.append("")
 
-        for block in page.blocks:
+        for block in page.blocks if blocks is None else blocks:
             lines.extend(self._convert_block(block, level=0))
 
         return "\n".join(lines)
 
     def _convert_block(self, block: Block, level: int) -> List[str]:
         """
-        Recursively convert blocks to Markdown list items.
+        Convert a block and its children to Markdown list items.
         """
         lines = []
-        indent = "  " * level
-
-        content = block.content.strip()
-        if content:
-            # Handle block properties if necessary, or strip them.
-            # For now, just dumping content.
-            # Assuming bullet points for blocks
-            lines.append(f"{indent}- {content}")
-
-        for child in block.children:
-            lines.extend(self._convert_block(child, level + 1))
+        for descendant, depth in walk([block]):
+            indent = "  " * (level + depth)
+
+            content = descendant.content.strip()
+            if content:
+                # Handle block properties if necessary, or strip them.
+                # For now, just dumping content.
+                # Assuming bullet points for blocks
+                lines.append(f"{indent}- {content}")
 
         return lines
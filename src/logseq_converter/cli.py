@@ -1,16 +1,43 @@
 import argparse
-import dataclasses
-import json
 import os
 import sys
 import time
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional, Sequence
 
 from logseq_converter.blinko import BlinkoClient, BlinkoConverter
-from logseq_converter.logseq.parser import BlockReferenceScanner, LogSeqParser
-from logseq_converter.obsidian.converter import ObsidianConverter
+from logseq_converter.date_links import DEFAULT_DATE_LINK_FORMATS
+from logseq_converter.filename_cache import NamespaceStats, filename_cache_path, read_stats
+from logseq_converter.logseq.block_index import PersistentBlockIndex, open_block_index
+from logseq_converter.logseq.loader import SourceLoader, SourceText, read_source_text
+from logseq_converter.logseq.parse_cache import (
+    DEFAULT_PARSE_CACHE_MB,
+    ParseCache,
+    ParseCacheUpdates,
+    open_parse_cache,
+)
+from logseq_converter.logseq.parser import (
+    DEFAULT_PARSER_BACKEND,
+    PARSER_BACKENDS,
+    BlockReferenceScanner,
+    LogSeqParser,
+)
+from logseq_converter.logseq.walk import flatten_tree, unflatten_tree
+from logseq_converter.manifest import (
+    MANIFEST_FILENAME,
+    ConversionManifest,
+    ConvertedSource,
+    get_converter_version,
+    hash_options,
+    remove_outputs,
+)
+from logseq_converter.obsidian.converter import BLOCK_REF_PATTERN, ObsidianConverter
+from logseq_converter.parallel import map_in_workers, resolve_jobs
+from logseq_converter.profiling import DEFAULT_SLOWEST_FILES, ConversionProfile
 from logseq_converter.stats import ConversionStats
 from logseq_converter.tana.converter import TanaConverter
+from logseq_converter.tana.models import TanaIntermediateNode
 from logseq_converter.utils import (
     copy_assets,
     is_markdown_empty,
@@ -21,6 +48,14 @@ from logseq_converter.utils import (
     validate_output_directory,
 )
 
+if TYPE_CHECKING:
+    from logseq_converter.tana.writer import TanaStreamWriter
+
+# Source text kept in memory between the block-ID scan and the conversion pass
+DEFAULT_MEMORY_BUDGET_MB = 256
+# Pages larger than this are parsed and converted one top-level block at a time
+DEFAULT_STREAM_THRESHOLD_MB = 8
+
 
 def convert_vault(
     source: Path,
@@ -28,6 +63,19 @@ def convert_vault(
     verbose: bool,
     dry_run: bool = False,
     clear_llm_cache: bool = False,
+    jobs: int = 1,
+    incremental: bool = False,
+    memory_budget_mb: int = DEFAULT_MEMORY_BUDGET_MB,
+    block_index: bool = True,
+    date_formats: Sequence[str] = DEFAULT_DATE_LINK_FORMATS,
+    parser_backend: str = DEFAULT_PARSER_BACKEND,
+    profile: bool = False,
+    profile_top: int = DEFAULT_SLOWEST_FILES,
+    profile_json: Optional[Path] = None,
+    llm_min_concurrency: Optional[int] = None,
+    llm_max_concurrency: Optional[int] = None,
+    llm_batch_size: int = 1,
+    changes: Optional[tuple[list[Path], list[Path]]] = None,
 ) -> int:
     try:
         validate_logseq_source(source)
@@ -35,12 +83,14 @@ def convert_vault(
         log_warning(str(e))
         return 1
 
+    timings = ConversionProfile()
+
     # Validate LogSeq directory structure
     pages_dir = source / "pages"
     journals_dir = source / "journals"
 
     try:
-        validate_output_directory(destination)
+        _validate_destination(destination, incremental)
     except FileExistsError as e:
         log_warning(str(e))
         return 1
@@ -50,23 +100,38 @@ def convert_vault(
 
     log_progress(f"Converting '{source}' to '{destination}'...")
 
-    # Pass 1: Scan for block IDs
+    # Pass 1: Scan for block IDs, keeping page and journal text for the conversion pass
     log_progress("Scanning for block IDs...")
-    scanner = BlockReferenceScanner()
-
-    # Walk source to scan
-    for root, _, files in os.walk(source):
-        for file in files:
-            if file.endswith(".md"):
-                scanner.scan_file(Path(root) / file)
+    scanner = open_block_index(source) if block_index else BlockReferenceScanner()
+    loader = SourceLoader(memory_budget_mb * 1024 * 1024, retain_dirs=(pages_dir, journals_dir))
+    with timings.phase("block-id scan"):
+        _scan_block_ids(source, scanner, loader, changes)
 
     # Initialize stats
     stats = ConversionStats()
 
-    converter = ObsidianConverter(scanner, stats, env=os.environ)
+    converter = ObsidianConverter(
+        scanner, stats, env=os.environ, date_formats=date_formats, parser_backend=parser_backend
+    )
+    converter.llm_generator.client.set_concurrency(llm_min_concurrency, llm_max_concurrency)
+    converter.llm_generator.client.batch_size = llm_batch_size
     if clear_llm_cache:
         converter.llm_generator.clear_cache()
 
+    journal_paths = _source_paths(journals_dir, changes)
+    page_paths = _source_paths(pages_dir, changes)
+
+    manifest = None
+    first_run = True
+    if incremental:
+        manifest = _load_manifest(destination, "obsidian", converter.llm_generator, date_formats)
+        first_run = not manifest.path.exists()
+        pending = _plan_incremental(
+            manifest, source, journal_paths + page_paths, destination, dry_run, scanner, changes
+        )
+        journal_paths = [p for p in pending if p.parent == journals_dir]
+        page_paths = [p for p in pending if p.parent == pages_dir]
+
     # Create destination directory
     if not destination.exists() and not dry_run:
         destination.mkdir(parents=True)
@@ -74,28 +139,39 @@ def convert_vault(
     # Copy assets
     assets_src = source / "assets"
     assets_dest = destination / "assets"
-    if assets_src.exists():
+    # Watch reruns only handle the reported pages and journals
+    if assets_src.exists() and changes is None:
         log_progress("Copying assets...")
-        if not dry_run:
-            copy_assets(assets_src, assets_dest)
+        with timings.phase("copy assets"):
+            if not dry_run:
+                copy_assets(assets_src, assets_dest, skip_unchanged=incremental)
 
         # Count assets
         stats.assets = sum(1 for _ in assets_src.glob("*") if _.is_file())
 
+    if manifest is not None and not dry_run and changes is None:
+        _remove_deleted_assets(manifest, source, destination)
+
     # Process files
     log_progress("Processing files...")
 
     # Process journals
-    _process_journals(journals_dir, destination, converter, verbose, dry_run)
+    outputs = _process_journals(journal_paths, loader, destination, converter, verbose, dry_run, jobs, timings)
 
     # Process pages
-    _process_pages(pages_dir, destination, converter, verbose, dry_run)
+    outputs.update(_process_pages(page_paths, loader, destination, converter, verbose, dry_run, jobs, timings))
+    loader.clear()
 
-    # Configure vault core settings and plugins
-    if not dry_run:
+    if manifest is not None and not dry_run:
+        _record_outputs(manifest, source, outputs, scanner)
+
+    # Configure vault core settings and plugins (once per vault in incremental mode)
+    if not dry_run and first_run:
         from logseq_converter.obsidian.configurator import configure_community_plugins, configure_core_vault
-        configure_core_vault(destination)
-        configure_community_plugins(destination)
+        with timings.phase("configure vault"):
+            configure_core_vault(destination)
+        with timings.phase("community plugins"):
+            configure_community_plugins(destination)
 
     log_progress("Conversion complete.")
 
@@ -110,110 +186,412 @@ def convert_vault(
     print(f"  Achievements: {stats.achievements}")
     print(f"  Highlights: {stats.highlights}")
 
+    if profile:
+        timings.print_report(profile_top)
+    if profile_json is not None:
+        timings.write_json(profile_json, profile_top)
+        log_progress(f"Profile written to '{profile_json}'.")
+
     return 0
 
 
-def _process_journals(
-    journals_dir: Path,
+def _scan_block_ids(
+    source: Path,
+    scanner: BlockReferenceScanner,
+    loader: SourceLoader,
+    changes: Optional[tuple[list[Path], list[Path]]] = None,
+) -> None:
+    """
+    Scans every markdown file of the graph for block IDs. Page and journal
+    text is read through the loader so the conversion pass can reuse it.
+    A persistent index only rescans files changed since its last run and is
+    saved afterwards. Given the (changed, removed) files reported by the
+    watcher, a persistent index only visits those instead of walking the graph.
+    """
+    if changes is not None and isinstance(scanner, PersistentBlockIndex):
+        changed, removed = changes
+        for file_path in changed:
+            _scan_file(scanner, loader, file_path)
+        scanner.forget(removed)
+        scanner.save()
+        log_progress(f"Block index: rescanned {scanner.rescanned} changed files.")
+        return
+
+    seen = []
+    for root, _, files in os.walk(source):
+        for file in files:
+            if file.endswith(".md"):
+                file_path = Path(root) / file
+                seen.append(file_path)
+                _scan_file(scanner, loader, file_path)
+
+    if isinstance(scanner, PersistentBlockIndex):
+        scanner.prune(seen)
+        scanner.save()
+        log_progress(f"Block index: rescanned {scanner.rescanned} of {len(seen)} files.")
+
+
+def _scan_file(scanner: BlockReferenceScanner, loader: SourceLoader, file_path: Path) -> None:
+    try:
+        if scanner.needs_scan(file_path):
+            scanner.scan_content(file_path, loader.load(file_path))
+    except (OSError, UnicodeDecodeError) as e:
+        log_warning(f"Error scanning {file_path.name} for block IDs: {e}")
+
+
+def _source_paths(directory: Path, changes: Optional[tuple[list[Path], list[Path]]]) -> list[Path]:
+    """The markdown files directly in a pages or journals directory, or only the changed ones."""
+    if changes is not None:
+        return sorted(p for p in changes[0] if p.parent == directory and p.suffix == ".md")
+    return sorted(directory.glob("*.md")) if directory.exists() else []
+
+
+def _read_source(file_path: Path, source: Optional[SourceText]) -> SourceText:
+    """Returns the file handed over by the loader, or reads it if it was not buffered."""
+    return source if source is not None else read_source_text(file_path)
+
+
+def _converted(source: SourceText, outputs: list[str]) -> ConvertedSource:
+    return ConvertedSource(source.state, outputs, BLOCK_REF_PATTERN.findall(source.content))
+
+
+def _validate_destination(destination: Path, incremental: bool) -> None:
+    """
+    A destination must be empty unless it holds the manifest of a previous
+    incremental run, in which case it is updated in place.
+    """
+    if incremental and (destination / MANIFEST_FILENAME).exists():
+        return
+    validate_output_directory(destination)
+
+
+def _load_manifest(
+    destination: Path, command: str, llm_generator, date_formats: Sequence[str]
+) -> ConversionManifest:
+    # The LLM provider and model decide the names of extracted files, so they are part of the options
+    options = {
+        "command": command,
+        "llm_provider": llm_generator.provider,
+        "llm_model": getattr(llm_generator.client, "model", None),
+        "date_formats": list(date_formats),
+    }
+    return ConversionManifest.load(destination, get_converter_version(), hash_options(options))
+
+
+def _plan_incremental(
+    manifest: ConversionManifest,
+    source: Path,
+    file_paths: list[Path],
     destination: Path,
+    dry_run: bool,
+    scanner: BlockReferenceScanner,
+    changes: Optional[tuple[list[Path], list[Path]]] = None,
+) -> list[Path]:
+    """
+    Compares the sources with the manifest, deletes the outputs of removed and
+    changed sources, and returns the files that need to be (re)converted, sorted:
+    new or changed files, and unchanged files whose block references now
+    resolve to another file (or no longer resolve). Given the (changed, removed)
+    files reported by the watcher, file_paths holds only the changed sources and
+    the rest of the tree is not compared.
+    """
+    sources = {file_path.relative_to(source).as_posix(): file_path for file_path in file_paths}
+    changed, removed = manifest.plan(sources)
+    if changes is not None:
+        reported = (file_path.relative_to(source).as_posix() for file_path in changes[1])
+        removed = sorted(rel for rel in reported if rel in manifest.entries)
+
+    stale_outputs = list(manifest.invalidated_outputs)
+    for rel in removed + changed:
+        stale_outputs.extend(manifest.forget(rel))
+    # Everything left in the manifest exists and is unchanged
+    referencing = manifest.stale_references(partial(_block_source, scanner, source))
+    for rel in referencing:
+        stale_outputs.extend(manifest.forget(rel))
+
+    log_progress(
+        f"Incremental: {len(changed)} new or changed, {len(removed)} removed, "
+        f"{len(manifest.entries) + len(referencing)} unchanged."
+    )
+    if referencing:
+        log_progress(
+            f"Incremental: {len(referencing)} unchanged files reference moved or removed blocks, reconverting them."
+        )
+    if not dry_run:
+        remove_outputs(destination, stale_outputs)
+
+    return sorted([sources[rel] for rel in changed] + [source / rel for rel in referencing])
+
+
+def _block_source(scanner: BlockReferenceScanner, source: Path, block_id: str) -> Optional[str]:
+    """Relative path of the source file defining a block, or None if the block is unknown."""
+    file_path = scanner.get_file_for_block(block_id)
+    return file_path.relative_to(source).as_posix() if file_path else None
+
+
+def _record_outputs(
+    manifest: ConversionManifest,
+    source: Path,
+    outputs: dict[Path, ConvertedSource],
+    scanner: BlockReferenceScanner,
+) -> None:
+    for file_path, converted in outputs.items():
+        references = {block_id: _block_source(scanner, source, block_id) for block_id in converted.block_refs}
+        manifest.record(file_path.relative_to(source).as_posix(), converted.state, converted.outputs, references)
+    manifest.save()
+
+
+def _remove_deleted_assets(manifest: ConversionManifest, source: Path, destination: Path) -> None:
+    """Records the assets of the source in the manifest and deletes the copies of assets that were removed."""
+    assets_src = source / "assets"
+    assets = []
+    if assets_src.exists():
+        assets = [
+            (Path("assets") / path.relative_to(assets_src)).as_posix()
+            for path in assets_src.rglob("*")
+            if path.is_file()
+        ]
+
+    removed = manifest.record_assets(assets)
+    if removed:
+        log_progress(f"Incremental: removing {len(removed)} deleted assets.")
+        remove_outputs(destination, removed)
+
+
+def _make_obsidian_worker(
+    scanner: BlockReferenceScanner, env: dict[str, str], date_formats: Sequence[str], parser_backend: str
+) -> ObsidianConverter:
+    """Builds the converter each worker process uses for the obsidian command."""
+    return ObsidianConverter(
+        scanner, ConversionStats(), env=env, date_formats=date_formats, parser_backend=parser_backend
+    )
+
+
+def _collect_stats(converter: ObsidianConverter, func, *args):
+    """
+    Runs func against the converter with a fresh ConversionStats and returns
+    (result, stats, seconds) so per-file counters and timings can be merged by
+    the caller in both serial and worker-process mode.
+    """
+    previous_stats = converter.stats
+    converter.stats = ConversionStats()
+    try:
+        start = time.perf_counter()
+        result = func(*args)
+        return result, converter.stats, time.perf_counter() - start
+    finally:
+        converter.stats = previous_stats
+
+
+def _convert_journal_file(
     converter: ObsidianConverter,
+    file_path: Path,
+    source: Optional[SourceText],
+    destination: Path,
     verbose: bool,
     dry_run: bool,
-) -> None:
-    if not journals_dir.exists():
-        return
+) -> Optional[tuple[ConvertedSource, list[tuple[str, str]]]]:
+    """
+    Converts and writes a single journal. Returns the converted source with its
+    written outputs (relative to the destination) and the extracted section
+    files, which are resolved and written later by the caller. Returns None if
+    the journal failed to convert.
+    """
+    try:
+        if verbose:
+            log_progress(f"Processing journal: {file_path.name}")
+        source = _read_source(file_path, source)
+        dest_rel_path = converter.transform_journal_filename(file_path.name)
+        if not dest_rel_path:
+            log_warning(f"Skipping unrecognized journal file: {file_path.name}")
+            return _converted(source, []), []
+
+        dest_path = destination / dest_rel_path
+        if not dry_run:
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-    all_extracted_files = []
+        content = trim_empty_bullets(source.content)
 
-    for file_path in journals_dir.glob("*.md"):
-        try:
-            if verbose:
-                log_progress(f"Processing journal: {file_path.name}")
-            dest_rel_path = converter.transform_journal_filename(file_path.name)
-            if dest_rel_path:
-                dest_path = destination / dest_rel_path
-                if not dry_run:
-                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                content = trim_empty_bullets(content)
-
-                # Extract sections (US3)
-                content, extracted_files = converter.extract_sections(content, file_path.name)
-
-                # Collect extracted files for batch processing later
-                all_extracted_files.extend(extracted_files)
-
-                converted_content = converter.convert_content(content)
-
-                # Skip writing journal file if it's empty after extraction
-                if not is_markdown_empty(converted_content):
-                    if not dry_run:
-                        with open(dest_path, "w", encoding="utf-8") as f:
-                            f.write(converted_content)
-                    converter.stats.journals += 1
-                elif verbose:
-                    log_progress(f"Skipping empty journal after extraction: {file_path.name}")
-            else:
-                log_warning(f"Skipping unrecognized journal file: {file_path.name}")
-        except Exception as e:
-            log_warning(f"Error processing journal {file_path.name}: {e}")
-            continue
+        # Extract sections (US3)
+        content, extracted_files = converter.extract_sections(content, file_path.name)
 
-    # Resolve all placeholder filenames in batch
-    resolved_files = converter.llm_generator.resolve_placeholders(all_extracted_files)
+        converted_content = converter.convert_content(content)
 
-    from logseq_converter.utils import handle_filename_collision
+        # Skip writing journal file if it's empty after extraction
+        if not is_markdown_empty(converted_content):
+            if not dry_run:
+                with open(dest_path, "w", encoding="utf-8") as f:
+                    f.write(converted_content)
+            converter.stats.journals += 1
+            return _converted(source, [dest_rel_path]), extracted_files
 
-    # Save resolved files
-    for filename, file_content in resolved_files:
-        extracted_path = destination / filename
-        extracted_path = handle_filename_collision(extracted_path)
+        if verbose:
+            log_progress(f"Skipping empty journal after extraction: {file_path.name}")
+        return _converted(source, []), extracted_files
+    except Exception as e:
+        log_warning(f"Error processing journal {file_path.name}: {e}")
+        return None
+
+
+def _journal_task(converter: ObsidianConverter, item: tuple):
+    # Filename cache lookups made in a worker are recorded by the main process's cache
+    result, file_stats, seconds = _collect_stats(converter, _convert_journal_file, converter, *item)
+    return result, file_stats, seconds, converter.llm_generator.cache.take_updates()
+
+
+def _convert_page_file(
+    converter: ObsidianConverter,
+    file_path: Path,
+    source: Optional[SourceText],
+    destination: Path,
+    verbose: bool,
+    dry_run: bool,
+) -> Optional[ConvertedSource]:
+    """
+    Converts and writes a single page. Returns the converted source with its
+    written outputs (relative to the destination), or None if the page failed
+    to convert.
+    """
+    try:
+        if verbose:
+            log_progress(f"Processing page: {file_path.name}")
+        source = _read_source(file_path, source)
+        dest_rel_path = converter.transform_page_filename(file_path.name)
+        dest_path = destination / dest_rel_path
         if not dry_run:
-            extracted_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(extracted_path, "w", encoding="utf-8") as f:
-                f.write(file_content)
+            dest_path.parent.mkdir(parents=True, exist_ok=True)
 
+        content = trim_empty_bullets(source.content)
 
+        converted_content = converter.convert_content(content)
 
-def _process_pages(
-    pages_dir: Path,
+        if not dry_run:
+            with open(dest_path, "w", encoding="utf-8") as f:
+                f.write(converted_content)
+        converter.stats.pages += 1
+        return _converted(source, [dest_rel_path])
+    except Exception as e:
+        log_warning(f"Error processing page {file_path.name}: {e}")
+        return None
+
+
+def _page_task(converter: ObsidianConverter, item: tuple):
+    return _collect_stats(converter, _convert_page_file, converter, *item)
+
+
+def _map_obsidian_files(task, items: list[tuple], converter: ObsidianConverter, jobs: int):
+    """
+    Runs a per-file task serially or in a process pool. Results are yielded in
+    the order of items either way.
+    """
+    if jobs > 1 and len(items) > 1:
+        # Workers rebuild their own converter; only the scanner and env are shipped over
+        worker_args = (
+            converter.scanner,
+            dict(converter.llm_generator.env),
+            converter.date_links.formats,
+            converter.parser.backend,
+        )
+        yield from map_in_workers(task, items, jobs, _make_obsidian_worker, worker_args)
+    else:
+        for item in items:
+            yield task(converter, item)
+
+
+def _process_journals(
+    file_paths: list[Path],
+    loader: SourceLoader,
     destination: Path,
     converter: ObsidianConverter,
     verbose: bool,
     dry_run: bool,
-) -> None:
-    if not pages_dir.exists():
-        return
-
-    for file_path in pages_dir.glob("*.md"):
-        try:
-            if verbose:
-                log_progress(f"Processing page: {file_path.name}")
-            dest_rel_path = converter.transform_page_filename(file_path.name)
-            dest_path = destination / dest_rel_path
-            if not dry_run:
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
+    jobs: int = 1,
+    timings: Optional[ConversionProfile] = None,
+) -> dict[Path, ConvertedSource]:
+    """
+    Converts the given journals and writes their extracted section files.
+    Returns each successfully converted journal with the outputs written for it.
+    """
+    timings = timings or ConversionProfile()
+    outputs: dict[Path, ConvertedSource] = {}
+    all_extracted_files = []
+    extracted_owners = []
+
+    # Callers pass sorted paths so extracted files (and their collision suffixes) are deterministic
+    items = [(file_path, loader.take(file_path), destination, verbose, dry_run) for file_path in file_paths]
+    with timings.phase("journals"):
+        results = _map_obsidian_files(_journal_task, items, converter, jobs)
+        for file_path, (result, file_stats, seconds, cache_updates) in zip(file_paths, results, strict=True):
+            converter.stats.merge(file_stats)
+            converter.llm_generator.cache.add_updates(cache_updates)
+            timings.record_file(str(file_path), seconds)
+            if result is None:
+                continue
+            converted, extracted_files = result
+            outputs[file_path] = converted
 
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            # Collect extracted files for batch processing later
+            all_extracted_files.extend(extracted_files)
+            extracted_owners.extend([file_path] * len(extracted_files))
 
-            content = trim_empty_bullets(content)
+    # Resolve all placeholder filenames in batch
+    with timings.phase("llm resolution"):
+        resolved_files = converter.llm_generator.resolve_placeholders(all_extracted_files)
 
-            converted_content = converter.convert_content(content)
+    from logseq_converter.utils import handle_filename_collision
 
+    # Save resolved files
+    with timings.phase("extracted files"):
+        for owner, (filename, file_content) in zip(extracted_owners, resolved_files, strict=True):
+            extracted_path = destination / filename
+            extracted_path = handle_filename_collision(extracted_path)
             if not dry_run:
-                with open(dest_path, "w", encoding="utf-8") as f:
-                    f.write(converted_content)
-            converter.stats.pages += 1
-        except Exception as e:
-            log_warning(f"Error processing page {file_path.name}: {e}")
-            continue
+                extracted_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(extracted_path, "w", encoding="utf-8") as f:
+                    f.write(file_content)
+            outputs[owner].outputs.append(extracted_path.relative_to(destination).as_posix())
+
+    return outputs
 
 
-def convert_to_tana(source: Path, destination: Path, verbose: bool, force: bool, dry_run: bool = False) -> int:
+def _process_pages(
+    file_paths: list[Path],
+    loader: SourceLoader,
+    destination: Path,
+    converter: ObsidianConverter,
+    verbose: bool,
+    dry_run: bool,
+    jobs: int = 1,
+    timings: Optional[ConversionProfile] = None,
+) -> dict[Path, ConvertedSource]:
+    """Converts the given pages. Returns each successfully converted page with the outputs written for it."""
+    timings = timings or ConversionProfile()
+    outputs: dict[Path, ConvertedSource] = {}
+
+    items = [(file_path, loader.take(file_path), destination, verbose, dry_run) for file_path in file_paths]
+    with timings.phase("pages"):
+        results = _map_obsidian_files(_page_task, items, converter, jobs)
+        for file_path, (result, file_stats, seconds) in zip(file_paths, results, strict=True):
+            converter.stats.merge(file_stats)
+            timings.record_file(str(file_path), seconds)
+            if result is not None:
+                outputs[file_path] = result
+
+    return outputs
+
+
+def convert_to_tana(
+    source: Path,
+    destination: Path,
+    verbose: bool,
+    force: bool,
+    dry_run: bool = False,
+    parser_backend: str = DEFAULT_PARSER_BACKEND,
+    parse_cache: bool = True,
+    parse_cache_mb: int = DEFAULT_PARSE_CACHE_MB,
+    stream_threshold_mb: int = DEFAULT_STREAM_THRESHOLD_MB,
+    jobs: int = 1,
+) -> int:
     try:
         validate_logseq_source(source)
     except (FileNotFoundError, NotADirectoryError, ValueError) as e:
@@ -234,62 +612,120 @@ def convert_to_tana(source: Path, destination: Path, verbose: bool, force: bool,
     if not dry_run:
         destination.parent.mkdir(parents=True, exist_ok=True)
 
-    parser = LogSeqParser()
-    converter = TanaConverter()
-    all_nodes = []
-
-    # Process pages
-    pages_dir = source / "pages"
-    if pages_dir.exists():
-        for file_path in pages_dir.glob("*.md"):
-            try:
-                if verbose:
-                    log_progress(f"Processing page: {file_path.name}")
-
-                page = parser.parse(file_path)
-                if not page:
-                    continue
-
-                tana_node = converter.convert_page(page)
-                all_nodes.append(tana_node)
+    from logseq_converter.tana.writer import TanaStreamWriter
 
-            except Exception as e:
-                log_warning(f"Error processing page {file_path.name}: {e}")
-
-    # Process journals
-    journals_dir = source / "journals"
-    if journals_dir.exists():
-        for file_path in journals_dir.glob("*.md"):
-            try:
-                if verbose:
-                    log_progress(f"Processing journal: {file_path.name}")
-
-                journal = parser.parse(file_path)
-                if not journal:
-                    continue
+    cache = open_parse_cache(parse_cache_mb) if parse_cache else None
+    parser = LogSeqParser(parser_backend, cache)
+    converter = TanaConverter()
 
-                tana_node = converter.convert_page(journal)
-                all_nodes.append(tana_node)
+    # Nodes are streamed to a temporary file and moved into place once complete
+    tmp_path = destination.with_name(destination.name + ".tmp")
+    stream = None if dry_run else open(tmp_path, "w", encoding="utf-8")
+    writer = TanaStreamWriter(stream)
 
-            except Exception as e:
-                log_warning(f"Error processing journal {file_path.name}: {e}")
+    finished = False
+    try:
+        files = _source_files(source)
+        streamed = {file_path for _, file_path in files if _should_stream(file_path, stream_threshold_mb)}
+        items = [(kind, file_path, verbose) for kind, file_path in files if file_path not in streamed]
+        worker_results = _map_parse_workers(_tana_task, items, jobs, TanaConverter, parser)
+
+        for kind, file_path in files:
+            # Writing is part of converting a file, so a page that fails to encode is skipped like any other
+            if file_path in streamed:
+                stream_file = partial(_stream_tana_file, writer)
+                _convert_source_file(stream_file, parser, converter, kind, file_path, verbose)
+            elif worker_results is not None:
+                records, supertags, cache_updates = next(worker_results)
+                # Merged in file order, so the registry matches a serial run
+                converter.merge_supertags(supertags)
+                _add_parse_cache_updates(cache, cache_updates)
+                if records:
+                    write_records = partial(_write_tana_records, writer, records)
+                    _convert_source_file(write_records, parser, converter, kind, file_path, verbose=False)
+            else:
+                write_file = partial(_write_tana_file, writer)
+                _convert_source_file(write_file, parser, converter, kind, file_path, verbose)
+
+        writer.close(list(converter.supertags.values()))
+        finished = True
+    finally:
+        if stream is not None:
+            stream.close()
+            if not finished:
+                tmp_path.unlink(missing_ok=True)
+        _close_parse_cache(cache, verbose)
 
     # Create single Tana file
-    if all_nodes:
-        tana_file = converter.create_tana_file_from_nodes(all_nodes)
-
+    if writer.top_level_nodes:
         if not dry_run:
             log_progress(f"Writing output to {destination}...")
-            with open(destination, "w", encoding="utf-8") as f:
-                json.dump(dataclasses.asdict(tana_file), f, indent=2)
+            os.replace(tmp_path, destination)
     else:
+        if not dry_run:
+            tmp_path.unlink()
         log_warning("No content found to convert.")
 
     log_progress("Conversion complete.")
     return 0
 
 
-def convert_to_blinko(source: Path, endpoint: str, verbose: bool, dry_run: bool = False) -> int:
+def _convert_tana_file(
+    parser: LogSeqParser, converter: TanaConverter, file_path: Path
+) -> Optional[TanaIntermediateNode]:
+    page = parser.parse(file_path)
+    return converter.convert_page(page) if page else None
+
+
+def _write_tana_file(
+    writer: "TanaStreamWriter", parser: LogSeqParser, converter: TanaConverter, file_path: Path
+) -> None:
+    node = _convert_tana_file(parser, converter, file_path)
+    if node is not None:
+        writer.write_node(node)
+
+
+def _write_tana_records(
+    writer: "TanaStreamWriter", records: list, parser: LogSeqParser, converter: TanaConverter, file_path: Path
+) -> None:
+    """Writes the node a worker converted and flattened with flatten_tree."""
+    writer.write_node(unflatten_tree(records)[0])
+
+
+def _stream_tana_file(
+    writer: "TanaStreamWriter", parser: LogSeqParser, converter: TanaConverter, file_path: Path
+) -> None:
+    parsed = parser.parse_streaming(file_path)
+    if parsed:
+        # A failed page is taken back out of the output, as if it was never written
+        page, blocks = parsed
+        writer.write_streamed_node(converter.convert_page_node(page), converter.convert_blocks(blocks))
+
+
+def _tana_task(state: tuple[LogSeqParser, TanaConverter], item: tuple):
+    """
+    Converts one file in a worker process. Returns the node flattened with
+    flatten_tree (so deep outlines pickle), or None, together with the
+    supertags registered for the file and the parse cache updates.
+    """
+    parser, converter = state
+    converter.supertags = {}
+    node = _convert_source_file(_convert_tana_file, parser, converter, *item)
+    records = flatten_tree([node]) if node is not None else None
+    return records, converter.supertags, _take_parse_cache_updates(parser)
+
+
+def convert_to_blinko(
+    source: Path,
+    endpoint: str,
+    verbose: bool,
+    dry_run: bool = False,
+    parser_backend: str = DEFAULT_PARSER_BACKEND,
+    parse_cache: bool = True,
+    parse_cache_mb: int = DEFAULT_PARSE_CACHE_MB,
+    stream_threshold_mb: int = DEFAULT_STREAM_THRESHOLD_MB,
+    jobs: int = 1,
+) -> int:
     try:
         validate_logseq_source(source)
     except (FileNotFoundError, NotADirectoryError, ValueError) as e:
@@ -312,52 +748,158 @@ def convert_to_blinko(source: Path, endpoint: str, verbose: bool, dry_run: bool
 
     log_progress(f"Converting '{source}' to Blinko at '{endpoint}'...")
 
-    parser = LogSeqParser()
+    cache = open_parse_cache(parse_cache_mb) if parse_cache else None
+    parser = LogSeqParser(parser_backend, cache)
     converter = BlinkoConverter()
 
-    # Process pages
-    pages_dir = source / "pages"
-    if pages_dir.exists():
-        for file_path in pages_dir.glob("*.md"):
-            try:
-                if verbose:
-                    log_progress(f"Processing page: {file_path.name}")
+    try:
+        _send_to_blinko(source, parser, converter, client, verbose, dry_run, stream_threshold_mb, jobs)
+    finally:
+        _close_parse_cache(cache, verbose)
 
-                page = parser.parse(file_path)
-                if not page:
-                    continue
+    log_progress("Conversion complete.")
+    return 0
 
-                content = converter.convert_page(page)
 
-                if not dry_run:
-                    client.upsert_note(content)
-                    time.sleep(0.1)  # rate limiting courtesy
+def _send_to_blinko(
+    source: Path,
+    parser: LogSeqParser,
+    converter: BlinkoConverter,
+    client: BlinkoClient,
+    verbose: bool,
+    dry_run: bool,
+    stream_threshold_mb: int,
+    jobs: int,
+) -> None:
+    files = _source_files(source)
+    streamed = {file_path for _, file_path in files if _should_stream(file_path, stream_threshold_mb)}
+    items = [(kind, file_path, verbose) for kind, file_path in files if file_path not in streamed]
+    worker_results = _map_parse_workers(_blinko_task, items, jobs, BlinkoConverter, parser)
+
+    for kind, file_path in files:
+        if file_path in streamed:
+            content = _convert_source_file(_stream_blinko_file, parser, converter, kind, file_path, verbose)
+        elif worker_results is not None:
+            content, cache_updates = next(worker_results)
+            _add_parse_cache_updates(parser.cache, cache_updates)
+        else:
+            content = _convert_source_file(_convert_blinko_file, parser, converter, kind, file_path, verbose)
+
+        if content is None or dry_run:
+            continue
+        try:
+            client.upsert_note(content)
+            time.sleep(0.1)  # rate limiting courtesy
+        except Exception as e:
+            log_warning(f"Error processing {kind} {file_path.name}: {e}")
 
-            except Exception as e:
-                log_warning(f"Error processing page {file_path.name}: {e}")
 
-    # Process journals
-    journals_dir = source / "journals"
-    if journals_dir.exists():
-        for file_path in journals_dir.glob("*.md"):
-            try:
-                if verbose:
-                    log_progress(f"Processing journal: {file_path.name}")
+def _convert_blinko_file(parser: LogSeqParser, converter: BlinkoConverter, file_path: Path) -> Optional[str]:
+    page = parser.parse(file_path)
+    return converter.convert_page(page) if page else None
 
-                journal = parser.parse(file_path)
-                if not journal:
-                    continue
 
-                content = converter.convert_page(journal)
+def _stream_blinko_file(parser: LogSeqParser, converter: BlinkoConverter, file_path: Path) -> Optional[str]:
+    parsed = parser.parse_streaming(file_path)
+    # The note is still sent whole, but the page's block tree is never held at once
+    return converter.convert_page(*parsed) if parsed else None
 
-                if not dry_run:
-                    client.upsert_note(content)
-                    time.sleep(0.1)
 
-            except Exception as e:
-                log_warning(f"Error processing journal {file_path.name}: {e}")
+def _blinko_task(state: tuple[LogSeqParser, BlinkoConverter], item: tuple):
+    """Converts one file in a worker process. Returns the note, or None, and the parse cache updates."""
+    parser, converter = state
+    content = _convert_source_file(_convert_blinko_file, parser, converter, *item)
+    return content, _take_parse_cache_updates(parser)
 
-    log_progress("Conversion complete.")
+
+def _source_files(source: Path) -> list[tuple[str, Path]]:
+    """The graph's pages, then its journals, as (kind, path)."""
+    files = []
+    for kind, directory in (("page", source / "pages"), ("journal", source / "journals")):
+        if directory.exists():
+            files.extend((kind, file_path) for file_path in directory.glob("*.md"))
+    return files
+
+
+def _convert_source_file(convert, parser: LogSeqParser, converter, kind: str, file_path: Path, verbose: bool):
+    """Returns convert(parser, converter, file_path), or None after logging a warning if it fails."""
+    try:
+        if verbose:
+            log_progress(f"Processing {kind}: {file_path.name}")
+        return convert(parser, converter, file_path)
+    except Exception as e:
+        log_warning(f"Error processing {kind} {file_path.name}: {e}")
+        return None
+
+
+def _make_parse_worker(converter_class, parser_backend: str, cache_path: Optional[Path]) -> tuple:
+    """
+    Builds the parser and converter each worker process uses for the tana and
+    blinko commands. A worker's parse cache is only read; the trees it parses
+    are handed back with each result and saved by the main process.
+    """
+    cache = ParseCache(cache_path, 0) if cache_path is not None else None
+    return LogSeqParser(parser_backend, cache), converter_class()
+
+
+def _map_parse_workers(task, items: list[tuple], jobs: int, converter_class, parser: LogSeqParser):
+    """
+    Runs task for every item in a pool of jobs worker processes, yielding the
+    results in the order of items. Returns None when the files are better
+    converted serially in this process.
+    """
+    if jobs <= 1 or len(items) <= 1:
+        return None
+    cache_path = parser.cache.db_path if parser.cache is not None else None
+    return map_in_workers(task, items, jobs, _make_parse_worker, (converter_class, parser.backend, cache_path))
+
+
+def _take_parse_cache_updates(parser: LogSeqParser) -> Optional[ParseCacheUpdates]:
+    return parser.cache.take_updates() if parser.cache is not None else None
+
+
+def _add_parse_cache_updates(cache: Optional[ParseCache], updates: Optional[ParseCacheUpdates]) -> None:
+    if cache is not None and updates is not None:
+        cache.add_updates(updates)
+
+
+def _should_stream(file_path: Path, stream_threshold_mb: int) -> bool:
+    return file_path.stat().st_size >= stream_threshold_mb * 1024 * 1024
+
+
+def _close_parse_cache(cache: Optional[ParseCache], verbose: bool) -> None:
+    """Saves the parse cache, if one was used."""
+    if cache is None:
+        return
+    cache.close()
+    if verbose:
+        log_progress(f"Parse cache: {cache.hits} file(s) reused, {cache.misses} parsed")
+
+
+def show_cache_stats() -> int:
+    """Prints the size, hit rate and per-model entries of the LLM filename cache."""
+    db_path = filename_cache_path(os.environ)
+    namespaces = read_stats(db_path)
+    if not namespaces:
+        print(f"LLM filename cache '{db_path}' is empty.")
+        return 0
+
+    size = sum(path.stat().st_size for path in db_path.parent.glob(f"{db_path.name}*"))
+    total = NamespaceStats(
+        "all",
+        sum(n.entries for n in namespaces),
+        sum(n.hits for n in namespaces),
+        sum(n.fallback_hits for n in namespaces),
+        sum(n.misses for n in namespaces),
+    )
+    print(f"LLM filename cache: {db_path}")
+    print(f"  Size: {size / 1024:.1f} KiB")
+    for stats in [*namespaces, total]:
+        hit_rate = f"{stats.hit_rate:.1%}" if stats.hit_rate is not None else "n/a"
+        print(
+            f"  {stats.namespace}: {stats.entries} name(s), hit rate {hit_rate} "
+            f"({stats.hits} hit(s), {stats.fallback_hits} from other models, {stats.misses} miss(es))"
+        )
     return 0
 
 
@@ -541,6 +1083,15 @@ def convert_to_tolaria(
     verbose: bool,
     dry_run: bool = False,
     clear_llm_cache: bool = False,
+    incremental: bool = False,
+    memory_budget_mb: int = DEFAULT_MEMORY_BUDGET_MB,
+    block_index: bool = True,
+    date_formats: Sequence[str] = DEFAULT_DATE_LINK_FORMATS,
+    parser_backend: str = DEFAULT_PARSER_BACKEND,
+    llm_min_concurrency: Optional[int] = None,
+    llm_max_concurrency: Optional[int] = None,
+    llm_batch_size: int = 1,
+    changes: Optional[tuple[list[Path], list[Path]]] = None,
 ) -> int:
     try:
         validate_logseq_source(source)
@@ -549,7 +1100,7 @@ def convert_to_tolaria(
         return 1
 
     try:
-        validate_output_directory(destination)
+        _validate_destination(destination, incremental)
     except FileExistsError as e:
         log_warning(str(e))
         return 1
@@ -559,60 +1110,56 @@ def convert_to_tolaria(
 
     log_progress(f"Converting '{source}' to '{destination}' (Tolaria format)...")
 
-    # Pass 1: Scan for block IDs
+    pages_dir = source / "pages"
+    journals_dir = source / "journals"
+
+    # Pass 1: Scan for block IDs, keeping page and journal text for the conversion pass
     log_progress("Scanning for block IDs...")
-    scanner = BlockReferenceScanner()
+    scanner = open_block_index(source) if block_index else BlockReferenceScanner()
+    loader = SourceLoader(memory_budget_mb * 1024 * 1024, retain_dirs=(pages_dir, journals_dir))
+    _scan_block_ids(source, scanner, loader, changes)
 
-    # Walk source to scan
-    for root, _, files in os.walk(source):
-        for file in files:
-            if file.endswith(".md"):
-                scanner.scan_file(Path(root) / file)
+    from logseq_converter.tolaria.converter import TolariaConverter
+
+    converter = TolariaConverter(
+        scanner=scanner, env=os.environ, date_formats=date_formats, parser_backend=parser_backend
+    )
+    converter.llm_generator.client.set_concurrency(llm_min_concurrency, llm_max_concurrency)
+    converter.llm_generator.client.batch_size = llm_batch_size
+    if clear_llm_cache:
+        converter.llm_generator.clear_cache()
+
+    page_paths = _source_paths(pages_dir, changes)
+    journal_paths = _source_paths(journals_dir, changes)
+
+    manifest = None
+    if incremental:
+        manifest = _load_manifest(destination, "tolaria", converter.llm_generator, date_formats)
+        pending = _plan_incremental(
+            manifest, source, page_paths + journal_paths, destination, dry_run, scanner, changes
+        )
+        page_paths = [p for p in pending if p.parent == pages_dir]
+        journal_paths = [p for p in pending if p.parent == journals_dir]
 
     # Create destination directory
     if not destination.exists() and not dry_run:
         destination.mkdir(parents=True)
 
+    log_progress("Processing files...")
 
-    from logseq_converter.tolaria.converter import TolariaConverter
-    
-    converter = TolariaConverter(scanner=scanner, env=os.environ)
-    if clear_llm_cache:
-        converter.llm_generator.clear_cache()
-    
+    outputs: dict[Path, ConvertedSource] = {}
     stats_pages = 0
     stats_journals = 0
 
     # Process pages
-    pages_dir = source / "pages"
-    if pages_dir.exists():
-        for file_path in pages_dir.glob("*.md"):
-            if converter.should_ignore(file_path.name):
-                if verbose:
-                    log_progress(f"Ignoring page: {file_path.name}")
-                continue
-                
-            try:
-                if verbose:
-                    log_progress(f"Processing page: {file_path.name}")
-                
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                content = trim_empty_bullets(content)
-
-                final_name, final_content = converter.process_metadata(file_path.name, content)
-                dest_path = destination / final_name
-                
-                if not dry_run:
-                    with open(dest_path, "w", encoding="utf-8") as f:
-                        f.write(final_content)
-                stats_pages += 1
-            except Exception as e:
-                log_warning(f"Error processing page {file_path.name}: {e}")
+    for file_path in page_paths:
+        source_text = loader.take(file_path)
+        converted = _convert_tolaria_page_file(converter, file_path, source_text, destination, verbose, dry_run)
+        if converted is not None:
+            outputs[file_path] = converted
+            stats_pages += len(converted.outputs)
 
     # Process journals
-    journals_dir = source / "journals"
     if journals_dir.exists():
         # Tolaria expects journals in a 'journal' directory (lowercase, singular)
         journals_dest = destination / "journal"
@@ -620,51 +1167,20 @@ def convert_to_tolaria(
             journals_dest.mkdir(parents=True, exist_ok=True)
 
         all_extracted_files = []
+        extracted_owners = []
 
-        for file_path in journals_dir.glob("*.md"):
-            try:
-                if verbose:
-                    log_progress(f"Processing journal: {file_path.name}")
-
-                dest_name = converter.transform_journal_filename(file_path.name)
-
-                with open(file_path, "r", encoding="utf-8") as f:
-                    content = f.read()
-
-                content = trim_empty_bullets(content)
-
-                remaining_content, properties = converter.extract_and_remove_frontmatter(content)
-                properties["type"] = "Journal"
-
-                # Extract sections (learnings, achievements, highlights, links)
-                remaining_content, extracted_files = converter.extract_sections(remaining_content, file_path.name)
-
-                # Collect extracted files for batch processing later
-                all_extracted_files.extend(extracted_files)
-
-                # Skip writing journal file if it's empty after extraction
-                if not is_markdown_empty(remaining_content):
-                    transformed_body = converter.convert_content(remaining_content)
-
-                    frontmatter = []
-                    frontmatter.append("---")
-                    for k, v in properties.items():
-                        frontmatter.append(f"{k}: {v}")
-                    frontmatter.append("---")
-
-                    final_content = "\n".join(frontmatter) + "\n\n" + transformed_body.strip()
-                    final_content = trim_empty_bullets(final_content)
-
-                    dest_path = journals_dest / dest_name
-                    if not dry_run:
-                        with open(dest_path, "w", encoding="utf-8") as f:
-                            f.write(final_content)
-                    stats_journals += 1
-                elif verbose:
-                    log_progress(f"Skipping empty journal after extraction: {file_path.name}")
+        for file_path in journal_paths:
+            source_text = loader.take(file_path)
+            result = _convert_tolaria_journal_file(converter, file_path, source_text, destination, verbose, dry_run)
+            if result is None:
+                continue
+            converted, extracted_files = result
+            outputs[file_path] = converted
+            stats_journals += len(converted.outputs)
 
-            except Exception as e:
-                log_warning(f"Error processing journal {file_path.name}: {e}")
+            # Collect extracted files for batch processing later
+            all_extracted_files.extend(extracted_files)
+            extracted_owners.extend([file_path] * len(extracted_files))
 
         # Resolve all placeholder filenames in batch
         resolved_files = converter.llm_generator.resolve_placeholders(all_extracted_files)
@@ -672,14 +1188,20 @@ def convert_to_tolaria(
         from logseq_converter.utils import handle_filename_collision
 
         # Save resolved files directly in the root destination directory
-        for filename, file_content in resolved_files:
+        for owner, (filename, file_content) in zip(extracted_owners, resolved_files, strict=True):
             extracted_path = destination / filename
             extracted_path = handle_filename_collision(extracted_path)
             if not dry_run:
                 with open(extracted_path, "w", encoding="utf-8") as f:
                     f.write(file_content)
+            outputs[owner].outputs.append(extracted_path.relative_to(destination).as_posix())
             stats_pages += 1
 
+    loader.clear()
+
+    if manifest is not None and not dry_run:
+        _record_outputs(manifest, source, outputs, scanner)
+
     # Create Tolaria metadata types
     create_tolaria_types(destination, dry_run)
 
@@ -692,10 +1214,186 @@ def convert_to_tolaria(
     print(f"  Learnings: {converter.stats_learnings}")
     print(f"  Achievements: {converter.stats_achievements}")
     print(f"  Highlights: {converter.stats_highlights}")
-    
+
+    return 0
+
+
+def _convert_tolaria_page_file(
+    converter, file_path: Path, source: Optional[SourceText], destination: Path, verbose: bool, dry_run: bool
+) -> Optional[ConvertedSource]:
+    """
+    Converts and writes a single page in Tolaria format. Returns the converted
+    source with its written outputs (none for ignored pages), or None if the
+    page failed to convert.
+    """
+    try:
+        source = _read_source(file_path, source)
+        if converter.should_ignore(file_path.name):
+            if verbose:
+                log_progress(f"Ignoring page: {file_path.name}")
+            return _converted(source, [])
+
+        if verbose:
+            log_progress(f"Processing page: {file_path.name}")
+
+        content = trim_empty_bullets(source.content)
+
+        final_name, final_content = converter.process_metadata(file_path.name, content)
+        dest_path = destination / final_name
+
+        if not dry_run:
+            with open(dest_path, "w", encoding="utf-8") as f:
+                f.write(final_content)
+        return _converted(source, [final_name])
+    except Exception as e:
+        log_warning(f"Error processing page {file_path.name}: {e}")
+        return None
+
+
+def _convert_tolaria_journal_file(
+    converter, file_path: Path, source: Optional[SourceText], destination: Path, verbose: bool, dry_run: bool
+) -> Optional[tuple[ConvertedSource, list[tuple[str, str]]]]:
+    """
+    Converts and writes a single journal in Tolaria format. Returns the
+    converted source with its written outputs and the extracted section files,
+    or None if the journal failed.
+    """
+    try:
+        if verbose:
+            log_progress(f"Processing journal: {file_path.name}")
+
+        dest_name = converter.transform_journal_filename(file_path.name)
+
+        source = _read_source(file_path, source)
+        content = trim_empty_bullets(source.content)
+
+        remaining_content, properties = converter.extract_and_remove_frontmatter(content)
+        properties["type"] = "Journal"
+
+        # Extract sections (learnings, achievements, highlights, links)
+        remaining_content, extracted_files = converter.extract_sections(remaining_content, file_path.name)
+
+        # Skip writing journal file if it's empty after extraction
+        if is_markdown_empty(remaining_content):
+            if verbose:
+                log_progress(f"Skipping empty journal after extraction: {file_path.name}")
+            return _converted(source, []), extracted_files
+
+        transformed_body = converter.convert_content(remaining_content)
+
+        frontmatter = []
+        frontmatter.append("---")
+        for k, v in properties.items():
+            frontmatter.append(f"{k}: {v}")
+        frontmatter.append("---")
+
+        final_content = "\n".join(frontmatter) + "\n\n" + transformed_body.strip()
+        final_content = trim_empty_bullets(final_content)
+
+        dest_path = destination / "journal" / dest_name
+        if not dry_run:
+            with open(dest_path, "w", encoding="utf-8") as f:
+                f.write(final_content)
+        return _converted(source, [f"journal/{dest_name}"]), extracted_files
+    except Exception as e:
+        log_warning(f"Error processing journal {file_path.name}: {e}")
+        return None
+
+
+def watch_and_convert(source: Path, convert: Callable[..., int]) -> int:
+    """
+    Runs an incremental conversion, then reruns it whenever a page or journal
+    is added, edited or removed, including while the first conversion runs.
+    Each rerun is handed the changed and removed files, so it only converts
+    those (and pages referencing their blocks) without rescanning the graph,
+    and a changed journal re-emits its extracted files. A failing rerun is
+    logged and watching continues. Stops on Ctrl+C.
+
+    convert must accept clear_llm_cache and changes keywords; the LLM cache is
+    only cleared (if requested) by the first conversion.
+    """
+    from logseq_converter.watch import snapshot_markdown_files, watch_files
+
+    directories = [source / "pages", source / "journals"]
+    # Taken before converting, so files saved during the first conversion trigger a rerun
+    snapshot = snapshot_markdown_files(directories)
+    result = convert()
+    if result != 0:
+        return result
+
+    def on_change(changed: list[Path], removed: list[Path]) -> None:
+        log_progress(f"Detected {len(changed)} changed and {len(removed)} removed files, reconverting...")
+        try:
+            convert(clear_llm_cache=False, changes=(changed, removed))
+        except Exception as e:
+            log_warning(f"Reconversion failed, still watching: {e}")
+
+    log_progress(f"Watching '{source}' for changes (press Ctrl+C to stop)...")
+    try:
+        watch_files(directories, on_change, snapshot=snapshot)
+    except KeyboardInterrupt:
+        log_progress("Stopped watching.")
     return 0
 
 
+def _add_parser_argument(subparser: argparse.ArgumentParser) -> None:
+    subparser.add_argument(
+        "--parser",
+        choices=PARSER_BACKENDS,
+        default=DEFAULT_PARSER_BACKEND,
+        help="Markdown parser: 'fast' scans bullet outlines natively and falls back to 'mistletoe' "
+        f"(a full CommonMark parse) for pages using other markdown (default: {DEFAULT_PARSER_BACKEND})",
+    )
+
+
+def _add_parse_cache_arguments(subparser: argparse.ArgumentParser) -> None:
+    subparser.add_argument(
+        "--no-parse-cache",
+        action="store_true",
+        help="Parse every file instead of reusing block trees cached by earlier runs",
+    )
+    subparser.add_argument(
+        "--parse-cache-size",
+        type=int,
+        default=DEFAULT_PARSE_CACHE_MB,
+        metavar="MB",
+        help=f"Size of the parse cache; least recently used trees are evicted (default: {DEFAULT_PARSE_CACHE_MB})",
+    )
+
+
+def _add_stream_threshold_argument(subparser: argparse.ArgumentParser) -> None:
+    subparser.add_argument(
+        "--stream-threshold",
+        type=int,
+        default=DEFAULT_STREAM_THRESHOLD_MB,
+        metavar="MB",
+        help="Parse and convert pages of at least this size one top-level block at a time instead of "
+        f"holding the whole page in memory; 0 streams every page (default: {DEFAULT_STREAM_THRESHOLD_MB})",
+    )
+
+
+def _add_llm_request_arguments(subparser: argparse.ArgumentParser) -> None:
+    subparser.add_argument(
+        "--llm-min-concurrency",
+        type=int,
+        metavar="N",
+        help="Fewest LLM requests kept in flight when the endpoint slows down or rate limits (default: 1)",
+    )
+    subparser.add_argument(
+        "--llm-max-concurrency",
+        type=int,
+        metavar="N",
+        help="Most LLM requests in flight while the endpoint keeps up (default: 64 for OpenRouter, 4 for Ollama)",
+    )
+    subparser.add_argument(
+        "--llm-batch-size",
+        type=int,
+        default=1,
+        metavar="K",
+        help="Name K notes per LLM request, asking for a JSON array of filenames (default: 1)",
+    )
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Convert LogSeq graph to other formats")
     subparsers = parser.add_subparsers(dest="command", help="Conversion target format")
@@ -709,6 +1407,56 @@ def main() -> int:
     obsidian_parser.add_argument(
         "--clear-llm-cache", action="store_true", help="Clear global LLM cache before conversion"
     )
+    obsidian_parser.add_argument(
+        "-j", "--jobs", type=int, default=1, help="Number of worker processes for file conversion (0 = one per CPU)"
+    )
+    obsidian_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only reconvert new or changed files, tracked by a manifest in the destination",
+    )
+    obsidian_parser.add_argument(
+        "--memory-budget",
+        type=int,
+        default=DEFAULT_MEMORY_BUDGET_MB,
+        metavar="MB",
+        help="Memory for reusing files read by the block-ID scan; larger graphs are partly re-read (0 disables)",
+    )
+    obsidian_parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and reconvert pages and journals as they change (implies --incremental)",
+    )
+    obsidian_parser.add_argument(
+        "--date-format",
+        action="append",
+        dest="date_formats",
+        metavar="FORMAT",
+        help="strptime format of [[date]] links to rewrite as journal links; repeat for several "
+        "(default: '%%d %%b %%Y', '%%b %%d, %%Y', '%%Y-%%m-%%d', '%%Y/%%m/%%d')",
+    )
+    obsidian_parser.add_argument(
+        "--no-block-index",
+        action="store_true",
+        help="Rescan every file for block IDs instead of using the cached block index",
+    )
+    obsidian_parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print the time spent in each conversion phase and the slowest files",
+    )
+    obsidian_parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=DEFAULT_SLOWEST_FILES,
+        metavar="N",
+        help=f"Number of slowest files to report with --profile (default: {DEFAULT_SLOWEST_FILES})",
+    )
+    obsidian_parser.add_argument(
+        "--profile-json", type=Path, metavar="PATH", help="Also write the profile to PATH as JSON"
+    )
+    _add_parser_argument(obsidian_parser)
+    _add_llm_request_arguments(obsidian_parser)
 
     # Tana command
     tana_parser = subparsers.add_parser("tana", help="Convert to Tana Intermediate Format")
@@ -717,6 +1465,12 @@ def main() -> int:
     tana_parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose logging")
     tana_parser.add_argument("--dry-run", action="store_true", help="Perform a dry run without writing changes")
     tana_parser.add_argument("-f", "--force", action="store_true", help="Force overwrite of destination file")
+    _add_parser_argument(tana_parser)
+    _add_parse_cache_arguments(tana_parser)
+    _add_stream_threshold_argument(tana_parser)
+    tana_parser.add_argument(
+        "-j", "--jobs", type=int, default=1, help="Number of worker processes for parsing files (0 = one per CPU)"
+    )
 
     # Tolaria command
     tolaria_parser = subparsers.add_parser("tolaria", help="Convert to Tolaria Markdown Format")
@@ -727,6 +1481,38 @@ def main() -> int:
     tolaria_parser.add_argument(
         "--clear-llm-cache", action="store_true", help="Clear global LLM cache before conversion"
     )
+    tolaria_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only reconvert new or changed files, tracked by a manifest in the destination",
+    )
+    tolaria_parser.add_argument(
+        "--memory-budget",
+        type=int,
+        default=DEFAULT_MEMORY_BUDGET_MB,
+        metavar="MB",
+        help="Memory for reusing files read by the block-ID scan; larger graphs are partly re-read (0 disables)",
+    )
+    tolaria_parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep running and reconvert pages and journals as they change (implies --incremental)",
+    )
+    tolaria_parser.add_argument(
+        "--date-format",
+        action="append",
+        dest="date_formats",
+        metavar="FORMAT",
+        help="strptime format of [[date]] links to rewrite as journal links; repeat for several "
+        "(default: '%%d %%b %%Y', '%%b %%d, %%Y', '%%Y-%%m-%%d', '%%Y/%%m/%%d')",
+    )
+    tolaria_parser.add_argument(
+        "--no-block-index",
+        action="store_true",
+        help="Rescan every file for block IDs instead of using the cached block index",
+    )
+    _add_parser_argument(tolaria_parser)
+    _add_llm_request_arguments(tolaria_parser)
 
     # Blinko command
     blinko_parser = subparsers.add_parser("blinko", help="Export to Blinko")
@@ -734,6 +1520,12 @@ def main() -> int:
     blinko_parser.add_argument("endpoint", type=str, help="Blinko API endpoint URL")
     blinko_parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose logging")
     blinko_parser.add_argument("--dry-run", action="store_true", help="Perform a dry run without sending data")
+    _add_parser_argument(blinko_parser)
+    _add_parse_cache_arguments(blinko_parser)
+    _add_stream_threshold_argument(blinko_parser)
+    blinko_parser.add_argument(
+        "-j", "--jobs", type=int, default=1, help="Number of worker processes for parsing files (0 = one per CPU)"
+    )
 
     # Blinko delete-all command
     blinko_delete_all_parser = subparsers.add_parser("blinko:delete-all", help="Delete ALL notes from Blinko")
@@ -741,18 +1533,93 @@ def main() -> int:
     blinko_delete_all_parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose logging")
     blinko_delete_all_parser.add_argument("--dry-run", action="store_true", help="Perform a dry run without deletion")
 
+    # LLM filename cache statistics
+    subparsers.add_parser("cache:stats", help="Show size, hit rate and per-model entries of the LLM filename cache")
+
     args = parser.parse_args()
 
+    if args.command in ("obsidian", "tolaria") and args.watch and args.dry_run:
+        log_warning("--watch cannot be combined with --dry-run.")
+        return 1
+
+    if args.command in ("obsidian", "tolaria"):
+        minimum, maximum = args.llm_min_concurrency, args.llm_max_concurrency
+        if (minimum is not None and minimum < 1) or (maximum is not None and maximum < max(1, minimum or 1)):
+            log_warning("--llm-max-concurrency must be at least --llm-min-concurrency, and both at least 1.")
+            return 1
+        if args.llm_batch_size < 1:
+            log_warning("--llm-batch-size must be at least 1.")
+            return 1
+
     if args.command == "tolaria":
-        return convert_to_tolaria(args.source, args.destination, args.verbose, args.dry_run, args.clear_llm_cache)
+        convert = partial(
+            convert_to_tolaria,
+            args.source,
+            args.destination,
+            args.verbose,
+            dry_run=args.dry_run,
+            clear_llm_cache=args.clear_llm_cache,
+            incremental=args.incremental or args.watch,
+            memory_budget_mb=args.memory_budget,
+            block_index=not args.no_block_index,
+            date_formats=args.date_formats or DEFAULT_DATE_LINK_FORMATS,
+            parser_backend=args.parser,
+            llm_min_concurrency=args.llm_min_concurrency,
+            llm_max_concurrency=args.llm_max_concurrency,
+            llm_batch_size=args.llm_batch_size,
+        )
+        return watch_and_convert(args.source, convert) if args.watch else convert()
     elif args.command == "tana":
-        return convert_to_tana(args.source, args.destination, args.verbose, args.force, args.dry_run)
+        return convert_to_tana(
+            args.source,
+            args.destination,
+            args.verbose,
+            args.force,
+            args.dry_run,
+            args.parser,
+            parse_cache=not args.no_parse_cache,
+            parse_cache_mb=args.parse_cache_size,
+            stream_threshold_mb=args.stream_threshold,
+            jobs=resolve_jobs(args.jobs),
+        )
     elif args.command == "obsidian":
-        return convert_vault(args.source, args.destination, args.verbose, args.dry_run, args.clear_llm_cache)
+        convert = partial(
+            convert_vault,
+            args.source,
+            args.destination,
+            args.verbose,
+            dry_run=args.dry_run,
+            clear_llm_cache=args.clear_llm_cache,
+            jobs=resolve_jobs(args.jobs),
+            incremental=args.incremental or args.watch,
+            memory_budget_mb=args.memory_budget,
+            block_index=not args.no_block_index,
+            date_formats=args.date_formats or DEFAULT_DATE_LINK_FORMATS,
+            parser_backend=args.parser,
+            profile=args.profile,
+            profile_top=args.profile_top,
+            profile_json=args.profile_json,
+            llm_min_concurrency=args.llm_min_concurrency,
+            llm_max_concurrency=args.llm_max_concurrency,
+            llm_batch_size=args.llm_batch_size,
+        )
+        return watch_and_convert(args.source, convert) if args.watch else convert()
     elif args.command == "blinko":
-        return convert_to_blinko(args.source, args.endpoint, args.verbose, args.dry_run)
+        return convert_to_blinko(
+            args.source,
+            args.endpoint,
+            args.verbose,
+            args.dry_run,
+            args.parser,
+            parse_cache=not args.no_parse_cache,
+            parse_cache_mb=args.parse_cache_size,
+            stream_threshold_mb=args.stream_threshold,
+            jobs=resolve_jobs(args.jobs),
+        )
     elif args.command == "blinko:delete-all":
         return convert_blinko_delete_all(args.endpoint, args.verbose, args.dry_run)
+    elif args.command == "cache:stats":
+        return show_cache_stats()
     else:
         # Default to obsidian if no subcommand provided (backward compatibility)
         # However, argparse might require subcommand if configured.
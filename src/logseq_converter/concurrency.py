@@ -0,0 +1,76 @@
+"""
+Adaptive limit on in-flight LLM requests.
+
+The limit grows while requests come back quickly and shrinks when the
+endpoint pushes back, AIMD style: it starts at the minimum and doubles every
+round trip until the first sign of congestion, then grows by one per round
+trip and is halved whenever a request is rate limited, times out, or the
+smoothed latency climbs to latency_factor times the fastest latency seen.
+Requests already in flight when the limit is halved do not halve it again.
+"""
+import asyncio
+from typing import Optional
+
+# Weight of the newest latency in the smoothed latency
+_LATENCY_SMOOTHING = 0.2
+
+
+class AdaptiveConcurrency:
+    """AIMD limit on concurrent requests within [minimum, maximum]; see the module docstring."""
+
+    def __init__(self, minimum: int, maximum: int, latency_factor: float = 2.0):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.latency_factor = latency_factor
+        self.limit = float(self.minimum)
+        self.in_flight = 0
+        self._slow_start = True
+        # Bumped on every decrease; requests remember the epoch they started in
+        self._epoch = 0
+        self._fastest: Optional[float] = None
+        self._latency: Optional[float] = None
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> int:
+        """Waits for a free slot and takes it. Returns the token to pass to release()."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+            return self._epoch
+
+    async def release(self, token: int, latency: Optional[float] = None, congested: bool = False) -> None:
+        """
+        Frees the slot taken by acquire(). latency is the request's duration if
+        it succeeded; congested marks a rate-limited or timed-out request.
+        """
+        async with self._condition:
+            self.in_flight -= 1
+            if latency is not None:
+                self._record_latency(latency)
+                congested = congested or self._latency > self.latency_factor * self._fastest
+            if congested:
+                self._decrease(token)
+            elif latency is not None:
+                self._increase()
+            self._condition.notify_all()
+
+    def _record_latency(self, latency: float) -> None:
+        self._fastest = latency if self._fastest is None else min(self._fastest, latency)
+        if self._latency is None:
+            self._latency = latency
+        else:
+            self._latency += _LATENCY_SMOOTHING * (latency - self._latency)
+
+    def _increase(self) -> None:
+        # One per success doubles the limit every round trip; 1/limit per success adds one
+        step = 1.0 if self._slow_start else 1.0 / self.limit
+        self.limit = min(float(self.maximum), self.limit + step)
+
+    def _decrease(self, token: int) -> None:
+        if token != self._epoch:
+            return
+        self._epoch += 1
+        self._slow_start = False
+        self.limit = max(float(self.minimum), self.limit / 2)
+        # Latency has to climb again before it counts as congestion
+        self._latency = self._fastest
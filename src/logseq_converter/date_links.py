@@ -0,0 +1,159 @@
+"""
+Recognition of journal dates in [[wiki link]] text.
+
+Most links in a graph point to ordinary pages, so the recogniser is built to
+reject them cheaply: every strptime format is compiled once into an anchored
+regex and link text that matches none of them is turned away without raising
+and catching ValueError. Results are memoised in a bounded LRU because the
+same link text tends to repeat throughout a graph.
+"""
+import calendar
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Callable, Optional, Sequence
+
+DEFAULT_DATE_LINK_FORMATS = ("%d %b %Y", "%b %d, %Y", "%Y-%m-%d", "%Y/%m/%d")
+DEFAULT_CACHE_SIZE = 65536
+
+_DIGIT_PATTERN = re.compile(r"\d")
+
+# Same patterns as datetime.strptime uses for these directives
+_DIRECTIVE_PATTERNS = {
+    "d": r"(?P<d>3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])",
+    "m": r"(?P<m>1[0-2]|0[1-9]|[1-9])",
+    "Y": r"(?P<Y>\d\d\d\d)",
+    "y": r"(?P<y>\d\d)",
+}
+
+
+def _names_pattern(group: str, names: Sequence[str]) -> str:
+    # Longest names first so a short name never shadows a longer one
+    ordered = sorted((name.lower() for name in names if name), key=len, reverse=True)
+    return f"(?P<{group}>{'|'.join(re.escape(name) for name in ordered)})"
+
+
+def compile_date_format(fmt: str) -> Optional[re.Pattern]:
+    """
+    Compiles a strptime format into an equivalent anchored regex. Returns None
+    when the format uses a directive the recogniser does not support, in which
+    case callers fall back to strptime itself.
+    """
+    parts = []
+    i = 0
+    while i < len(fmt):
+        char = fmt[i]
+        if char == "%":
+            directive = fmt[i + 1 : i + 2]
+            if directive in _DIRECTIVE_PATTERNS:
+                parts.append(_DIRECTIVE_PATTERNS[directive])
+            elif directive == "b":
+                parts.append(_names_pattern("b", calendar.month_abbr[1:]))
+            elif directive == "B":
+                parts.append(_names_pattern("B", calendar.month_name[1:]))
+            elif directive == "%":
+                parts.append("%")
+            else:
+                return None
+            i += 2
+        elif char.isspace():
+            # strptime lets any run of whitespace in the format match one or more spaces
+            while i < len(fmt) and fmt[i].isspace():
+                i += 1
+            parts.append(r"\s+")
+        else:
+            parts.append(re.escape(char))
+            i += 1
+
+    try:
+        return re.compile("".join(parts), re.IGNORECASE)
+    except re.error:
+        return None
+
+
+def _month_number(name: str, names: Sequence[str]) -> int:
+    lowered = name.lower()
+    for number, candidate in enumerate(names):
+        if candidate and candidate.lower() == lowered:
+            return number
+    return 0
+
+
+def _date_from_match(match: re.Match) -> Optional[date]:
+    groups = match.groupdict()
+
+    if groups.get("Y") is not None:
+        year = int(groups["Y"])
+    elif groups.get("y") is not None:
+        year = int(groups["y"])
+        year += 2000 if year <= 68 else 1900
+    else:
+        year = 1900
+
+    if groups.get("m") is not None:
+        month = int(groups["m"])
+    elif groups.get("b") is not None:
+        month = _month_number(groups["b"], calendar.month_abbr)
+    elif groups.get("B") is not None:
+        month = _month_number(groups["B"], calendar.month_name)
+    else:
+        month = 1
+
+    day = int(groups["d"]) if groups.get("d") is not None else 1
+
+    if not 1 <= year <= 9999 or not 1 <= month <= 12:
+        return None
+    if day > calendar.monthrange(year, month)[1]:
+        return None
+    return date(year, month, day)
+
+
+class DateLinkRecognizer:
+    """
+    Parses link text such as "Jan 5, 2024" or "2024-01-05" into a date using a
+    configurable list of strptime formats, tried in order. Gives the same
+    answers as trying datetime.strptime with each format.
+    """
+
+    def __init__(
+        self,
+        formats: Sequence[str] = DEFAULT_DATE_LINK_FORMATS,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        self.formats = tuple(formats)
+        self._parsers: list[Callable[[str], Optional[date]]] = [self._make_parser(fmt) for fmt in self.formats]
+        # Text without any digit can only match formats made of names (e.g. "%B")
+        self._requires_digit = all(re.search(r"%[dmYy]", fmt) for fmt in self.formats)
+        self.parse: Callable[[str], Optional[date]] = lru_cache(maxsize=cache_size)(self._parse)
+
+    @staticmethod
+    def _make_parser(fmt: str) -> Callable[[str], Optional[date]]:
+        pattern = compile_date_format(fmt)
+        if pattern is None:
+            return lambda text: _strptime_or_none(text, fmt)
+
+        def parse(text: str) -> Optional[date]:
+            # Like strptime: the first match must consume the whole text
+            match = pattern.match(text)
+            if match is None or match.end() != len(text):
+                return None
+            return _date_from_match(match)
+
+        return parse
+
+    def _parse(self, text: str) -> Optional[date]:
+        # Plain page names are rejected before any regex runs
+        if self._requires_digit and _DIGIT_PATTERN.search(text) is None:
+            return None
+        for parser in self._parsers:
+            parsed = parser(text)
+            if parsed is not None:
+                return parsed
+        return None
+
+
+def _strptime_or_none(text: str, fmt: str) -> Optional[date]:
+    try:
+        return datetime.strptime(text, fmt).date()
+    except ValueError:
+        return None
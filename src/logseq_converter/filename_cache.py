@@ -0,0 +1,338 @@
+"""
+On-disk cache of LLM-generated filenames.
+
+Filenames are keyed by the content hash of the item they name and kept in
+an SQLite store in the converter's cache directory, in a namespace per
+provider, model and prompt version so that trying another model neither
+reuses nor replaces the names of the usual one. With fallback enabled, an
+item missing from the namespace is looked up in the others.
+
+Lookups query the store as items are converted instead of loading every
+entry at startup. New names, access times and hit counters are buffered and
+written in one transaction by commit(), so a crash loses at most the names
+since the last commit and never corrupts the entries before them. close()
+also evicts, in every namespace, the least recently used names beyond the
+entry cap, so a model tried once does not push out the names of the usual
+one, and names unused for longer than the age cap. A filename_cache.json
+written by earlier releases is imported once into the namespace that opens it.
+"""
+import json
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional, Set, Tuple
+
+from logseq_converter.utils import get_cache_dir, log_warning
+
+DEFAULT_MAX_ENTRIES = 100_000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS names (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    last_used INTEGER NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS names_by_key ON names (key);
+CREATE INDEX IF NOT EXISTS names_by_last_used ON names (last_used);
+CREATE INDEX IF NOT EXISTS names_by_namespace_last_used ON names (namespace, last_used);
+CREATE TABLE IF NOT EXISTS lookups (
+    namespace TEXT PRIMARY KEY,
+    hits INTEGER NOT NULL,
+    fallback_hits INTEGER NOT NULL,
+    misses INTEGER NOT NULL
+);
+"""
+
+# Compact the store on close once this share of its pages is free
+_COMPACT_FREE_RATIO = 0.25
+
+
+@dataclass
+class FilenameCacheUpdates:
+    """What a FilenameCache in a worker process added and looked up, for the main process's cache to save."""
+
+    names: Dict[str, str]
+    used: Set[Tuple[str, str]]
+    hits: int
+    fallback_hits: int
+    misses: int
+
+
+@dataclass
+class NamespaceStats:
+    """Entries and lifetime lookups of one namespace of the cache."""
+
+    namespace: str
+    entries: int
+    hits: int
+    fallback_hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> Optional[float]:
+        lookups = self.hits + self.fallback_hits + self.misses
+        return (self.hits + self.fallback_hits) / lookups if lookups else None
+
+
+class FilenameCache:
+    """Filenames by content hash within a namespace, backed by an SQLite store; see the module docstring."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        namespace: str,
+        legacy_path: Optional[Path] = None,
+        fallback: bool = False,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_age_days: int = 0,
+    ):
+        self.db_path = db_path
+        self.namespace = namespace
+        self.legacy_path = legacy_path
+        self.fallback = fallback
+        self.max_entries = max_entries  # per namespace
+        self.max_age_days = max_age_days
+        self._pending: Dict[str, str] = {}  # key -> filename, not yet committed
+        self._used: Set[Tuple[str, str]] = set()  # (namespace, key) of the names looked up
+        self.hits = 0
+        self.fallback_hits = 0
+        self.misses = 0
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """The store's connection, opened (and older caches imported) on first use."""
+        if self._conn is not None:
+            return self._conn
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.executescript(SCHEMA)
+        except sqlite3.Error as e:
+            log_warning(f"Rebuilding unreadable filename cache '{self.db_path}': {e}")
+            self._close()
+            self.db_path.unlink(missing_ok=True)
+            try:
+                self._conn = sqlite3.connect(self.db_path)
+                self._conn.executescript(SCHEMA)
+            except sqlite3.Error as e:
+                log_warning(f"Filename cache '{self.db_path}' is unavailable: {e}")
+                self._close()
+                return None
+        self._import_legacy()
+        return self._conn
+
+    def _import_legacy(self) -> None:
+        if self.legacy_path is None or not self.legacy_path.exists():
+            return
+        try:
+            with open(self.legacy_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            now = time.time_ns()
+            with self._conn:
+                # Names already in the store are newer than the legacy file
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO names (namespace, key, filename, last_used) VALUES (?, ?, ?, ?)",
+                    [(self.namespace, key, name, now) for key, name in entries.items() if isinstance(name, str)],
+                )
+        except (OSError, ValueError, AttributeError) as e:
+            log_warning(f"Ignoring unreadable filename cache '{self.legacy_path}': {e}")
+        except sqlite3.Error as e:
+            log_warning(f"Failed to import filename cache '{self.legacy_path}': {e}")
+            return
+        self.legacy_path.unlink(missing_ok=True)
+
+    def _find(self, key: str) -> Optional[Tuple[str, str]]:
+        """(namespace, filename) of the name for key, falling back to other namespaces if enabled."""
+        if key in self._pending:
+            return self.namespace, self._pending[key]
+        conn = self._connection()
+        if conn is None:
+            return None
+        try:
+            row = conn.execute(
+                "SELECT filename FROM names WHERE namespace = ? AND key = ?", (self.namespace, key)
+            ).fetchone()
+            if row:
+                return self.namespace, row[0]
+            if self.fallback:
+                row = conn.execute(
+                    "SELECT namespace, filename FROM names WHERE key = ? ORDER BY last_used DESC LIMIT 1", (key,)
+                ).fetchone()
+                if row:
+                    return row[0], row[1]
+        except sqlite3.Error as e:
+            log_warning(f"Failed to read filename cache '{self.db_path}': {e}")
+        return None
+
+    def get(self, key: str, default: Optional[str] = None) -> Optional[str]:
+        found = self._find(key)
+        return found[1] if found else default
+
+    def lookup(self, key: str) -> Optional[str]:
+        """Like get(), but counts the hit or miss and marks the name as recently used."""
+        found = self._find(key)
+        if found is None:
+            self.misses += 1
+            return None
+        namespace, filename = found
+        if namespace == self.namespace:
+            self.hits += 1
+        else:
+            self.fallback_hits += 1
+        self._used.add((namespace, key))
+        return filename
+
+    def __getitem__(self, key: str) -> str:
+        filename = self.get(key)
+        if filename is None:
+            raise KeyError(key)
+        return filename
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def __setitem__(self, key: str, filename: str) -> None:
+        self._pending[key] = filename
+
+    def __len__(self) -> int:
+        """Number of names in this cache's namespace."""
+        conn = self._connection()
+        if conn is None:
+            return len(self._pending)
+        stored = conn.execute("SELECT count(*) FROM names WHERE namespace = ?", (self.namespace,)).fetchone()[0]
+        if not self._pending:
+            return stored
+        # Pending keys may replace stored ones; passed as one JSON array to stay clear of SQLite's variable limit
+        replaced = conn.execute(
+            "SELECT count(*) FROM names WHERE namespace = ? AND key IN (SELECT value FROM json_each(?))",
+            (self.namespace, json.dumps(list(self._pending))),
+        ).fetchone()[0]
+        return stored + len(self._pending) - replaced
+
+    def take_updates(self) -> FilenameCacheUpdates:
+        """Hands over the uncommitted names, access times and counters, leaving none here."""
+        updates = FilenameCacheUpdates(self._pending, self._used, self.hits, self.fallback_hits, self.misses)
+        self._pending = {}
+        self._used = set()
+        self.hits = self.fallback_hits = self.misses = 0
+        return updates
+
+    def add_updates(self, updates: FilenameCacheUpdates) -> None:
+        """Takes on updates from another cache of the same namespace, to be written by the next commit()."""
+        self._pending.update(updates.names)
+        self._used.update(updates.used)
+        self.hits += updates.hits
+        self.fallback_hits += updates.fallback_hits
+        self.misses += updates.misses
+
+    def commit(self) -> None:
+        """Writes the names, access times and counters since the last commit in a single transaction."""
+        if not self._pending and not self._used and not (self.hits or self.fallback_hits or self.misses):
+            return
+        conn = self._connection()
+        if conn is None:
+            return
+        now = time.time_ns()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO names (namespace, key, filename, last_used) VALUES (?, ?, ?, ?)",
+                    [(self.namespace, key, filename, now) for key, filename in self._pending.items()],
+                )
+                conn.executemany(
+                    "UPDATE names SET last_used = ? WHERE namespace = ? AND key = ?",
+                    [(now, namespace, key) for namespace, key in self._used],
+                )
+                conn.execute(
+                    "INSERT INTO lookups (namespace, hits, fallback_hits, misses) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (namespace) DO UPDATE SET hits = hits + excluded.hits, "
+                    "fallback_hits = fallback_hits + excluded.fallback_hits, misses = misses + excluded.misses",
+                    (self.namespace, self.hits, self.fallback_hits, self.misses),
+                )
+        except sqlite3.Error as e:
+            log_warning(f"Failed to save filename cache '{self.db_path}': {e}")
+            return
+        self._pending.clear()
+        self._used.clear()
+        self.hits = self.fallback_hits = self.misses = 0
+
+    def _evict(self) -> None:
+        if self.max_age_days > 0:
+            cutoff = time.time_ns() - self.max_age_days * 86_400 * 10**9
+            self._conn.execute("DELETE FROM names WHERE last_used < ?", (cutoff,))
+        if self.max_entries > 0:
+            namespaces = [row[0] for row in self._conn.execute("SELECT DISTINCT namespace FROM names")]
+            for namespace in namespaces:
+                self._conn.execute(
+                    "DELETE FROM names WHERE rowid IN (SELECT rowid FROM names WHERE namespace = ? "
+                    "ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (namespace, self.max_entries),
+                )
+
+    def clear(self) -> None:
+        """Forgets every name in every namespace, deleting the store."""
+        self._pending.clear()
+        self._used.clear()
+        self.hits = self.fallback_hits = self.misses = 0
+        self._close()
+        self.db_path.unlink(missing_ok=True)
+        if self.legacy_path is not None:
+            self.legacy_path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """
+        Commits, evicts names beyond the caps (max_entries per namespace),
+        compacts the store if much of it is free, and closes it.
+        """
+        self.commit()
+        if self._conn is not None:
+            try:
+                with self._conn:
+                    self._evict()
+                page_count = self._conn.execute("PRAGMA page_count").fetchone()[0]
+                free_pages = self._conn.execute("PRAGMA freelist_count").fetchone()[0]
+                if page_count and free_pages / page_count >= _COMPACT_FREE_RATIO:
+                    self._conn.execute("VACUUM")
+            except sqlite3.Error as e:
+                log_warning(f"Failed to trim filename cache '{self.db_path}': {e}")
+        self._close()
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+        self._conn = None
+
+
+def filename_cache_path(env: Mapping[str, str]) -> Path:
+    return get_cache_dir(env) / "filename_cache.sqlite3"
+
+
+def read_stats(db_path: Path) -> List[NamespaceStats]:
+    """Entries and lifetime lookups of every namespace in the store, by namespace, without changing it."""
+    if not db_path.exists():
+        return []
+    try:
+        conn = sqlite3.connect(f"{db_path.as_uri()}?mode=ro", uri=True)
+    except sqlite3.Error as e:
+        log_warning(f"Ignoring unreadable filename cache '{db_path}': {e}")
+        return []
+    try:
+        rows = conn.execute(
+            """
+            SELECT namespace, sum(entries), sum(hits), sum(fallback_hits), sum(misses) FROM (
+                SELECT namespace, count(*) AS entries, 0 AS hits, 0 AS fallback_hits, 0 AS misses
+                FROM names GROUP BY namespace
+                UNION ALL
+                SELECT namespace, 0, hits, fallback_hits, misses FROM lookups
+            ) GROUP BY namespace ORDER BY namespace
+            """
+        ).fetchall()
+    except sqlite3.Error as e:
+        log_warning(f"Ignoring unreadable filename cache '{db_path}': {e}")
+        return []
+    finally:
+        conn.close()
+    return [NamespaceStats(*row) for row in rows]
@@ -1,25 +1,67 @@
+import asyncio
 import hashlib
 import json
 import os
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
 from pathlib import Path
 from typing import Optional
 
-from openai import OpenAI
-
-from logseq_converter.utils import generate_content_filename, sanitize_filename
+from openai import APITimeoutError, AsyncOpenAI, RateLimitError
+
+from logseq_converter.concurrency import AdaptiveConcurrency
+from logseq_converter.filename_cache import DEFAULT_MAX_ENTRIES, FilenameCache, filename_cache_path
+from logseq_converter.utils import generate_content_filename, log_warning, sanitize_filename
+
+# Bump when the filename prompt changes, so names cached for the old prompt are not reused
+FILENAME_PROMPT_VERSION = 1
+FILENAME_SYSTEM_PROMPT = (
+    "You are a utility that generates concise, descriptive, and web-safe file names for journal notes. "
+    "Output ONLY the raw filename. Do NOT include any introduction, explanations, markdown formatting, "
+    "quotes, or file extensions (do not add .md). Target a length of 3 to 6 words, but you may use up "
+    "to a maximum of 15 words if essential to maintain descriptive precision."
+)
+# The same rules for several numbered notes at once
+BATCH_FILENAME_SYSTEM_PROMPT = (
+    "You are a utility that generates concise, descriptive, and web-safe file names for journal notes. "
+    "You are given numbered notes. Output ONLY a JSON array of strings holding one filename per note, in "
+    "the order of the notes, and nothing else. Each filename is raw text without quotes, markdown "
+    "formatting, or file extensions (do not add .md). Target a length of 3 to 6 words, but you may use up "
+    "to a maximum of 15 words if essential to maintain descriptive precision."
+)
+# Attempts per request when the endpoint rate limits or times out
+MAX_ATTEMPTS = 4
+# Seconds before the first retry, doubled per attempt, unless the endpoint sends Retry-After
+RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 60.0
 
 
 class LLMClient:
+    # Bounds on concurrent requests; the upper bound defaults to max_workers
+    min_concurrency: int = 1
+    max_concurrency: Optional[int] = None
+    # Notes named per request
+    batch_size: int = 1
+
     @property
     def provider(self) -> str:
         raise NotImplementedError()
 
+    @property
+    def cache_namespace(self) -> str:
+        """The filename cache namespace of the names this client generates."""
+        return self.provider
+
     @property
     def max_workers(self) -> int:
         raise NotImplementedError()
 
+    def set_concurrency(self, minimum: Optional[int] = None, maximum: Optional[int] = None) -> None:
+        if minimum is not None:
+            self.min_concurrency = minimum
+        if maximum is not None:
+            self.max_concurrency = maximum
+
     def resolve_batch(self, items: list[tuple[str, list[str]]], on_resolve=None) -> list[str]:
         raise NotImplementedError()
 
@@ -44,45 +86,112 @@ class RuleBasedFilenameClient(LLMClient):
         return results
 
 
+def parse_filename_list(reply: str, count: int) -> list[Optional[str]]:
+    """
+    The count filenames of a reply to the batch prompt: the outermost JSON
+    array of strings in it, which models sometimes wrap in a code fence or an
+    object. Entries that are missing, empty or not strings are None, as is
+    every entry when the reply holds no array.
+    """
+    start, end = reply.find("["), reply.rfind("]")
+    try:
+        names = json.loads(reply[start : end + 1]) if 0 <= start < end else None
+    except ValueError:
+        names = None
+    if not isinstance(names, list):
+        return [None] * count
+    names = [name.strip() if isinstance(name, str) and name.strip() else None for name in names[:count]]
+    return names + [None] * (count - len(names))
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """Seconds to wait before retrying a rate-limited or timed-out request."""
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    try:
+        delay = float(retry_after)
+    except (TypeError, ValueError):
+        delay = RETRY_DELAY * 2**attempt
+    return min(delay, MAX_RETRY_DELAY)
+
+
 class BaseLLMClient(LLMClient):
-    def __init__(self, model: str, client: OpenAI):
+    def __init__(self, model: str, client_options: dict):
         self.model = model
-        self.client = client
+        # AsyncOpenAI arguments; each batch creates its client on its own event loop
+        self.client_options = client_options
 
     @property
     def max_workers(self) -> int:
         raise NotImplementedError()
 
-    def generate_filename_llm(self, description: str, sub_items: list[str]) -> Optional[str]:
-        prompt_content = f"{description}\n" + "\n".join(sub_items)
+    @property
+    def cache_namespace(self) -> str:
+        return f"{self.provider}:{self.model}:v{FILENAME_PROMPT_VERSION}"
 
-        system_prompt = (
-            "You are a utility that generates concise, descriptive, and web-safe file names for journal notes. "
-            "Output ONLY the raw filename. Do NOT include any introduction, explanations, markdown formatting, "
-            "quotes, or file extensions (do not add .md). Target a length of 3 to 6 words, but you may use up "
-            "to a maximum of 15 words if essential to maintain descriptive precision."
-        )
+    def create_client(self) -> AsyncOpenAI:
+        # Rate limits are retried by _complete, which also lowers the concurrency for them
+        return AsyncOpenAI(max_retries=0, **self.client_options)
 
+    async def generate_filename_llm(
+        self, client: AsyncOpenAI, limit: AdaptiveConcurrency, description: str, sub_items: list[str]
+    ) -> Optional[str]:
+        prompt_content = f"{description}\n" + "\n".join(sub_items)
         user_prompt = f"Summarize the following note content into a filename:\nContent:\n{prompt_content}"
-
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=0.3,
-                max_tokens=60,
-            )
-            filename = response.choices[0].message.content
-            if filename:
-                return filename.strip()
-        except Exception as e:
-            from logseq_converter.utils import log_warning
-
-            log_warning(f"LLM generation failed: {e}")
-            return None
+        reply = await self._complete(client, limit, FILENAME_SYSTEM_PROMPT, user_prompt, max_tokens=60)
+        return reply.strip() if reply else None
+
+    async def generate_filenames_llm(
+        self, client: AsyncOpenAI, limit: AdaptiveConcurrency, notes: list[tuple[str, list[str]]]
+    ) -> list[Optional[str]]:
+        """
+        Names several notes with one request. Returns a raw filename per note,
+        or None for the notes the reply did not name.
+        """
+        contents = [
+            f"Note {number}:\n{description}\n" + "\n".join(sub_items)
+            for number, (description, sub_items) in enumerate(notes, 1)
+        ]
+        user_prompt = (
+            f"Summarize each of the following {len(notes)} notes into a filename:\n\n" + "\n\n".join(contents)
+        )
+        reply = await self._complete(
+            client, limit, BATCH_FILENAME_SYSTEM_PROMPT, user_prompt, max_tokens=60 * len(notes)
+        )
+        return parse_filename_list(reply, len(notes)) if reply else [None] * len(notes)
+
+    async def _complete(
+        self, client: AsyncOpenAI, limit: AdaptiveConcurrency, system_prompt: str, user_prompt: str, max_tokens: int
+    ) -> Optional[str]:
+        """The model's reply, or None if the request failed."""
+        for attempt in range(MAX_ATTEMPTS):
+            token = await limit.acquire()
+            start = time.perf_counter()
+            try:
+                response = await client.chat.completions.create(
+                    model=self.model,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    temperature=0.3,
+                    max_tokens=max_tokens,
+                )
+            except (RateLimitError, APITimeoutError) as e:
+                await limit.release(token, congested=True)
+                if attempt + 1 == MAX_ATTEMPTS:
+                    log_warning(f"LLM generation failed: {e}")
+                    return None
+                await asyncio.sleep(_retry_delay(e, attempt))
+                continue
+            except Exception as e:
+                await limit.release(token)
+                log_warning(f"LLM generation failed: {e}")
+                return None
+
+            await limit.release(token, time.perf_counter() - start)
+            return response.choices[0].message.content if response.choices else None
+        return None
 
     def post_process_filename(self, raw_filename: str, description: str) -> str:
         # Strip wrapping quotes, spaces, and backticks (custom character trim)
@@ -106,37 +215,50 @@ class BaseLLMClient(LLMClient):
         return sanitized
 
     def resolve_batch(self, items: list[tuple[str, list[str]]], on_resolve=None) -> list[str]:
+        return asyncio.run(self._resolve_batch(items, on_resolve))
+
+    async def _resolve_batch(self, items: list[tuple[str, list[str]]], on_resolve=None) -> list[str]:
         total_pending = len(items)
         completed_count = 0
         results = [None] * total_pending
-
-        def process_item(idx: int) -> tuple[int, str]:
-            description, sub_items = items[idx]
-            raw_filename = self.generate_filename_llm(description, sub_items)
-            if raw_filename:
-                processed = self.post_process_filename(raw_filename, description)
-            else:
-                processed = sanitize_filename(generate_content_filename(description))
-            return idx, processed
-
-        max_workers = min(self.max_workers, total_pending)
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_idx = {executor.submit(process_item, idx): idx for idx in range(total_pending)}
-
-            for future in as_completed(future_to_idx):
-                idx, filename = future.result()
-                results[idx] = filename
-                
-                if on_resolve:
-                    on_resolve(idx, filename)
-
-                completed_count += 1
+        limit = AdaptiveConcurrency(self.min_concurrency, self.max_concurrency or self.max_workers)
+
+        async def process_batches(client: AsyncOpenAI, batches) -> None:
+            nonlocal completed_count
+            for batch in batches:
+                notes = [items[idx] for idx in batch]
+                if len(notes) == 1:
+                    raw_filenames = [await self.generate_filename_llm(client, limit, *notes[0])]
+                else:
+                    raw_filenames = await self.generate_filenames_llm(client, limit, notes)
+
+                for idx, raw_filename in zip(batch, raw_filenames, strict=True):
+                    description = items[idx][0]
+                    if raw_filename:
+                        processed = self.post_process_filename(raw_filename, description)
+                    else:
+                        processed = sanitize_filename(generate_content_filename(description))
+                    results[idx] = processed
+
+                    if on_resolve:
+                        on_resolve(idx, processed)
+
+                completed_count += len(batch)
                 percent = int((completed_count / total_pending) * 100)
                 sys.stderr.write(
-                    f"\rGenerating filenames: {completed_count}/{total_pending} complete ({percent}%)..."
+                    f"\rGenerating filenames: {completed_count}/{total_pending} complete ({percent}%, "
+                    f"{int(limit.limit)} concurrent)..."
                 )
                 sys.stderr.flush()
 
+        # batch_size notes per request. Enough tasks for the largest limit share one queue of
+        # batches; the limit decides how many send at once.
+        size = max(1, self.batch_size)
+        batches = [range(first, min(first + size, total_pending)) for first in range(0, total_pending, size)]
+        queue = iter(batches)
+        async with self.create_client() as client:
+            await asyncio.gather(*(process_batches(client, queue) for _ in range(min(limit.maximum, len(batches)))))
+
         return results
 
 
@@ -147,18 +269,18 @@ class OpenRouterLLMClient(BaseLLMClient):
 
     @property
     def max_workers(self) -> int:
-        return 15
+        return 64
 
     def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
         if not api_key:
             raise ValueError("OpenRouter requires LSC_API_KEY")
         model_name = model or "google/gemini-2.5-flash-lite"
-        client = OpenAI(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=api_key,
-            timeout=30.0,
-        )
-        super().__init__(model_name, client)
+        client_options = {
+            "base_url": "https://openrouter.ai/api/v1",
+            "api_key": api_key,
+            "timeout": 30.0,
+        }
+        super().__init__(model_name, client_options)
 
 
 class OllamaLLMClient(BaseLLMClient):
@@ -168,7 +290,7 @@ class OllamaLLMClient(BaseLLMClient):
 
     @property
     def max_workers(self) -> int:
-        return 1
+        return 4
 
     def __init__(self, ollama_host: Optional[str] = None, model: Optional[str] = None):
         model_name = model or "gemma4:e4b"
@@ -191,12 +313,12 @@ class OllamaLLMClient(BaseLLMClient):
         if not host.endswith("/v1") and not host.endswith("/v1/"):
             host = host.rstrip("/") + "/v1"
             
-        client = OpenAI(
-            base_url=host,
-            api_key="ollama",
-            timeout=180.0,  # 3-minute timeout for slow local machines
-        )
-        super().__init__(model_name, client)
+        client_options = {
+            "base_url": host,
+            "api_key": "ollama",
+            "timeout": 180.0,  # 3-minute timeout for slow local machines
+        }
+        super().__init__(model_name, client_options)
 
 
 def create_llm_client(env: dict[str, str]) -> LLMClient:
@@ -238,39 +360,35 @@ class LLMFilenameGenerator:
         return self.client.provider
 
     def _get_cache_path(self) -> Path:
-        if os.name == "nt":
-            base = Path(self.env.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
-        else:
-            base = Path(self.env.get("XDG_CACHE_HOME") or Path.home() / ".cache")
-
-        return base / "logseq-converter" / "filename_cache.json"
+        return filename_cache_path(self.env)
+
+    def _load_cache(self) -> FilenameCache:
+        # Written by earlier releases; imported into the store on first use
+        legacy_path = self.cache_path.with_name("filename_cache.json")
+        return FilenameCache(
+            self.cache_path,
+            self.client.cache_namespace,
+            legacy_path,
+            fallback=self.env.get("LSC_CACHE_FALLBACK", "").strip().lower() in ("1", "true", "yes"),
+            max_entries=self._env_int("LSC_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES),
+            max_age_days=self._env_int("LSC_CACHE_MAX_AGE_DAYS", 0),
+        )
 
-    def _load_cache(self) -> dict[str, str]:
-        if not self.cache_path.exists():
-            return {}
+    def _env_int(self, name: str, default: int) -> int:
+        value = self.env.get(name)
+        if not value:
+            return default
         try:
-            with open(self.cache_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except Exception:
-            return {}
+            return int(value)
+        except ValueError:
+            log_warning(f"Ignoring {name}={value!r}: not a whole number")
+            return default
 
     def _save_cache(self) -> None:
-        try:
-            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.cache_path, "w", encoding="utf-8") as f:
-                json.dump(self.cache, f, indent=2)
-        except Exception:
-            pass
+        self.cache.commit()
 
     def clear_cache(self) -> None:
-        if not self.cache_path.exists():
-            self.cache = {}
-            return
-        try:
-            self.cache_path.unlink()
-        except Exception:
-            pass
-        self.cache = {}
+        self.cache.clear()
 
     def get_content_hash(self, description: str, sub_items: list[str]) -> str:
         content = f"{description}\n" + "\n".join(sub_items)
@@ -284,8 +402,9 @@ class LLMFilenameGenerator:
 
         for idx, (description, sub_items) in enumerate(items):
             checksum = self.get_content_hash(description, sub_items)
-            if checksum in self.cache:
-                results[idx] = self.cache[checksum]
+            cached_name = self.cache.get(checksum)
+            if cached_name is not None:
+                results[idx] = cached_name
             else:
                 pending_indices.append(idx)
 
@@ -297,6 +416,7 @@ class LLMFilenameGenerator:
         sys.stderr.flush()
 
         if total_pending == 0:
+            self._save_cache()
             return results
 
         # Define a callback to save cache progressively
@@ -348,6 +468,8 @@ class LLMFilenameGenerator:
                     placeholders_to_resolve.append((idx, filename, file_content, checksum, fallback))
 
         if not placeholders_to_resolve:
+            # Still records the names the converters found in the cache
+            self.cache.close()
             return extracted_files
 
         batch_items = []
@@ -356,6 +478,7 @@ class LLMFilenameGenerator:
             batch_items.append((description, sub_items))
 
         resolved_basenames = self.resolve_filenames_batch(batch_items)
+        self.cache.close()
 
         final_files = list(extracted_files)
         for i, (idx, filename, file_content, _, _) in enumerate(placeholders_to_resolve):
@@ -0,0 +1,154 @@
+import hashlib
+import os
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from logseq_converter.logseq.parser import BLOCK_ID_PATTERN, BlockReferenceScanner
+from logseq_converter.utils import get_cache_dir, log_warning
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS blocks (
+    block_id TEXT NOT NULL,
+    path TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS blocks_by_path ON blocks (path);
+"""
+
+
+class PersistentBlockIndex(BlockReferenceScanner):
+    """
+    Block-ID scanner backed by an SQLite store, so the block map survives
+    between runs. Every indexed file records its mtime and size; on the next
+    run only files whose stat changed are rescanned, and files that vanished
+    are dropped. Lookups (get_file_for_block) are answered from the map
+    loaded from the store, so the index stays picklable for worker processes.
+    """
+
+    def __init__(self, graph_path: Path, db_path: Path):
+        super().__init__()
+        self.graph_path = graph_path
+        self.db_path = db_path
+        self._files: Dict[str, Tuple[int, int]] = {}  # relative path -> (mtime_ns, size)
+        self._file_blocks: Dict[str, List[str]] = {}  # relative path -> block ids
+        self._stats: Dict[str, Tuple[int, int]] = {}  # stats taken by needs_scan, reused by scan_content
+        self._dirty: set[str] = set()
+        self._removed: set[str] = set()
+        self.rescanned = 0
+        self._load()
+
+    @staticmethod
+    def path_for_graph(cache_dir: Path, graph_path: Path) -> Path:
+        """Location of the index for a graph: one database per resolved graph path."""
+        key = hashlib.sha256(str(graph_path.resolve()).encode("utf-8")).hexdigest()[:16]
+        return cache_dir / "block_index" / f"{key}.sqlite3"
+
+    def _relative(self, file_path: Path) -> str:
+        return file_path.relative_to(self.graph_path).as_posix()
+
+    def _load(self) -> None:
+        if not self.db_path.exists():
+            return
+
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.executescript(SCHEMA)
+                for path, mtime_ns, size in conn.execute("SELECT path, mtime_ns, size FROM files"):
+                    self._files[path] = (mtime_ns, size)
+                    self._file_blocks[path] = []
+                for block_id, path in conn.execute("SELECT block_id, path FROM blocks"):
+                    self._file_blocks.setdefault(path, []).append(block_id)
+                    self.block_map[block_id] = self.graph_path / path
+            conn.close()
+        except sqlite3.Error as e:
+            log_warning(f"Rebuilding unreadable block index '{self.db_path}': {e}")
+            self.db_path.unlink(missing_ok=True)
+            self.block_map.clear()
+            self._files.clear()
+            self._file_blocks.clear()
+
+    def needs_scan(self, file_path: Path) -> bool:
+        rel = self._relative(file_path)
+        stat = file_path.stat()
+        current = (stat.st_mtime_ns, stat.st_size)
+        if self._files.get(rel) == current:
+            return False
+        self._stats[rel] = current
+        return True
+
+    def scan_content(self, file_path: Path, content: str) -> None:
+        rel = self._relative(file_path)
+
+        # Drop the blocks this file defined before its latest edit
+        for block_id in self._file_blocks.pop(rel, []):
+            if self.block_map.get(block_id) == file_path:
+                del self.block_map[block_id]
+
+        block_ids = BLOCK_ID_PATTERN.findall(content)
+        for block_id in block_ids:
+            self.block_map[block_id] = file_path
+        self._file_blocks[rel] = block_ids
+
+        stat = self._stats.pop(rel, None)
+        if stat is None:
+            file_stat = file_path.stat()
+            stat = (file_stat.st_mtime_ns, file_stat.st_size)
+        self._files[rel] = stat
+        self._dirty.add(rel)
+        self._removed.discard(rel)
+        self.rescanned += 1
+
+    def prune(self, existing_files: Iterable[Path]) -> None:
+        """Forgets indexed files that are no longer part of the graph."""
+        existing = {self._relative(file_path) for file_path in existing_files}
+        self.forget([self.graph_path / rel for rel in self._files if rel not in existing])
+
+    def forget(self, file_paths: Iterable[Path]) -> None:
+        """Forgets the given files, e.g. ones a file watcher reported as deleted."""
+        for rel in [self._relative(file_path) for file_path in file_paths]:
+            if self._files.pop(rel, None) is None:
+                continue
+            for block_id in self._file_blocks.pop(rel, []):
+                if self.block_map.get(block_id) == self.graph_path / rel:
+                    del self.block_map[block_id]
+            self._dirty.discard(rel)
+            self._removed.add(rel)
+
+    def save(self) -> None:
+        """Writes rescanned and removed files to the store in a single transaction."""
+        if not self._dirty and not self._removed and self.db_path.exists():
+            return
+
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path)
+            with conn:
+                conn.executescript(SCHEMA)
+                for rel in self._removed | self._dirty:
+                    conn.execute("DELETE FROM blocks WHERE path = ?", (rel,))
+                    conn.execute("DELETE FROM files WHERE path = ?", (rel,))
+                for rel in self._dirty:
+                    mtime_ns, size = self._files[rel]
+                    conn.execute("INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?)", (rel, mtime_ns, size))
+                    conn.executemany(
+                        "INSERT INTO blocks (block_id, path) VALUES (?, ?)",
+                        [(block_id, rel) for block_id in self._file_blocks.get(rel, [])],
+                    )
+            conn.close()
+        except sqlite3.Error as e:
+            log_warning(f"Failed to save block index '{self.db_path}': {e}")
+            return
+
+        self._dirty.clear()
+        self._removed.clear()
+
+
+def open_block_index(graph_path: Path, env: Optional[dict] = None) -> PersistentBlockIndex:
+    """Opens the persistent block index of a graph in the converter's cache directory."""
+    cache_dir = get_cache_dir(env if env is not None else os.environ)
+    return PersistentBlockIndex(graph_path, PersistentBlockIndex.path_for_graph(cache_dir, graph_path))
@@ -0,0 +1,91 @@
+import hashlib
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+
+@dataclass(frozen=True)
+class SourceState:
+    """Size, mtime and content hash of a source file as it was read."""
+
+    size: int
+    mtime_ns: int
+    sha256: str
+
+
+@dataclass(frozen=True)
+class SourceText:
+    """The text of a source file and the state of the file it was read from."""
+
+    content: str
+    state: SourceState
+
+
+def read_source_text(file_path: Path) -> SourceText:
+    """
+    Reads a UTF-8 source in one pass, hashing the bytes that were read. The
+    mtime is taken before reading, so an edit made while the file is read
+    shows up as a change on the next comparison.
+    """
+    with open(file_path, "rb") as f:
+        mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+        data = f.read()
+    # Universal newlines, as when reading in text mode
+    content = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    return SourceText(content, SourceState(len(data), mtime_ns, hashlib.sha256(data).hexdigest()))
+
+
+class SourceLoader:
+    """
+    Reads graph files once and hands the same text to the block-ID scanner and
+    to the converters.
+
+    Files inside retain_dirs are kept in memory after the first read, up to
+    memory_budget bytes of file size in total; anything beyond the budget is
+    read again from disk when the converters ask for it.
+    """
+
+    def __init__(self, memory_budget: int, retain_dirs: Iterable[Path] = ()):
+        self.memory_budget = memory_budget
+        self.retain_dirs = {Path(d) for d in retain_dirs}
+        self._buffers: Dict[Path, SourceText] = {}
+        self.buffered_size = 0
+        self.disk_reads = 0
+
+    def _read_from_disk(self, file_path: Path) -> SourceText:
+        self.disk_reads += 1
+        return read_source_text(file_path)
+
+    def load(self, file_path: Path) -> str:
+        """
+        Reads a file for the first time and buffers it if it will be needed
+        again and fits in the remaining budget.
+        """
+        if file_path in self._buffers:
+            return self._buffers[file_path].content
+
+        source = self._read_from_disk(file_path)
+        size = source.state.size
+        if file_path.parent in self.retain_dirs and self.buffered_size + size <= self.memory_budget:
+            self._buffers[file_path] = source
+            self.buffered_size += size
+        return source.content
+
+    def take(self, file_path: Path) -> Optional[SourceText]:
+        """Removes and returns a buffered file, or None if it was not buffered."""
+        source = self._buffers.pop(file_path, None)
+        if source is not None:
+            self.buffered_size -= source.state.size
+        return source
+
+    def read(self, file_path: Path) -> SourceText:
+        """Returns the buffered file, falling back to reading it again."""
+        source = self.take(file_path)
+        if source is None:
+            source = self._read_from_disk(file_path)
+        return source
+
+    def clear(self) -> None:
+        self._buffers.clear()
+        self.buffered_size = 0
@@ -1,25 +1,84 @@
 from dataclasses import dataclass, field
 from datetime import date
 from pathlib import Path
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
+# Shared by every block without properties, children or links. Parsers assign
+# a new container instead of mutating these.
+EMPTY_PROPERTIES: Mapping[str, str] = MappingProxyType({})
+EMPTY_BLOCKS: Tuple["Block", ...] = ()
+EMPTY_LINKS: Tuple["BlockLink", ...] = ()
+EMPTY_PROPERTY_TOKENS: Tuple["Property", ...] = ()
 
-@dataclass
+
+@dataclass(slots=True)
+class BlockLink:
+    caption: str
+    target: str
+    # [start, end) character range of the [caption](target) markup in the block's content
+    span: Optional[Tuple[int, int]] = None
+
+
+@dataclass(frozen=True, slots=True)
+class Property:
+    """A key:: value property (or a key: value frontmatter line) found by the property lexer."""
+
+    key: str
+    # The value as written, up to the end of its line
+    value: str
+    # [start, end) character range of the whole property in the lexed text
+    span: Tuple[int, int]
+
+
+@dataclass(slots=True)
 class Block:
     content: str
     id: Optional[str] = None
-    properties: Dict[str, str] = field(default_factory=dict)
-    children: List["Block"] = field(default_factory=list)
+    properties: Mapping[str, str] = EMPTY_PROPERTIES
+    children: Sequence["Block"] = EMPTY_BLOCKS
     cleaned_content: str = ""
+    # [start, stop) line range of content in the parsed text, when it came from a parser
+    span: Optional[Tuple[int, int]] = None
+    # Links in the content of list items, in order
+    links: Sequence[BlockLink] = EMPTY_LINKS
+    # Every key:: value in content, including id::, in order
+    property_tokens: Sequence[Property] = EMPTY_PROPERTY_TOKENS
+
+
+class _LazyBlocks:
+    """
+    Descriptor for the blocks of a Page or Journal. Blocks passed to the
+    constructor are used as given; otherwise the owner's block_loader builds
+    them on first access.
+    """
+
+    def __set_name__(self, owner, name):
+        self.attribute = f"_{name}"
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            # Dataclass default: no blocks until they are set or loaded
+            return None
+        blocks = obj.__dict__.get(self.attribute)
+        if blocks is None:
+            loader = obj.__dict__.get("block_loader")
+            blocks = loader() if loader is not None else []
+            obj.__dict__[self.attribute] = blocks
+        return blocks
+
+    def __set__(self, obj, value):
+        obj.__dict__[self.attribute] = value
 
 
 @dataclass
 class Page:
     filename: str
     content: str
-    blocks: List[Block] = field(default_factory=list)
+    blocks: List[Block] = _LazyBlocks()
     properties: Dict[str, str] = field(default_factory=dict)
     cleaned_content: str = ""
+    block_loader: Optional[Callable[[], List[Block]]] = field(default=None, repr=False, compare=False)
 
 
 @dataclass
@@ -27,7 +86,8 @@ class Journal:
     filename: str
     date: date
     content: str
-    blocks: List[Block] = field(default_factory=list)
+    blocks: List[Block] = _LazyBlocks()
+    block_loader: Optional[Callable[[], List[Block]]] = field(default=None, repr=False, compare=False)
 
 
 @dataclass
@@ -45,6 +105,12 @@ class Graph:
     assets: List[Asset] = field(default_factory=list)
 
 
+@dataclass
+class JournalSection:
+    name: str  # The section's tag, lowercased: '#links', '#learnings', ...
+    blocks: List[Block] = field(default_factory=list)  # The section's items
+
+
 @dataclass
 class LinkItem:
     caption: str
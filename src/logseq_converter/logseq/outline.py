@@ -0,0 +1,192 @@
+"""
+Native parser for LogSeq's indentation-based bullet outlines.
+
+LogSeq pages are mostly nested "- " bullets, paragraphs and ATX headings, so
+the block tree can be built in one linear scan of the lines instead of a full
+CommonMark parse. The scan follows CommonMark's list rules for the outline
+constructs it models (list item content columns, lazy continuation lines,
+blank lines ending paragraphs) and raises UnsupportedOutline for anything else
+(code fences, quotes, HTML, tables, ordered lists, ...), in which case callers
+fall back to the mistletoe parser.
+"""
+import re
+from typing import List, Optional
+
+from logseq_converter.logseq.models import Block
+from logseq_converter.logseq.walk import append_child
+
+TAB_SIZE = 4
+
+_BULLET_PATTERN = re.compile(r"[-*+](?:[ \t]+|$)")
+_HEADING_PATTERN = re.compile(r"#{1,6}(?:[ \t]|$)")
+_THEMATIC_BREAK_PATTERN = re.compile(r"([-*_])(?:[ \t]*\1){2,}[ \t]*$")
+_SETEXT_UNDERLINE_PATTERN = re.compile(r"[=-]+[ \t]*$")
+# mistletoe also reads a bare "." or ")" as an ordered list marker
+_ORDERED_MARKER_PATTERN = re.compile(r"\d{0,9}[.)](?:[ \t]|$)")
+# Same as mistletoe's; a line with "|" followed by such a row starts a table
+_TABLE_DELIMITER_PATTERN = re.compile(r"\s*\|?\s*:?-+:?\s*(?:\|\s*:?-+:?\s*)*\|?\s*")
+_DEFINITION_PATTERN = re.compile(r"\[[^\]]*\]:")
+# Starts of block constructs the outline scan does not model
+_UNSUPPORTED_STARTS = ("```", "~~~", ">", "<")
+
+
+class UnsupportedOutline(Exception):
+    """The text uses markdown the outline scan does not model."""
+
+
+class _OpenItem:
+    __slots__ = ("block", "content_column")
+
+    def __init__(self, block: Block, content_column: int):
+        self.block = block
+        self.content_column = content_column
+
+
+def _indentation(line: str) -> tuple[int, int]:
+    """Returns (column, length) of the leading whitespace, expanding tabs."""
+    length = len(line) - len(line.lstrip(" \t"))
+    column = 0
+    for char in line[:length]:
+        column += 1 if char == " " else TAB_SIZE - column % TAB_SIZE
+    return column, length
+
+
+def _check_supported(text: str) -> None:
+    if (
+        text.startswith(_UNSUPPORTED_STARTS)
+        or _THEMATIC_BREAK_PATTERN.match(text)
+        or _SETEXT_UNDERLINE_PATTERN.match(text)
+        or _ORDERED_MARKER_PATTERN.match(text)
+        or _DEFINITION_PATTERN.match(text)
+        # A link reference definition may continue its label on the next lines
+        or (text.startswith("[") and "]" not in text)
+    ):
+        raise UnsupportedOutline(text)
+
+
+def parse_outline(lines: List[str], offset: int = 0) -> tuple[List[Block], List[Block], List[int]]:
+    """
+    Builds the block tree of lines (split like str.splitlines). Returns the
+    root blocks, in document order the blocks that are list items (as
+    opposed to top-level paragraphs and headings), and the line each root
+    block starts on. Blocks get their content and span (shifted by offset
+    lines) only; properties and cleaned content are left to the caller.
+    """
+    root_blocks: List[Block] = []
+    root_starts: List[int] = []
+    items: List[Block] = []
+    # Open list items, outermost first
+    stack: List[_OpenItem] = []
+    # Lines of the paragraph that lazy continuation lines join, if any
+    paragraph: Optional[List[str]] = None
+    # The block that owns the open paragraph (None for paragraphs that are not kept)
+    paragraph_block: Optional[Block] = None
+
+    def close_paragraph(stop: int) -> None:
+        nonlocal paragraph, paragraph_block
+        if paragraph and paragraph[0].startswith("[") and "]:" in "\n".join(paragraph):
+            # Possibly a link reference definition whose label spans lines
+            raise UnsupportedOutline(paragraph[0])
+        if paragraph_block is not None and paragraph:
+            paragraph_block.content = "\n".join(paragraph)
+            paragraph_block.span = (paragraph_block.span[0], stop + offset)
+        paragraph = None
+        paragraph_block = None
+
+    last_text_line = -1
+    # mistletoe lets unindented text right below a heading in a list item continue the item
+    after_item_heading = False
+    for index, line in enumerate(lines):
+        column, length = _indentation(line)
+        text = line[length:].rstrip()
+        if not text:
+            close_paragraph(last_text_line + 1)
+            after_item_heading = False
+            continue
+        if index and "|" in lines[index - 1] and _TABLE_DELIMITER_PATTERN.fullmatch(line):
+            raise UnsupportedOutline(line)
+
+        # The innermost open item whose content this line is indented into
+        depth = len(stack)
+        while depth and stack[depth - 1].content_column > column:
+            depth -= 1
+        container_column = stack[depth - 1].content_column if depth else 0
+
+        if column - container_column >= 4:
+            # Indented code, unless it continues a paragraph
+            if paragraph is None or "\t" in line[:length]:
+                raise UnsupportedOutline(line)
+            if _BULLET_PATTERN.match(text) or _HEADING_PATTERN.match(text):
+                raise UnsupportedOutline(line)
+            _check_supported(text)
+            paragraph.append(text)
+            last_text_line = index
+            continue
+
+        bullet = _BULLET_PATTERN.match(text)
+        if bullet and not _THEMATIC_BREAK_PATTERN.match(text):
+            content = text[bullet.end() :]
+            spaces = bullet.end() - 1
+            if not content or spaces > 4 or "\t" in bullet.group():
+                # Empty items, indented code and tabs after the marker are left to mistletoe
+                raise UnsupportedOutline(line)
+            close_paragraph(last_text_line + 1)
+            del stack[depth:]
+
+            block = Block(content="", span=(index + offset, index + 1 + offset))
+            if stack:
+                append_child(stack[-1].block, block)
+            else:
+                root_blocks.append(block)
+                root_starts.append(index + offset)
+            items.append(block)
+            stack.append(_OpenItem(block, column + 1 + spaces))
+
+            after_item_heading = _HEADING_PATTERN.match(content) is not None
+            if after_item_heading:
+                # The item starts with a heading: like mistletoe, it has no paragraph content
+                block.span = None
+            else:
+                _check_supported(content)
+                if _BULLET_PATTERN.match(content):
+                    raise UnsupportedOutline(line)
+                paragraph = [content]
+                paragraph_block = block
+            last_text_line = index
+            continue
+
+        if _HEADING_PATTERN.match(text):
+            close_paragraph(last_text_line + 1)
+            del stack[depth:]
+            if not stack:
+                root_blocks.append(Block(content=line, span=(index + offset, index + 1 + offset)))
+                root_starts.append(index + offset)
+            after_item_heading = bool(stack)
+            last_text_line = index
+            continue
+
+        if paragraph is not None:
+            # Continuation line; lazy continuation is allowed at any indentation
+            _check_supported(text)
+            paragraph.append(text)
+            last_text_line = index
+            continue
+
+        _check_supported(text)
+        if after_item_heading and depth < len(stack):
+            raise UnsupportedOutline(line)
+        del stack[depth:]
+        if stack:
+            # A further paragraph of an item, which is not part of its content
+            paragraph = [text]
+            paragraph_block = None
+        else:
+            block = Block(content="", span=(index + offset, index + 1 + offset))
+            root_blocks.append(block)
+            root_starts.append(index + offset)
+            paragraph = [text]
+            paragraph_block = block
+        last_text_line = index
+
+    close_paragraph(last_text_line + 1)
+    return root_blocks, items, root_starts
@@ -0,0 +1,212 @@
+import hashlib
+import marshal
+import os
+import sqlite3
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from logseq_converter.logseq.models import Block, BlockLink, Property
+from logseq_converter.logseq.parser import PARSER_VERSION
+from logseq_converter.logseq.properties import property_map
+from logseq_converter.logseq.walk import unflatten_tree, walk
+from logseq_converter.utils import get_cache_dir, log_warning
+
+DEFAULT_PARSE_CACHE_MB = 256
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS trees (
+    key BLOB PRIMARY KEY,
+    tree BLOB NOT NULL,
+    last_used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS trees_by_last_used ON trees (last_used);
+"""
+
+# Part of every key, together with the parser version and marshal format
+_FORMAT = 2
+
+
+def encode_blocks(blocks: List[Block]) -> bytes:
+    """
+    Serialises a block tree: one flat record per block in pre-order, ending
+    with its number of children, marshalled and compressed. Properties are
+    stored as their tokens; the properties mapping is rebuilt from them.
+    """
+    records = []
+    for block, _ in walk(blocks):
+        tokens = tuple((token.key, token.value, token.span) for token in block.property_tokens)
+        links = tuple((link.caption, link.target, link.span) for link in block.links)
+        records.append(
+            (block.content, block.cleaned_content, block.id, tokens, block.span, links, len(block.children))
+        )
+    return zlib.compress(marshal.dumps((len(blocks), records)), 1)
+
+
+def decode_blocks(data: bytes) -> List[Block]:
+    """Rebuilds the block tree written by encode_blocks."""
+    root_count, records = marshal.loads(zlib.decompress(data))
+    flat = []
+    for content, cleaned_content, block_id, tokens, span, links, child_count in records:
+        block = Block(content=content, id=block_id, cleaned_content=cleaned_content, span=span)
+        if tokens:
+            block.property_tokens = [Property(key, value, token_span) for key, value, token_span in tokens]
+            properties = property_map(block.property_tokens)
+            if properties:
+                block.properties = properties
+        if links:
+            block.links = [BlockLink(caption, target, link_span) for caption, target, link_span in links]
+        flat.append((block, child_count))
+
+    # Every block but the roots fills one child slot of its parent
+    if sum(child_count for _, child_count in flat) != len(flat) - root_count:
+        raise ValueError("Truncated block tree")
+    roots = unflatten_tree(flat)
+    if len(roots) != root_count:
+        raise ValueError("Truncated block tree")
+    return roots
+
+
+@dataclass
+class ParseCacheUpdates:
+    """What a ParseCache in a worker process found and parsed, for the main process's cache to save."""
+
+    trees: Dict[bytes, bytes]
+    used: Set[bytes]
+    hits: int
+    misses: int
+
+
+class ParseCache:
+    """
+    On-disk cache of parsed block trees, keyed by a hash of the file content,
+    the parser backend and the parser version, so unchanged files skip
+    parsing on the next run.
+    Trees are stored with encode_blocks in an SQLite store shared by all
+    graphs. New trees and access times are kept in memory until save(),
+    which also evicts the least recently used trees beyond max_bytes.
+    """
+
+    def __init__(self, db_path: Path, max_bytes: int):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self._pending: Dict[bytes, bytes] = {}  # key -> encoded tree, not yet written
+        self._used: Set[bytes] = set()
+        self.hits = 0
+        self.misses = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            if db_path.exists():
+                self._conn = sqlite3.connect(db_path)
+                self._conn.executescript(SCHEMA)
+        except sqlite3.Error as e:
+            log_warning(f"Ignoring unreadable parse cache '{db_path}': {e}")
+            self._close()
+
+    @staticmethod
+    def key(content: str, backend: str) -> bytes:
+        digest = hashlib.sha256(f"{_FORMAT}:{PARSER_VERSION}:{backend}:{marshal.version}\0".encode("utf-8"))
+        digest.update(content.encode("utf-8"))
+        return digest.digest()
+
+    def get(self, content: str, backend: str) -> Optional[List[Block]]:
+        """The block tree the backend built from content, or None if it has not been cached."""
+        key = self.key(content, backend)
+        data = self._pending.get(key)
+        if data is None and self._conn is not None:
+            try:
+                row = self._conn.execute("SELECT tree FROM trees WHERE key = ?", (key,)).fetchone()
+            except sqlite3.Error as e:
+                log_warning(f"Ignoring unreadable parse cache '{self.db_path}': {e}")
+                self._close()
+                row = None
+            data = row[0] if row else None
+
+        if data is not None:
+            try:
+                blocks = decode_blocks(data)
+            except (ValueError, TypeError, IndexError, EOFError, zlib.error):
+                # Written by an incompatible build; parse again and replace it
+                blocks = None
+            if blocks is not None:
+                self._used.add(key)
+                self.hits += 1
+                return blocks
+
+        self.misses += 1
+        return None
+
+    def put(self, content: str, backend: str, blocks: List[Block]) -> None:
+        key = self.key(content, backend)
+        self._pending[key] = encode_blocks(blocks)
+        self._used.add(key)
+
+    def take_updates(self) -> ParseCacheUpdates:
+        """Hands over the unsaved trees, access times and counters, leaving none here."""
+        updates = ParseCacheUpdates(self._pending, self._used, self.hits, self.misses)
+        self._pending = {}
+        self._used = set()
+        self.hits = self.misses = 0
+        return updates
+
+    def add_updates(self, updates: ParseCacheUpdates) -> None:
+        """Takes on updates from another cache, to be written by the next save()."""
+        self._pending.update(updates.trees)
+        self._used.update(updates.used)
+        self.hits += updates.hits
+        self.misses += updates.misses
+
+    def save(self) -> None:
+        """Writes new trees and access times, then evicts trees beyond max_bytes."""
+        if not self._pending and not self._used:
+            return
+
+        now = time.time_ns()
+        try:
+            if self._conn is None:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(self.db_path)
+                self._conn.executescript(SCHEMA)
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO trees (key, tree, last_used) VALUES (?, ?, ?)",
+                    [(key, data, now) for key, data in self._pending.items()],
+                )
+                self._conn.executemany(
+                    "UPDATE trees SET last_used = ? WHERE key = ?",
+                    [(now, key) for key in self._used - self._pending.keys()],
+                )
+                self._evict()
+        except sqlite3.Error as e:
+            log_warning(f"Failed to save parse cache '{self.db_path}': {e}")
+            return
+
+        self._pending.clear()
+        self._used.clear()
+
+    def _evict(self) -> None:
+        total = 0
+        evicted = []
+        rows = self._conn.execute("SELECT key, length(tree) FROM trees ORDER BY last_used DESC")
+        for key, size in rows:
+            total += size
+            if total > self.max_bytes:
+                evicted.append((key,))
+        self._conn.executemany("DELETE FROM trees WHERE key = ?", evicted)
+
+    def close(self) -> None:
+        self.save()
+        self._close()
+
+    def _close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+        self._conn = None
+
+
+def open_parse_cache(max_mb: int = DEFAULT_PARSE_CACHE_MB, env: Optional[dict] = None) -> ParseCache:
+    """Opens the parse cache in the converter's cache directory."""
+    cache_dir = get_cache_dir(env if env is not None else os.environ)
+    return ParseCache(cache_dir / "parse_cache.sqlite3", max_mb * 1024 * 1024)
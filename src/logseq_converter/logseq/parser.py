@@ -1,16 +1,83 @@
 import re
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Union
 
-from mistletoe import Document
+from mistletoe import Document, token
 from mistletoe.block_token import BlockToken, ListItem, Paragraph
 from mistletoe.block_token import List as MistletoeList
-from mistletoe.markdown_renderer import MarkdownRenderer
-from mistletoe.span_token import LineBreak, Link, RawText
-
-from logseq_converter.logseq.models import Block, ContentItem, Journal, LinkItem, Page
+from mistletoe.span_token import LineBreak, Link, RawText, tokenize_inner
+
+from logseq_converter.logseq.models import Block, BlockLink, ContentItem, Journal, JournalSection, LinkItem, Page
+from logseq_converter.logseq.outline import UnsupportedOutline, parse_outline
+from logseq_converter.logseq.properties import (
+    BLOCK_ID_PATTERN,
+    find_block_id,
+    lex_properties,
+    property_map,
+    remove_properties,
+)
+from logseq_converter.logseq.stream import top_level_chunks
+from logseq_converter.logseq.walk import map_tree, walk
 from logseq_converter.utils import parse_journal_date
 
+if TYPE_CHECKING:
+    from logseq_converter.logseq.parse_cache import ParseCache
+
+# Bullet or ordered-list marker at the start of a list item's first line
+LIST_MARKER_PATTERN = re.compile(r"(?:[-*+]|\d{1,9}[.)])(?:[ \t]+|$)")
+# "mistletoe" runs a full CommonMark parse; "fast" scans the outline natively and
+# falls back to mistletoe for pages using markdown the scan does not model
+PARSER_BACKENDS = ("mistletoe", "fast")
+DEFAULT_PARSER_BACKEND = "mistletoe"
+# Bump whenever the block trees built from the same text change; keys the parse cache
+PARSER_VERSION = 3
+
+# A top-level line starting a journal section, e.g. "- #links" or "## #learnings"
+SECTION_HEADER_PATTERN = re.compile(
+    r"^(?:-\s+)?(#{1,6}\s+)?(#links|#learnings|#achievements|#highlights)\s*$", re.IGNORECASE
+)
+# Where a heading section ends, and where a bulleted one does
+_HEADING_LINE_PATTERN = re.compile(r"#{1,6}\s+")
+_BULLET_LINE_PATTERN = re.compile(r"[-*][^\S\n]")
+
+_EMPTY_DOCUMENT = Document("")
+
+
+def _locate_link(content: str, target: str, start: int) -> Optional[tuple[int, int]]:
+    """
+    Finds the [caption](target) markup of an inline link in content at or
+    after start. Returns its [start, end) character range, or None.
+    """
+    position = content.find("](", start)
+    while position != -1:
+        rest = content[position + 2 :].lstrip()
+        if rest.startswith(target) or rest.startswith("<" + target):
+            end = content.find(")", len(content) - len(rest) + len(target))
+            # Walk back to the bracket that opens the caption
+            depth = 0
+            for begin in range(position - 1, start - 1, -1):
+                char = content[begin]
+                if begin and content[begin - 1] == "\\":
+                    continue
+                if char == "]":
+                    depth += 1
+                elif char == "[":
+                    if depth == 0:
+                        return (begin, end + 1) if end != -1 else None
+                    depth -= 1
+            return None
+        position = content.find("](", position + 2)
+    return None
+
+
+def _paragraph_line(line: str) -> str:
+    """
+    A paragraph line without indentation (spaces and tabs, as in CommonMark and
+    the outline scan) and trailing whitespace.
+    """
+    return line.lstrip(" \t").rstrip()
+
 
 class BlockReferenceScanner:
     def __init__(self):
@@ -26,18 +93,37 @@ class BlockReferenceScanner:
         with open(file_path, "r", encoding="utf-8") as f:
             content = f.read()
 
+        self.scan_content(file_path, content)
+
+    def scan_content(self, file_path: Path, content: str) -> None:
+        """
+        Scans already-read file content for block IDs and updates the map.
+        """
         # Regex for id:: uuid
         # It usually appears on its own line or at end of line?
         # LogSeq: `id:: 638...`
-        matches = re.findall(r"id::\s*([a-fA-F0-9-]{36})", content)
+        matches = BLOCK_ID_PATTERN.findall(content)
         for block_id in matches:
             self.block_map[block_id] = file_path
 
+    def needs_scan(self, file_path: Path) -> bool:
+        """
+        Whether the file has to be read and scanned. Always true here;
+        persistent indexes skip files they have already seen unchanged.
+        """
+        return True
+
     def get_file_for_block(self, block_id: str) -> Optional[Path]:
         return self.block_map.get(block_id)
 
 
 class LogSeqParser:
+    def __init__(self, backend: str = DEFAULT_PARSER_BACKEND, cache: Optional["ParseCache"] = None):
+        if backend not in PARSER_BACKENDS:
+            raise ValueError(f"Unknown parser backend '{backend}', expected one of: {', '.join(PARSER_BACKENDS)}")
+        self.backend = backend
+        self.cache = cache
+
     def parse(self, file_path: Path) -> Union[Page, Journal, None]:
         if not file_path.exists():
             return None
@@ -48,15 +134,104 @@ class LogSeqParser:
         from logseq_converter.utils import trim_empty_bullets
         content = trim_empty_bullets(content)
 
-        blocks = self._parse_blocks(content)
+        # The block tree is only built when a caller first reads .blocks
+        block_loader = partial(self._parse_blocks if self.cache is None else self._cached_blocks, content)
 
         filename = file_path.name
         journal_date = parse_journal_date(filename)
 
         if journal_date:
-            return Journal(filename=filename, date=journal_date, content=content, blocks=blocks)
+            return Journal(filename=filename, date=journal_date, content=content, block_loader=block_loader)
         else:
-            return Page(filename=filename, content=content, blocks=blocks)
+            return Page(filename=filename, content=content, block_loader=block_loader)
+
+    def parse_streaming(self, file_path: Path) -> Optional[tuple[Union[Page, Journal], Iterator[Block]]]:
+        """
+        Like parse, for pages too large to hold in memory with their syntax
+        tree: returns the Page or Journal without its content or blocks, and
+        an iterator over its root blocks. The file is read line by line and
+        parsed one top-level block at a time (see logseq.stream), so only one
+        root block's text and tree are in memory at once. The blocks match
+        parse(file_path).blocks, except that link reference definitions only
+        apply within their own top-level block. The parse cache is not used.
+        """
+        if not file_path.exists():
+            return None
+
+        filename = file_path.name
+        journal_date = parse_journal_date(filename)
+        if journal_date:
+            page = Journal(filename=filename, date=journal_date, content="")
+        else:
+            page = Page(filename=filename, content="")
+        return page, self._stream_blocks(file_path)
+
+    def _stream_blocks(self, file_path: Path) -> Iterator[Block]:
+        with open(file_path, "r", encoding="utf-8") as f:
+            for chunk, offset in top_level_chunks(f):
+                yield from self._parse_body(chunk, offset)
+
+    def split_sections(self, content: str) -> tuple[str, List[JournalSection]]:
+        """
+        Takes the #links, #learnings, #achievements and #highlights sections
+        out of a journal. A section starts at a top-level line holding just the
+        tag, bulleted or as a heading. A heading section runs to the next
+        top-level heading, and its items are the top-level blocks in between.
+        A bulleted section runs to the next top-level bullet, and its items are
+        its block's children; headings, rules or paragraphs in between are
+        dropped with it.
+        content is parsed once, and not at all without a section. Returns the
+        content without the sections' lines, and the sections.
+        """
+        lines = content.splitlines(keepends=True)
+        if not any(SECTION_HEADER_PATTERN.match(line) for line in lines):
+            return content, []
+
+        frontmatter, body = self._extract_frontmatter(content)
+        offset = frontmatter.count("\n") + 1 if frontmatter else 0
+        roots = self._parse_roots(body, offset)
+        # Each root block's lines run to where the next one starts
+        starts = [start for _, start in roots] + [len(lines)]
+
+        sections: List[JournalSection] = []
+        removed: List[tuple[int, int]] = []
+        index = 0
+        while index < len(roots):
+            block, start = roots[index]
+            index += 1
+            header = SECTION_HEADER_PATTERN.match(lines[start])
+            if header is None:
+                continue
+
+            is_heading = _HEADING_LINE_PATTERN.match(lines[start]) is not None
+            end_pattern = _HEADING_LINE_PATTERN if is_heading else _BULLET_LINE_PATTERN
+            items = [] if is_heading else list(block.children)
+            while index < len(roots) and not end_pattern.match(lines[starts[index]]):
+                # Anything else up to the section's end goes with it; only a heading section's are items
+                if is_heading:
+                    items.append(roots[index][0])
+                index += 1
+            sections.append(JournalSection(name=header.group(2).lower(), blocks=items))
+            removed.append((start, starts[index]))
+
+        kept = []
+        position = 0
+        for start, stop in removed:
+            kept.extend(lines[position:start])
+            position = stop
+        kept.extend(lines[position:])
+        remaining = "".join(kept)
+        if position >= len(lines) and remaining.endswith("\n"):
+            # A section running to the end takes the line break before it along
+            remaining = remaining[:-1]
+        return remaining, sections
+
+    def _cached_blocks(self, content: str) -> List[Block]:
+        blocks = self.cache.get(content, self.backend)
+        if blocks is None:
+            blocks = self._parse_blocks(content)
+            self.cache.put(content, self.backend, blocks)
+        return blocks
 
     def extract_link_items(self, journal: Journal) -> List[LinkItem]:
         link_items: List[LinkItem] = []
@@ -94,24 +269,17 @@ class LogSeqParser:
         return ContentItem(type=item_type, description=description, sub_items=sub_items)
 
     def _flatten_block_content_with_indent(self, blocks: List[Block], depth: int = 0) -> List[str]:
-        """Recursively flatten block hierarchy with indentation preserved."""
-        result = []
-        indent = "  " * depth  # 2 spaces per level
-        for block in blocks:
-            result.append(f"{indent}- {block.cleaned_content.strip()}")
-            if block.children:
-                result.extend(self._flatten_block_content_with_indent(block.children, depth + 1))
-        return result
+        """Flatten block hierarchy with indentation preserved."""
+        # 2 spaces per level
+        return [f"{'  ' * (depth + level)}- {block.cleaned_content.strip()}" for block, level in walk(blocks)]
 
     def _parse_link_item(self, block: Block) -> Optional[LinkItem]:
-        # Get the link token that was stored during parsing
-        link_token = getattr(block, "_link_token", None)
-        if not link_token:
+        # The first link recorded during parsing is the item's link
+        if not block.links:
             return None
 
-        # Extract caption from link children
-        caption = self._extract_text_from_token(link_token)
-        url = link_token.target
+        caption = block.links[0].caption
+        url = block.links[0].target
 
         # Look for a link named "GitHub" (case-insensitive) in the top-level item
         github_url = self._find_github_link_url(block)
@@ -131,20 +299,6 @@ class LogSeqParser:
             sub_items=sub_items,
         )
 
-    def _find_first_link(self, token) -> Optional[Link]:
-        """Recursively search for the first Link token in the AST."""
-        if isinstance(token, Link):
-            return token
-
-        children = getattr(token, "children", None)
-        if children is not None:
-            for child in children:
-                result = self._find_first_link(child)
-                if result:
-                    return result
-
-        return None
-
     def _find_all_links(self, token) -> List[Link]:
         """Recursively find all Link tokens in the AST."""
         links = []
@@ -159,20 +313,25 @@ class LogSeqParser:
         return links
 
     def _find_github_link_url(self, block: Block) -> Optional[str]:
-        """Find a link with caption 'GitHub' (case-insensitive) in the block content."""
-        # Parse the block content to find all links
-        doc = Document(block.content)
-
-        for child in doc.children:
-            if isinstance(child, Paragraph):
-                all_links = self._find_all_links(child)
-                for link in all_links:
-                    caption = self._extract_text_from_token(link).strip()
-                    if caption.lower() == "github":
-                        return link.target
+        """Find a link with caption 'GitHub' (case-insensitive) among the block's links."""
+        for link in block.links:
+            if link.caption.strip().lower() == "github":
+                return link.target
 
         return None
 
+    def _collect_links(self, tokens: list, content: str) -> List[BlockLink]:
+        """Records every link in the span tokens of a block's content, in order."""
+        links: List[BlockLink] = []
+        cursor = 0
+        for span_token in tokens:
+            for link in self._find_all_links(span_token):
+                span = _locate_link(content, link.target, cursor)
+                if span is not None:
+                    cursor = span[1]
+                links.append(BlockLink(caption=self._extract_text_from_token(link), target=link.target, span=span))
+        return links
+
     def _extract_frontmatter(self, content: str) -> tuple[str, str]:
         """Extract frontmatter from content. Returns (frontmatter, body)."""
         lines = content.split("\n")
@@ -190,67 +349,187 @@ class LogSeqParser:
         return "", content
 
     def _parse_blocks(self, content: str) -> List[Block]:
-        """Parse LogSeq blocks using mistletoe for markdown list structure."""
+        """
+        Parse LogSeq blocks using mistletoe for markdown list structure. Block
+        content is sliced from the source lines the tokens came from, so the
+        author's formatting is kept as written.
+        """
         # Extract and skip frontmatter for parsing
         frontmatter, body = self._extract_frontmatter(content)
+        # mistletoe numbers lines from 1 within the body; spans count from the start of content
+        offset = frontmatter.count("\n") + 1 if frontmatter else 0
+        return self._parse_body(body, offset)
+
+    def _parse_body(self, body: str, offset: int) -> List[Block]:
+        """Parses markdown without frontmatter; spans are shifted by offset lines."""
+        return [block for block, _ in self._parse_roots(body, offset)]
+
+    def _parse_roots(self, body: str, offset: int) -> List[tuple[Block, int]]:
+        """
+        Like _parse_body, with the line each root block starts on (for a list
+        item, the line of its marker, which its span may not include).
+        """
+        # Split the way mistletoe does so its line numbers index this list
+        lines = body.splitlines()
+        if self.backend == "fast":
+            try:
+                blocks, items, starts = parse_outline(lines, offset)
+                return list(zip(self._finish_outline_blocks(blocks, items), starts, strict=True))
+            except UnsupportedOutline:
+                pass
 
         doc = Document(body)
-        root_blocks: List[Block] = []
+        root_blocks: List[tuple[Block, int]] = []
 
         # Process all children
-        for child in doc.children:
+        for index, child in enumerate(doc.children):
+            end = self._next_line_number(doc.children, index, len(lines) + 1)
             if isinstance(child, MistletoeList):
                 # Process each top-level list item as a root block
-                for list_item in child.children:
-                    block = self._parse_list_item(list_item)
+                for item_index, list_item in enumerate(child.children):
+                    item_end = self._next_line_number(child.children, item_index, end)
+                    block = self._parse_list_item(list_item, lines, item_end, offset)
                     if block:
-                        root_blocks.append(block)
+                        root_blocks.append((block, list_item.line_number - 1 + offset))
             elif isinstance(child, BlockToken):
                 # Handle any other block-level content (Heading, Paragraph, etc.)
-                content_text = self._extract_markdown_from_block_token(child)
+                start, stop = self._token_span(lines, child.line_number, end)
+                if isinstance(child, Paragraph):
+                    content_text = "\n".join(_paragraph_line(line) for line in lines[start:stop])
+                else:
+                    content_text = "\n".join(lines[start:stop])
                 if content_text.strip():
-                    cleaned_content = self._clean_content(content_text)
-                    block = Block(content=content_text, cleaned_content=cleaned_content)
+                    block = Block(content=content_text, span=(start + offset, stop + offset))
                     self._parse_properties(content_text, block)
-                    root_blocks.append(block)
+                    root_blocks.append((block, start + offset))
 
         return root_blocks
 
-    def _parse_list_item(self, list_item: ListItem) -> Optional[Block]:
-        """Convert a mistletoe ListItem to a LogSeq Block."""
+    def _finish_outline_blocks(self, blocks: List[Block], items: List[Block]) -> List[Block]:
+        """Fills in what the outline scan leaves out: cleaned content, properties, ids and links."""
+        # Identity, not equality: comparing blocks would walk whole subtrees
+        item_ids = {id(block) for block in items}
+        for block in blocks:
+            if block.span is not None and id(block) not in item_ids:
+                # Top-level paragraphs and headings
+                self._parse_properties(block.content, block)
+
+        for block in items:
+            content = block.content
+            self._parse_properties(content, block)
+            # Without link reference definitions (the scan rejects them) only inline links exist
+            if "](" in content:
+                links = self._collect_links(self._tokenize_inline(content), content)
+                if links:
+                    block.links = links
+        return blocks
+
+    @staticmethod
+    def _tokenize_inline(content: str) -> list:
+        """Tokenizes paragraph text outside a Document, which mistletoe normally requires."""
+        # Span tokens look up reference links in the document being parsed; give them an empty one
+        previous_root = token._root_node
+        token._root_node = _EMPTY_DOCUMENT
+        try:
+            return tokenize_inner(content)
+        finally:
+            token._root_node = previous_root
+
+    @staticmethod
+    def _next_line_number(tokens: list, index: int, end: int) -> int:
+        """Line number where the token after tokens[index] starts, or end for the last one."""
+        if index + 1 < len(tokens):
+            return tokens[index + 1].line_number
+        return end
+
+    @staticmethod
+    def _token_span(lines: List[str], line_number: int, end: int) -> tuple[int, int]:
+        """
+        Zero-based [start, stop) line range of a token that starts on
+        line_number and ends before the 1-based line end, without the blank
+        lines separating it from the next token.
+        """
+        start = line_number - 1
+        stop = min(end - 1, len(lines))
+        while stop > start and not lines[stop - 1].strip():
+            stop -= 1
+        return start, stop
+
+    def _parse_list_item(self, list_item: ListItem, lines: List[str], end: int, offset: int = 0) -> Optional[Block]:
+        """
+        Convert a mistletoe ListItem and the items nested in it to a LogSeq
+        Block tree. end is the 1-based line number where the next item (or the
+        enclosing block) begins.
+        """
+        blocks = map_tree(
+            [(list_item, end)],
+            partial(self._list_item_block, lines=lines, offset=offset),
+            children=self._nested_list_items,
+        )
+        return blocks[0] if blocks else None
+
+    def _nested_list_items(self, entry: tuple[ListItem, int]) -> List[tuple[ListItem, int]]:
+        """The items of the lists nested in a list item, each with the line number where it ends."""
+        list_item, end = entry
+        nested = []
+        for index, child in enumerate(list_item.children[1:], start=1):
+            if isinstance(child, MistletoeList):
+                child_end = self._next_line_number(list_item.children, index, end)
+                for item_index, nested_item in enumerate(child.children):
+                    nested.append((nested_item, self._next_line_number(child.children, item_index, child_end)))
+        return nested
+
+    def _list_item_block(self, entry: tuple[ListItem, int], lines: List[str], offset: int) -> Optional[Block]:
+        """The Block for a list item's own content, without its children."""
+        list_item, end = entry
         if not list_item.children:
             return None
 
         # Extract the content from the first paragraph
         first_child = list_item.children[0]
+        span = None
         if isinstance(first_child, Paragraph):
-            # Get the markdown content preserving formatting
-            content = self._extract_markdown_from_paragraph(first_child)
-            # Store any link token found in this paragraph for later extraction
-            link_token = self._find_first_link(first_child)
+            paragraph_end = self._next_line_number(list_item.children, 0, end)
+            span, content = self._slice_paragraph(lines, first_child.line_number, paragraph_end)
+            links = self._collect_links(first_child.children, content)
         else:
             content = ""
-            link_token = None
+            links = []
 
         # Create the block
-        cleaned_content = self._clean_content(content)
-        block = Block(content=content, cleaned_content=cleaned_content)
+        block = Block(content=content)
+        if span is not None:
+            block.span = (span[0] + offset, span[1] + offset)
         self._parse_properties(content, block)
-
-        # Store the link token as a private attribute for later use
-        if link_token:
-            block._link_token = link_token
-
-        # Process nested lists as children
-        for child in list_item.children[1:]:
-            if isinstance(child, MistletoeList):
-                for nested_item in child.children:
-                    nested_block = self._parse_list_item(nested_item)
-                    if nested_block:
-                        block.children.append(nested_block)
+        if links:
+            block.links = links
 
         return block
 
+    def _slice_paragraph(self, lines: List[str], line_number: int, end: int) -> tuple[tuple[int, int], str]:
+        """
+        Returns the [start, stop) line span and the text of a list item's first
+        paragraph: its source lines without indentation and list marker. The
+        text is otherwise kept as written, entities such as &amp; included.
+        """
+        start, stop = self._token_span(lines, line_number, end)
+        marker_line = start
+        paragraph_lines = []
+        for index in range(marker_line, stop):
+            text = _paragraph_line(lines[index])
+            if index == marker_line:
+                text = LIST_MARKER_PATTERN.sub("", text, count=1)
+                if not text:
+                    # The marker sits alone on its line and the text starts below it
+                    start += 1
+                    continue
+            elif not text:
+                # A blank line always ends a paragraph
+                stop = index
+                break
+            paragraph_lines.append(text)
+        return (start, stop), "\n".join(paragraph_lines)
+
     def _extract_text_from_token(self, token) -> str:
         """Extract plain text content from any token, recursively."""
         if isinstance(token, RawText):
@@ -265,48 +544,14 @@ class LogSeqParser:
 
         return ""
 
-    def _extract_markdown_from_block_token(self, block_token: BlockToken) -> str:
-        """Extract markdown content from any block token."""
-        with MarkdownRenderer() as renderer:
-            rendered = renderer.render(block_token)
-            # Remove trailing newline added by renderer
-            if rendered and rendered.endswith("\n"):
-                rendered = rendered[:-1]
-            return rendered
-
-    def _extract_markdown_from_paragraph(self, paragraph: Paragraph) -> str:
-        """Extract markdown content from a Paragraph token."""
-        with MarkdownRenderer() as renderer:
-            # Render just the children (span tokens) preserving markdown
-            parts = []
-            for child in paragraph.children:
-                if isinstance(child, LineBreak):
-                    # Preserve line breaks as newlines
-                    parts.append("\n")
-                else:
-                    rendered = renderer.render(child)
-                    # Remove trailing newline added by renderer
-                    if rendered and rendered.endswith("\n"):
-                        rendered = rendered[:-1]
-                    parts.append(rendered)
-            return "".join(parts)
-
     def _parse_properties(self, text: str, block: Block) -> None:
-        # Regex for key:: value
-        # Check for id:: specifically for the block ID
-        id_match = re.search(r"id::\s*([a-fA-F0-9-]{36})", text)
-        if id_match:
-            block.id = id_match.group(1)
-
-        # General properties
-        props = re.findall(r"([a-zA-Z0-9_-]+)::\s*(.+)", text)
-        for key, value in props:
-            if key == "id":
-                continue
-            block.properties[key] = value.strip()
-
-    def _clean_content(self, content: str) -> str:
-        """Remove Logseq properties from content."""
-        # Remove properties (key:: value)
-        cleaned = re.sub(r"[a-zA-Z0-9_-]+::\s*.+", "", content)
-        return cleaned.strip()
+        """Sets the properties, id and cleaned content (text without properties) of block."""
+        tokens = lex_properties(text)
+        block.cleaned_content = remove_properties(text, tokens).strip()
+        if not tokens:
+            return
+        block.property_tokens = tokens
+        block.id = find_block_id(text)
+        properties = property_map(tokens)
+        if properties:
+            block.properties = properties
@@ -0,0 +1,146 @@
+"""
+Lexer for LogSeq properties.
+
+Blocks carry "key:: value" properties; pages may also start with YAML
+frontmatter ("key: value" lines between "---" lines). Both are tokenised here
+into Property tokens that record the key, the value as written and the span
+of the property, so the parser and the converters read them from one place
+instead of each matching its own regex.
+"""
+import re
+import sys
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from logseq_converter.logseq.models import Property
+
+# key:: value anywhere in block text; the value runs to the end of its line
+PROPERTY_PATTERN = re.compile(r"([a-zA-Z0-9_-]+)::\s*(.+)")
+# A line holding nothing but a key:: value property
+PROPERTY_LINE_PATTERN = re.compile(r"^\s*([a-zA-Z0-9_-]+)::\s*(.+)$")
+# A key: value line inside YAML frontmatter
+YAML_PROPERTY_PATTERN = re.compile(r"^\s*([a-zA-Z0-9_-]+):\s*(.*)$")
+FRONTMATTER_DELIMITER = "---"
+# id:: uuid anywhere in text, also after another property on the same line
+BLOCK_ID_PATTERN = re.compile(r"id::\s*([a-fA-F0-9-]{36})")
+
+_LIST_ITEM_PATTERN = re.compile(r"(?:\[\[[^\[\]]*\]\]|[^,])+")
+_PAGE_REF_PATTERN = re.compile(r"#?\[\[([^\[\]]+)\]\]|#([\w-]+)")
+
+
+@dataclass
+class PageHeader:
+    """The properties at the top of a page, as read by lex_page_header."""
+
+    # Tokens of the YAML frontmatter, or None if the page has none (spans are within each line)
+    frontmatter: Optional[List[Property]]
+    # key:: value lines after the frontmatter, before the first other non-blank line
+    properties: List[Property]
+    # Index of the first line after the frontmatter and the properties
+    body_start: int
+
+
+def lex_properties(text: str) -> List[Property]:
+    """Every key:: value in block text, with spans into text."""
+    if "::" not in text:
+        return []
+    return [Property(match.group(1), match.group(2), match.span()) for match in PROPERTY_PATTERN.finditer(text)]
+
+
+def lex_property_line(line: str) -> Optional[Property]:
+    """The property on a line that holds only a key:: value, or None."""
+    match = PROPERTY_LINE_PATTERN.match(line)
+    if match is None:
+        return None
+    return Property(match.group(1), match.group(2), match.span())
+
+
+def lex_yaml_line(line: str) -> Optional[Property]:
+    """The key: value of a frontmatter line, or None."""
+    match = YAML_PROPERTY_PATTERN.match(line)
+    if match is None:
+        return None
+    return Property(match.group(1), match.group(2), match.span())
+
+
+def lex_page_header(lines: Sequence[str]) -> PageHeader:
+    """
+    Tokenises the YAML frontmatter at the start of lines, if it is closed, and
+    the key:: value lines (and blank lines) that follow it.
+    """
+    frontmatter = None
+    index = 0
+    if lines and lines[0].strip() == FRONTMATTER_DELIMITER:
+        tokens = []
+        for index in range(1, len(lines)):
+            if lines[index].strip() == FRONTMATTER_DELIMITER:
+                frontmatter = tokens
+                index += 1
+                break
+            token = lex_yaml_line(lines[index])
+            if token is not None:
+                tokens.append(token)
+        else:
+            # Unterminated frontmatter is left to the body
+            index = 0
+
+    properties = []
+    while index < len(lines):
+        token = lex_property_line(lines[index])
+        if token is not None:
+            properties.append(token)
+        elif lines[index].strip():
+            break
+        index += 1
+
+    return PageHeader(frontmatter=frontmatter, properties=properties, body_start=index)
+
+
+def property_map(tokens: Iterable[Property]) -> Dict[str, str]:
+    """Block properties by key, without id:: and with values stripped."""
+    # The same few keys repeat on every block; share one string per key
+    return {sys.intern(token.key): token.value.strip() for token in tokens if token.key != "id"}
+
+
+def find_block_id(text: str) -> Optional[str]:
+    """
+    The UUID of the first id:: property in block text. Matched with
+    BLOCK_ID_PATTERN, like the block-ID scan and the converters, rather than
+    from the lexed tokens, whose values run to the end of the line.
+    """
+    if "id::" not in text:
+        return None
+    match = BLOCK_ID_PATTERN.search(text)
+    return match.group(1) if match else None
+
+
+def remove_properties(text: str, tokens: Sequence[Property]) -> str:
+    """text without the spans of tokens."""
+    if not tokens:
+        return text
+    pieces = []
+    position = 0
+    for token in tokens:
+        start, end = token.span
+        pieces.append(text[position:start])
+        position = end
+    pieces.append(text[position:])
+    return "".join(pieces)
+
+
+def page_ref_names(value: str) -> List[str]:
+    """
+    The page names in a comma separated tags:: or alias:: value, as written
+    but without their [[ ]] or #.
+    """
+    names = []
+    for item in _split_list(value):
+        ref = _PAGE_REF_PATTERN.fullmatch(item)
+        names.append((ref.group(1) or ref.group(2)) if ref is not None else item)
+    return names
+
+
+def _split_list(text: str) -> List[str]:
+    # Commas inside [[...]] belong to the page name, as in [[Jan 5th, 2024]]
+    return [item.strip() for item in _LIST_ITEM_PATTERN.findall(text) if item.strip()]
+
@@ -0,0 +1,141 @@
+"""
+Splits a page read line by line into its top-level blocks.
+
+Very large pages (Readwise imports, PDF highlight pages) are parsed one
+top-level block at a time instead of as one document. A new chunk starts at
+each unindented bullet, unless a fenced code block or a raw HTML block that
+may contain such a line is still open; in that case the chunk grows until
+the next bullet after it closes. Lines are trimmed like trim_empty_bullets,
+so each chunk parses to the blocks the whole trimmed page would give.
+"""
+import re
+from itertools import chain
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+# A bullet at column 0 starts a top-level list item
+_ROOT_BULLET_PATTERN = re.compile(r"[-*+](?:[ \t]|$)")
+_THEMATIC_BREAK_PATTERN = re.compile(r"(?:(?:\*[ \t]*){3,}|(?:-[ \t]*){3,}|(?:_[ \t]*){3,})$")
+# Lines trim_empty_bullets drops at the start and end of a page
+_EMPTY_BULLET_PATTERN = re.compile(r"^\s*[-*]\s*$")
+_FENCE_PATTERN = re.compile(r"[ \t]*(`{3,}|~{3,})(.*)")
+# Raw HTML blocks that run until an end marker rather than a blank line
+_HTML_BLOCKS = (
+    (
+        re.compile(r"<(?:script|pre|style|textarea)(?:[\s>]|$)", re.IGNORECASE),
+        re.compile(r"</(?:script|pre|style|textarea)>", re.IGNORECASE),
+    ),
+    (re.compile(r"<!--"), re.compile(r"-->")),
+    (re.compile(r"<\?"), re.compile(r"\?>")),
+    (re.compile(r"<!\[CDATA\["), re.compile(r"\]\]>")),
+    (re.compile(r"<![A-Za-z]"), re.compile(r">")),
+)
+
+
+def _is_trimmable(line: str) -> bool:
+    return not line.strip() or _EMPTY_BULLET_PATTERN.match(line) is not None
+
+
+class _OpenConstructs:
+    """Tracks fenced code and raw HTML blocks that an unindented bullet might belong to."""
+
+    def __init__(self):
+        self.fence: Optional[str] = None
+        self.html_end: Optional[re.Pattern] = None
+
+    def is_open(self) -> bool:
+        return self.fence is not None or self.html_end is not None
+
+    def feed(self, line: str) -> None:
+        if self.fence is not None:
+            match = _FENCE_PATTERN.match(line)
+            if (
+                match
+                and match.group(1)[0] == self.fence[0]
+                and len(match.group(1)) >= len(self.fence)
+                and not match.group(2).strip()
+            ):
+                self.fence = None
+            return
+
+        if self.html_end is not None:
+            if self.html_end.search(line):
+                self.html_end = None
+            return
+
+        match = _FENCE_PATTERN.match(line)
+        if match and not (match.group(1)[0] == "`" and "`" in match.group(2)):
+            self.fence = match.group(1)
+            return
+
+        text = line.lstrip()
+        if text.startswith("<"):
+            for start, end in _HTML_BLOCKS:
+                found = start.match(text)
+                if found and not end.search(text, found.end()):
+                    self.html_end = end
+                    return
+
+
+def top_level_chunks(lines: Iterable[str]) -> Iterator[Tuple[str, int]]:
+    """
+    Yields (text, offset) for each chunk of lines (with or without their line
+    endings), where offset is the line number of the chunk's first line in
+    the trimmed page. Frontmatter is skipped but counted.
+    """
+    lines = (line.rstrip("\n") for line in lines)
+    first = next(lines, None)
+    if first is None:
+        return
+
+    offset = 0
+    body: Iterable[str] = chain([first], lines)
+    if first.strip() == "---":
+        frontmatter = [first]
+        for line in lines:
+            frontmatter.append(line)
+            if line.strip() == "---":
+                offset = len(frontmatter)
+                body = lines
+                break
+        else:
+            # Unterminated frontmatter is part of the body
+            body = frontmatter
+
+    body = iter(body)
+    # Leading empty lines and bullets are trimmed away
+    for line in body:
+        if not _is_trimmable(line):
+            body = chain([line], body)
+            break
+    else:
+        return
+
+    chunk: List[str] = []
+    # Empty lines and bullets seen last; dropped if nothing follows them
+    held: List[str] = []
+    constructs = _OpenConstructs()
+    for line in body:
+        if _is_trimmable(line):
+            held.append(line)
+            continue
+
+        if (
+            chunk
+            and _ROOT_BULLET_PATTERN.match(line)
+            and not _THEMATIC_BREAK_PATTERN.match(line)
+            and not constructs.is_open()
+        ):
+            text = "\n".join(chunk + held)
+            yield text, offset
+            # Counted the way the parser splits a whole page into lines
+            offset += len((text + "\n").splitlines())
+            chunk = []
+        else:
+            chunk.extend(held)
+        held = []
+
+        chunk.append(line)
+        constructs.feed(line)
+
+    if chunk:
+        yield "\n".join(chunk), offset
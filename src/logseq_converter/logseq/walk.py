@@ -0,0 +1,116 @@
+"""
+Explicit-stack traversal of block trees.
+
+Outlines can nest far deeper than Python's recursion limit, so code that
+walks or converts a tree uses these helpers instead of recursing. They work
+on anything with a children sequence: LogSeq blocks, Tana nodes, or other
+trees through the children argument.
+"""
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+Node = TypeVar("Node")
+Result = TypeVar("Result")
+
+
+def _children(node) -> Sequence:
+    return node.children
+
+
+def walk(
+    roots: Iterable[Node],
+    post_order: bool = False,
+    children: Callable[[Node], Sequence[Node]] = _children,
+) -> Iterator[Tuple[Node, int]]:
+    """
+    Yields (node, depth) for every node under roots, roots at depth 0.
+    Parents come before their children (pre-order) unless post_order is set;
+    siblings keep their order either way.
+    """
+    if not post_order:
+        stack = [(root, 0) for root in reversed(list(roots))]
+        while stack:
+            node, depth = stack.pop()
+            yield node, depth
+            stack.extend((child, depth + 1) for child in reversed(children(node)))
+        return
+
+    # Each node is pushed once to expand its children and once more to be yielded after them
+    post_stack = [(root, 0, False) for root in reversed(list(roots))]
+    while post_stack:
+        node, depth, expanded = post_stack.pop()
+        if expanded:
+            yield node, depth
+            continue
+        post_stack.append((node, depth, True))
+        post_stack.extend((child, depth + 1, False) for child in reversed(children(node)))
+
+
+def append_child(parent, child) -> None:
+    """Adds child to parent.children, replacing a shared empty default with a new list."""
+    if parent.children:
+        parent.children.append(child)
+    else:
+        parent.children = [child]
+
+
+def map_tree(
+    roots: Iterable[Node],
+    convert: Callable[[Node], Optional[Result]],
+    add_child: Callable[[Result, Result], None] = append_child,
+    children: Callable[[Node], Sequence[Node]] = _children,
+) -> List[Result]:
+    """
+    Converts the trees under roots and returns the converted roots. Nodes are
+    converted in pre-order, each converted child is handed to add_child with
+    its converted parent. When convert returns None the node and everything
+    below it are dropped.
+    """
+    results: List[Result] = []
+    stack: List[Tuple[Optional[Result], Node]] = [(None, root) for root in reversed(list(roots))]
+    while stack:
+        parent, node = stack.pop()
+        converted = convert(node)
+        if converted is None:
+            continue
+        if parent is None:
+            results.append(converted)
+        else:
+            add_child(parent, converted)
+        stack.extend((converted, child) for child in reversed(children(node)))
+    return results
+
+
+def flatten_tree(
+    roots: Iterable[Node], children: Callable[[Node], Sequence[Node]] = _children
+) -> List[Tuple[Node, int]]:
+    """
+    The trees under roots as pre-order (node, number of children) records,
+    with each node's children replaced by an empty list. The records pickle
+    without recursing, however deep the trees; unflatten_tree rebuilds them.
+    """
+    records = []
+    for node, _ in walk(roots, children=children):
+        records.append((node, len(children(node))))
+    for node, _ in records:
+        node.children = []
+    return records
+
+
+def unflatten_tree(
+    records: Iterable[Tuple[Node, int]], add_child: Callable[[Node, Node], None] = append_child
+) -> List[Node]:
+    """Rebuilds the roots of trees flattened by flatten_tree."""
+    roots: List[Node] = []
+    # Nodes still waiting for children, with how many are left
+    stack: List[Tuple[Node, int]] = []
+    for node, child_count in records:
+        if stack:
+            parent, remaining = stack.pop()
+            if remaining > 1:
+                stack.append((parent, remaining - 1))
+            add_child(parent, node)
+        else:
+            roots.append(node)
+        if child_count:
+            stack.append((node, child_count))
+    return roots
@@ -0,0 +1,230 @@
+"""
+Destination manifest used by incremental conversion.
+
+The manifest records, for every converted source file, its size, mtime and
+content hash together with the output files it produced and the source file
+each of its block references resolved to. Re-runs compare the source tree
+against it to convert only new or changed files, plus files whose block
+references moved to another file, and to delete the outputs of files that
+disappeared. Copied assets are recorded too, so copies of deleted assets can
+be removed.
+"""
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from logseq_converter.logseq.loader import SourceState
+from logseq_converter.utils import log_warning
+
+MANIFEST_FILENAME = ".logseq-converter-manifest.json"
+MANIFEST_FORMAT = 2
+
+
+def get_converter_version() -> str:
+    """Returns the installed package version, used to invalidate manifests across releases."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("logseq-converter")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def hash_options(options: dict) -> str:
+    """Stable hash of the options that influence conversion output."""
+    encoded = json.dumps(options, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass
+class ConvertedSource:
+    """A converted source: the state it was read in, the outputs written from it and the block ids it references."""
+
+    state: SourceState
+    outputs: List[str]
+    block_refs: List[str]
+
+
+@dataclass
+class ManifestEntry:
+    size: int
+    mtime_ns: int
+    sha256: str
+    outputs: List[str] = field(default_factory=list)
+    # Referenced block id -> relative path of the source defining it (None if unresolved)
+    references: Dict[str, Optional[str]] = field(default_factory=dict)
+
+
+class ConversionManifest:
+    def __init__(self, destination: Path, converter_version: str, options_hash: str):
+        self.destination = destination
+        self.path = destination / MANIFEST_FILENAME
+        self.converter_version = converter_version
+        self.options_hash = options_hash
+        self.entries: Dict[str, ManifestEntry] = {}
+        # Outputs recorded by a manifest written with another version or other options
+        self.invalidated_outputs: List[str] = []
+        # Copied assets, relative to the destination
+        self.assets: List[str] = []
+
+    @classmethod
+    def load(cls, destination: Path, converter_version: str, options_hash: str) -> "ConversionManifest":
+        """
+        Loads the manifest from the destination. A missing or unreadable manifest
+        yields an empty one; a manifest from another converter version or with
+        different options is discarded, but its outputs are kept in
+        invalidated_outputs so the caller can clean them up. Recorded assets
+        do not depend on the options and are kept either way.
+        """
+        manifest = cls(destination, converter_version, options_hash)
+        if not manifest.path.exists():
+            return manifest
+
+        try:
+            with open(manifest.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            entries = {rel: ManifestEntry(**entry) for rel, entry in data.get("sources", {}).items()}
+            assets = list(data.get("assets", []))
+        except Exception as e:
+            log_warning(f"Ignoring unreadable manifest '{manifest.path}': {e}")
+            return manifest
+
+        manifest.assets = assets
+        if (
+            data.get("format") != MANIFEST_FORMAT
+            or data.get("converter_version") != converter_version
+            or data.get("options_hash") != options_hash
+        ):
+            for entry in entries.values():
+                manifest.invalidated_outputs.extend(entry.outputs)
+            return manifest
+
+        manifest.entries = entries
+        return manifest
+
+    def save(self) -> None:
+        data = {
+            "format": MANIFEST_FORMAT,
+            "converter_version": self.converter_version,
+            "options_hash": self.options_hash,
+            "sources": {rel: asdict(entry) for rel, entry in sorted(self.entries.items())},
+            "assets": self.assets,
+        }
+        self.destination.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def is_unchanged(self, rel: str, path: Path) -> bool:
+        """
+        Checks a source against its recorded state. Size and mtime are compared
+        first; the content hash is only computed when they differ, so a touched
+        but identical file is still treated as unchanged.
+        """
+        entry = self.entries.get(rel)
+        if entry is None:
+            return False
+
+        stat = path.stat()
+        if stat.st_size == entry.size and stat.st_mtime_ns == entry.mtime_ns:
+            return True
+        if stat.st_size != entry.size:
+            return False
+
+        if hash_file(path) != entry.sha256:
+            return False
+
+        # Same content with a new mtime: refresh the stat so the next run skips hashing
+        entry.mtime_ns = stat.st_mtime_ns
+        return True
+
+    def plan(self, sources: Dict[str, Path]) -> tuple[List[str], List[str]]:
+        """
+        Compares the current sources (relative path -> absolute path) with the
+        manifest. Returns (changed_or_new, removed) relative paths, both sorted.
+        """
+        changed = sorted(rel for rel, path in sources.items() if not self.is_unchanged(rel, path))
+        removed = sorted(rel for rel in self.entries if rel not in sources)
+        return changed, removed
+
+    def stale_references(self, resolve: Callable[[str], Optional[str]]) -> List[str]:
+        """
+        Returns the sources (sorted) with a block reference that resolve, which
+        maps a block id to the relative path of its source, now answers
+        differently than when they were converted. Their outputs link to the
+        file holding each block, so they have to be reconverted.
+        """
+        return sorted(
+            rel
+            for rel, entry in self.entries.items()
+            if any(resolve(block_id) != target for block_id, target in entry.references.items())
+        )
+
+    def record(
+        self,
+        rel: str,
+        state: SourceState,
+        outputs: Iterable[str],
+        references: Optional[Dict[str, Optional[str]]] = None,
+    ) -> None:
+        """
+        Records a converted source. state is that of the text the outputs were
+        built from, so an edit saved during the conversion is still seen as a
+        change by the next run.
+        """
+        self.entries[rel] = ManifestEntry(
+            size=state.size,
+            mtime_ns=state.mtime_ns,
+            sha256=state.sha256,
+            outputs=sorted(set(outputs)),
+            references=dict(sorted((references or {}).items())),
+        )
+
+    def record_assets(self, assets: Iterable[str]) -> List[str]:
+        """Replaces the recorded assets and returns the previously recorded ones that are gone, sorted."""
+        current = sorted(set(assets))
+        removed = sorted(set(self.assets) - set(current))
+        self.assets = current
+        return removed
+
+    def forget(self, rel: str) -> List[str]:
+        """Drops a source from the manifest and returns the outputs it had produced."""
+        entry = self.entries.pop(rel, None)
+        return entry.outputs if entry else []
+
+    def outputs_for(self, rel: str) -> Optional[List[str]]:
+        entry = self.entries.get(rel)
+        return entry.outputs if entry else None
+
+
+def remove_outputs(destination: Path, outputs: Iterable[str]) -> int:
+    """
+    Deletes previously generated outputs and any directories left empty by it.
+    Paths that escape the destination are ignored. Returns the number of files removed.
+    """
+    removed = 0
+    root = destination.resolve()
+    for rel in outputs:
+        path = (destination / rel).resolve()
+        if root not in path.parents or not path.is_file():
+            continue
+        path.unlink()
+        removed += 1
+
+        parent = path.parent
+        while parent != root and not any(parent.iterdir()):
+            parent.rmdir()
+            parent = parent.parent
+    return removed
@@ -0,0 +1,153 @@
+"""
+Single-pass line engine behind ObsidianConverter.convert_content.
+
+The content is split into lines once. Logbook drawers are dropped while the
+lines are read, the leading frontmatter or property block is rewritten, every
+later line is checked for excluded properties, and the inline transforms run
+on each line as it is emitted. Lines are only buffered while the engine cannot
+yet decide what to do with them: an unterminated drawer, frontmatter before
+its closing "---", and the property lines at the top of the page.
+"""
+from itertools import chain
+from typing import Callable, Collection, Iterable, Iterator, List
+
+from logseq_converter.logseq.properties import FRONTMATTER_DELIMITER, lex_property_line, lex_yaml_line
+
+LOGBOOK_START = ":LOGBOOK:"
+LOGBOOK_END = ":END:"
+
+
+def strip_logbooks(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Removes :LOGBOOK: ... :END: drawers, which may start and end anywhere in a
+    line. The text before a drawer and the text after its end are joined into
+    one line. A drawer without an :END: is left untouched.
+    """
+    lines = iter(lines)
+    for line in lines:
+        if LOGBOOK_START not in line:
+            yield line
+            continue
+
+        pieces = []
+        rest = line
+        while True:
+            start = rest.find(LOGBOOK_START)
+            if start < 0:
+                pieces.append(rest)
+                break
+
+            pieces.append(rest[:start])
+            end = rest.find(LOGBOOK_END, start + len(LOGBOOK_START))
+            if end >= 0:
+                rest = rest[end + len(LOGBOOK_END) :]
+                continue
+
+            # The drawer continues on the following lines
+            drawer = []
+            for next_line in lines:
+                drawer.append(next_line)
+                end = next_line.find(LOGBOOK_END)
+                if end >= 0:
+                    rest = next_line[end + len(LOGBOOK_END) :]
+                    break
+            else:
+                # No :END: until the end of the content: keep everything as written
+                pieces.append(rest[start:])
+                yield "".join(pieces)
+                yield from drawer
+                return
+
+        yield "".join(pieces)
+
+
+def transform_content(
+    content: str,
+    excluded_properties: Collection[str],
+    transform_line: Callable[[str], str],
+) -> str:
+    """
+    Rewrites LogSeq page content for Obsidian in one pass over its lines:
+
+    - logbook drawers are removed;
+    - excluded keys are dropped from existing YAML frontmatter;
+    - key:: value properties at the top of the page become frontmatter;
+    - excluded key:: value properties are removed from the body;
+    - transform_line is applied to every resulting line.
+    """
+    lines = strip_logbooks(content.split("\n"))
+    output: List[str] = []
+
+    def emit(line: str) -> None:
+        output.append(transform_line(line))
+
+    def emit_body(line: str) -> None:
+        if "::" in line:
+            token = lex_property_line(line)
+            if token and token.key in excluded_properties:
+                return
+        emit(line)
+
+    first = next(lines)
+    if first.strip() == FRONTMATTER_DELIMITER:
+        frontmatter = []
+        closing = None
+        for line in lines:
+            if line.strip() == FRONTMATTER_DELIMITER:
+                closing = line
+                break
+            frontmatter.append(line)
+
+        emit(first)
+        if closing is None:
+            # Unterminated frontmatter: nothing is filtered
+            for line in frontmatter:
+                emit(line)
+            return "\n".join(output)
+
+        for line in frontmatter:
+            token = lex_yaml_line(line)
+            if token and token.key in excluded_properties:
+                continue
+            emit(line)
+        emit(closing)
+    else:
+        # Leading property and blank lines, then the first line of the body
+        header = []
+        properties = {}
+        boundary = None
+        for line in chain([first], lines):
+            token = lex_property_line(line)
+            if token:
+                if token.key not in excluded_properties:
+                    properties[token.key] = token.value
+            elif line.strip() != "":
+                boundary = line
+                break
+            header.append(line)
+
+        if properties:
+            emit("---")
+            for key, value in properties.items():
+                emit(f"{key}: {value}")
+            emit("---")
+            emit("")
+            emit_body(boundary if boundary is not None else "")
+        else:
+            # No frontmatter is generated; the first line is always kept
+            pending = header + ([boundary] if boundary is not None else [])
+            emit(pending[0])
+            for line in pending[1:]:
+                emit_body(line)
+
+    # Body: the bulk of the content, kept free of per-line helper calls
+    append = output.append
+    for line in lines:
+        if "::" in line:
+            token = lex_property_line(line)
+            if token and token.key in excluded_properties:
+                continue
+        append(transform_line(line))
+
+    return "\n".join(output)
+
@@ -0,0 +1,61 @@
+"""
+Process-pool helpers shared by the conversion commands.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Per-process state built once by the pool initializer (e.g. a converter instance)
+_worker_state: Any = None
+
+
+def resolve_jobs(jobs: int) -> int:
+    """
+    Normalizes a --jobs value. Zero or a negative number means one worker per CPU.
+    """
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def _initialize_worker(factory: Callable[..., Any], factory_args: tuple) -> None:
+    global _worker_state
+    _worker_state = factory(*factory_args)
+
+
+def _run_task(func: Callable[[Any, T], R], item: T) -> R:
+    return func(_worker_state, item)
+
+
+def map_in_workers(
+    func: Callable[[Any, T], R],
+    items: Iterable[T],
+    jobs: int,
+    factory: Callable[..., Any],
+    factory_args: tuple = (),
+) -> Iterator[R]:
+    """
+    Runs func(state, item) for every item in a pool of `jobs` processes.
+
+    Each worker builds its own state once by calling factory(*factory_args), so
+    unpicklable objects (LLM clients, parsers) never cross process boundaries.
+    Results are yielded in input order regardless of completion order.
+    func and factory must be module-level callables so they can be pickled.
+    """
+    items = list(items)
+    if not items:
+        return
+
+    max_workers = min(jobs, len(items))
+    # Hand out several files per round trip so IPC overhead stays small on large graphs
+    chunksize = max(1, len(items) // (max_workers * 16))
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_initialize_worker,
+        initargs=(factory, factory_args),
+    ) as executor:
+        yield from executor.map(partial(_run_task, func), items, chunksize=chunksize)
@@ -0,0 +1,70 @@
+"""
+Phase and per-file timings for the --profile option.
+"""
+import json
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+DEFAULT_SLOWEST_FILES = 10
+
+
+class ConversionProfile:
+    """
+    Collects the wall time of each conversion phase and the conversion time of
+    every file. Phases with the same name accumulate; they are reported in the
+    order they first ran.
+    """
+
+    def __init__(self):
+        self.phases: Dict[str, float] = {}
+        self.files: List[Tuple[str, float]] = []
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def record_file(self, path: str, seconds: float) -> None:
+        self.files.append((path, seconds))
+
+    @property
+    def total(self) -> float:
+        return time.perf_counter() - self._started
+
+    def slowest_files(self, count: int) -> List[Tuple[str, float]]:
+        return sorted(self.files, key=lambda item: item[1], reverse=True)[:count]
+
+    def to_dict(self, slowest: int = DEFAULT_SLOWEST_FILES) -> dict:
+        return {
+            "total_seconds": self.total,
+            "phases": [{"name": name, "seconds": seconds} for name, seconds in self.phases.items()],
+            "files": {
+                "count": len(self.files),
+                "seconds": sum(seconds for _, seconds in self.files),
+                "slowest": [{"path": path, "seconds": seconds} for path, seconds in self.slowest_files(slowest)],
+            },
+        }
+
+    def print_report(self, slowest: int = DEFAULT_SLOWEST_FILES) -> None:
+        total = self.total
+        print("\nProfile:")
+        print(f"  Total: {total:.3f}s")
+        for name, seconds in self.phases.items():
+            share = seconds / total * 100 if total else 0.0
+            print(f"  {name}: {seconds:.3f}s ({share:.1f}%)")
+
+        if self.files:
+            print(f"\nSlowest files (of {len(self.files)}):")
+            for path, seconds in self.slowest_files(slowest):
+                print(f"  {seconds * 1000:8.1f} ms  {path}")
+
+    def write_json(self, path: Path, slowest: int = DEFAULT_SLOWEST_FILES) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(slowest), f, indent=2)
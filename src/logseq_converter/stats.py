@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
 
 @dataclass
@@ -11,3 +11,8 @@ class ConversionStats:
     learnings: int = 0
     achievements: int = 0
     highlights: int = 0
+
+    def merge(self, other: "ConversionStats") -> None:
+        """Adds the counters of another stats object (e.g. from a worker process) to this one."""
+        for f in fields(self):
+            setattr(self, f.name, getattr(self, f.name) + getattr(other, f.name))
@@ -1,9 +1,11 @@
 import re
 import time
 import uuid
-from typing import Dict, List, Set, Tuple, Union
+from typing import Dict, Iterable, Iterator, List, Mapping, Sequence, Set, Tuple, Union
 
-from logseq_converter.logseq.models import Block, Journal, Page
+from logseq_converter.logseq.models import Block, Journal, Page, Property
+from logseq_converter.logseq.properties import page_ref_names
+from logseq_converter.logseq.walk import map_tree, walk
 from logseq_converter.tana.models import (
     TanaIntermediateFile,
     TanaIntermediateNode,
@@ -30,26 +32,29 @@ class TanaConverter:
         """Current timestamp in milliseconds."""
         return int(time.time() * 1000)
 
-    def _remove_properties(self, content: str, properties: Dict[str, str]) -> str:
+    def _remove_properties(self, content: str, tokens: Sequence[Property]) -> str:
         """Remove lines that are properties from the content."""
-        if not properties:
+        # id:: lines stay; the block id is kept in the node's uid and the text
+        property_lines = set()
+        for token in tokens:
+            start = token.span[0]
+            line_start = content.rfind("\n", 0, start) + 1
+            # Only lines that begin with key:: (ignoring whitespace)
+            if token.key != "id" and not content[line_start:start].strip():
+                property_lines.add(content.count("\n", 0, start))
+        if not property_lines:
             return content
 
         lines = content.split("\n")
-        cleaned_lines = []
-        for line in lines:
-            is_property = False
-            for key in properties:
-                # LogSeq properties are usually "key:: value"
-                # Check for key:: at start of line (ignoring whitespace)
-                if line.strip().lower().startswith(f"{key.lower()}::"):
-                    is_property = True
-                    break
-            if not is_property:
-                cleaned_lines.append(line)
-
+        cleaned_lines = [line for index, line in enumerate(lines) if index not in property_lines]
         return "\n".join(cleaned_lines).strip()
 
+    def _tag_names(self, properties: Mapping[str, str]) -> List[str]:
+        """Names of the pages in a tags:: property, as written."""
+        if "tags" not in properties:
+            return []
+        return page_ref_names(properties["tags"])
+
     def process_links(self, text: str) -> Tuple[str, List[str]]:
         """
         Find [[wiki-links]] and convert to Tana format [[uid]].
@@ -91,17 +96,17 @@ class TanaConverter:
         return cleaned_text, tags
 
     def convert_block(self, block: Block) -> TanaIntermediateNode:
-        """Convert a LogSeq Block to a TanaIntermediateNode."""
+        """Convert a LogSeq Block and its children to a TanaIntermediateNode."""
+        return map_tree([block], self._convert_block_node)[0]
+
+    def _convert_block_node(self, block: Block) -> TanaIntermediateNode:
+        """Convert a single LogSeq Block; map_tree attaches the children."""
         # Process content
-        content = self._remove_properties(block.content, block.properties)
+        content = self._remove_properties(block.content, block.property_tokens)
 
         # Handle properties
         # We only care about 'tags' property
-        block_tags = []
-        if "tags" in block.properties:
-            # tags property is usually comma separated
-            p_tags = block.properties["tags"].split(",")
-            block_tags.extend([t.strip() for t in p_tags if t.strip()])
+        block_tags = self._tag_names(block.properties)
 
         # Process inline tags and links
         content, inline_tags = self.process_tags(content)
@@ -129,7 +134,6 @@ class TanaConverter:
             createdAt=self._get_timestamp(),
             editedAt=self._get_timestamp(),
             type="node",
-            children=[self.convert_block(child) for child in block.children],
             refs=refs,
             supertags=supertags_uids,
         )
@@ -138,6 +142,17 @@ class TanaConverter:
 
     def convert_page(self, page: Union[Page, Journal]) -> TanaIntermediateNode:
         """Convert a LogSeq Page or Journal to a TanaIntermediateNode."""
+        node = self.convert_page_node(page)
+        node.children = list(self.convert_blocks(page.blocks))
+        return node
+
+    def convert_blocks(self, blocks: Iterable[Block]) -> Iterator[TanaIntermediateNode]:
+        """Converts root blocks one at a time, as they are taken from blocks."""
+        for block in blocks:
+            yield self.convert_block(block)
+
+    def convert_page_node(self, page: Union[Page, Journal]) -> TanaIntermediateNode:
+        """The node of a Page or Journal, without the nodes of its blocks."""
         page_name = page.filename.replace(".md", "")
         uid = self._generate_uid(page_name, "page")
 
@@ -156,10 +171,7 @@ class TanaConverter:
             display_name = page_name.replace("___", "/")
 
         # Page properties
-        page_tags = []
-        if hasattr(page, "properties") and "tags" in page.properties:
-            p_tags = page.properties["tags"].split(",")
-            page_tags.extend([t.strip() for t in p_tags if t.strip()])
+        page_tags = self._tag_names(page.properties) if hasattr(page, "properties") else []
 
         supertags_uids = []
         for tag in page_tags:
@@ -174,31 +186,31 @@ class TanaConverter:
             createdAt=self._get_timestamp(),
             editedAt=self._get_timestamp(),
             type=node_type,
-            children=[self.convert_block(block) for block in page.blocks],
             supertags=supertags_uids,
         )
 
         return node
 
+    def merge_supertags(self, supertags: Mapping[str, TanaIntermediateSupertag]) -> None:
+        """
+        Adds the supertags another converter registered, such as one in a
+        worker process. Tags already known keep their place, so merging each
+        file's tags in file order gives the same registry as a serial run.
+        """
+        for name, tag in supertags.items():
+            self.supertags.setdefault(name, tag)
+
     def _collect_supertag_uids(self, node: TanaIntermediateNode) -> Set[str]:
-        uids = set(node.supertags)
-        for child in node.children:
-            uids.update(self._collect_supertag_uids(child))
+        uids: Set[str] = set()
+        for descendant, _ in walk([node]):
+            uids.update(descendant.supertags)
         return uids
 
     def _count_descendants(self, node: TanaIntermediateNode) -> int:
-        count = 0
-        for child in node.children:
-            count += 1 + self._count_descendants(child)
-        return count
+        return sum(1 for _ in walk(node.children))
 
     def _count_leaf_nodes(self, node: TanaIntermediateNode) -> int:
-        if not node.children:
-            return 1
-        count = 0
-        for child in node.children:
-            count += self._count_leaf_nodes(child)
-        return count
+        return sum(1 for descendant, _ in walk([node]) if not descendant.children)
 
     def create_tana_file(self, node: TanaIntermediateNode) -> TanaIntermediateFile:
         """Create a TanaIntermediateFile from a root node, including summary and used supertags."""
@@ -206,10 +218,7 @@ class TanaConverter:
 
     def _count_calendar_nodes(self, node: TanaIntermediateNode) -> int:
         """Count nodes with type='date' in the tree."""
-        count = 1 if node.type == "date" else 0
-        for child in node.children:
-            count += self._count_calendar_nodes(child)
-        return count
+        return sum(1 for descendant, _ in walk([node]) if descendant.type == "date")
 
     def create_tana_file_from_nodes(self, nodes: List[TanaIntermediateNode]) -> TanaIntermediateFile:
         """Create a TanaIntermediateFile from a list of root nodes, including summary and used supertags."""
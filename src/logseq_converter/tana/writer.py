@@ -0,0 +1,205 @@
+"""
+Streaming writer for Tana Intermediate Format files.
+"""
+import dataclasses
+import json
+from typing import Iterable, List, Optional, Set, TextIO
+
+from logseq_converter.tana.models import TanaIntermediateNode, TanaIntermediateSummary, TanaIntermediateSupertag
+
+# Indentation of a top-level node inside the "nodes" array with json.dump(..., indent=2)
+_NODE_INDENT = " " * 4
+_NODE_FIELDS = tuple(field.name for field in dataclasses.fields(TanaIntermediateNode))
+# Stands in for the children of a node whose children are written as they arrive
+_CHILDREN_PLACEHOLDER = "\0streamed children\0"
+
+
+def encode_node(node: TanaIntermediateNode, indent: str = "") -> str:
+    """
+    json.dumps(dataclasses.asdict(node), indent=2) with every line after the
+    first prefixed by indent, built with an explicit stack so deeply nested
+    outlines do not hit the recursion limit.
+    """
+    pieces: List[str] = []
+    # Pending output: strings to write as they are, or (node, indent) to encode there
+    stack: list = [(node, indent)]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            pieces.append(item)
+            continue
+
+        current, outer = item
+        inner = outer + "  "
+        parts: list = ["{"]
+        for index, name in enumerate(_NODE_FIELDS):
+            separator = "," if index < len(_NODE_FIELDS) - 1 else ""
+            value = getattr(current, name)
+            parts.append(f"\n{inner}{json.dumps(name)}: ")
+            if name == "children" and value:
+                parts.append("[")
+                for child_index, child in enumerate(value):
+                    parts.append(f"\n{inner}  ")
+                    parts.append((child, inner + "  "))
+                    if child_index < len(value) - 1:
+                        parts.append(",")
+                parts.append(f"\n{inner}]{separator}")
+            else:
+                parts.append(json.dumps(value, indent=2).replace("\n", f"\n{inner}") + separator)
+        parts.append(f"\n{outer}}}")
+        stack.extend(reversed(parts))
+    return "".join(pieces)
+
+
+class TanaStreamWriter:
+    """
+    Writes a TanaIntermediateFile one top-level node at a time.
+
+    Each node is serialized as soon as it is written and then dropped, so memory
+    stays bounded by the largest page instead of the whole graph. The summary,
+    supertags and homeNodeIds are accumulated along the way and written after
+    the nodes array when the writer is closed. The result is the same document
+    create_tana_file_from_nodes would produce, with "nodes" as the first key.
+
+    With stream=None nothing is written, but the summary is still computed
+    (used by dry runs).
+    """
+
+    def __init__(self, stream: Optional[TextIO]):
+        self.stream = stream
+        self.top_level_nodes = 0
+        self.total_nodes = 0
+        self.leaf_nodes = 0
+        self.calendar_nodes = 0
+        self.home_node_ids: List[str] = []
+        self.used_supertag_uids: Set[str] = set()
+        self._closed = False
+
+        if self.stream is not None:
+            self.stream.write('{\n  "nodes": [')
+
+    def write_node(self, node: TanaIntermediateNode) -> None:
+        if self._closed:
+            raise ValueError("Cannot write to a closed TanaStreamWriter")
+
+        # Encoded before anything is counted, so a node that fails to encode leaves no trace
+        encoded = encode_node(node, _NODE_INDENT) if self.stream is not None else None
+
+        self._account(node)
+        # Root level pages are those whose names do not contain "/" AND are not date nodes
+        if "/" not in node.name and node.type != "date":
+            self.home_node_ids.append(node.uid)
+
+        if self.stream is not None:
+            separator = "," if self.top_level_nodes else ""
+            self.stream.write(f"{separator}\n{_NODE_INDENT}" + encoded)
+
+        self.top_level_nodes += 1
+
+    def write_streamed_node(self, node: TanaIntermediateNode, children: Iterable[TanaIntermediateNode]) -> None:
+        """
+        Writes a top-level node whose children arrive one at a time, such as a
+        page parsed with LogSeqParser.parse_streaming. node must have no
+        children of its own; each child is serialized as soon as children
+        yields it and then dropped. The output is the same as write_node gives
+        for the node with all its children. If children raises, everything
+        written for the node is taken back before the error propagates.
+        """
+        if self._closed:
+            raise ValueError("Cannot write to a closed TanaStreamWriter")
+        if node.children:
+            raise ValueError("A streamed node gets its children from the iterable")
+
+        position = self.stream.tell() if self.stream is not None else None
+        counters = (self.total_nodes, self.leaf_nodes, self.calendar_nodes, len(self.home_node_ids))
+        used_supertag_uids = set(self.used_supertag_uids)
+        try:
+            self._write_streamed_node(node, children)
+        except BaseException:
+            if self.stream is not None:
+                self.stream.seek(position)
+                self.stream.truncate()
+            self.total_nodes, self.leaf_nodes, self.calendar_nodes, home_nodes = counters
+            del self.home_node_ids[home_nodes:]
+            self.used_supertag_uids = used_supertag_uids
+            raise
+
+    def _write_streamed_node(self, node: TanaIntermediateNode, children: Iterable[TanaIntermediateNode]) -> None:
+        if "/" not in node.name and node.type != "date":
+            self.home_node_ids.append(node.uid)
+        self.total_nodes += 1
+        if node.type == "date":
+            self.calendar_nodes += 1
+        self.used_supertag_uids.update(node.supertags)
+
+        head = tail = child_indent = ""
+        if self.stream is not None:
+            encoded = json.dumps(dataclasses.asdict(node) | {"children": [_CHILDREN_PLACEHOLDER]}, indent=2)
+            encoded = encoded.replace("\n", f"\n{_NODE_INDENT}")
+            placeholder = json.dumps(_CHILDREN_PLACEHOLDER)
+            position = encoded.index(placeholder)
+            line_start = encoded.rindex("\n", 0, position)
+            # head ends with the "[" that opens the children, tail starts with the line closing them
+            head, child_indent = encoded[:line_start], encoded[line_start + 1 : position]
+            tail = encoded[position + len(placeholder) :]
+            separator = "," if self.top_level_nodes else ""
+            self.stream.write(f"{separator}\n{_NODE_INDENT}" + head)
+
+        written = 0
+        for child in children:
+            self._account(child)
+            if self.stream is not None:
+                encoded = encode_node(child, child_indent)
+                self.stream.write(("," if written else "") + f"\n{child_indent}" + encoded)
+            written += 1
+
+        if not written:
+            self.leaf_nodes += 1
+        if self.stream is not None:
+            # Without children the array closes right after its "[", as json.dumps writes []
+            self.stream.write(tail if written else tail.lstrip())
+        self.top_level_nodes += 1
+
+    def _account(self, root: TanaIntermediateNode) -> None:
+        # Iterative walk so deeply nested pages do not hit the recursion limit
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            self.total_nodes += 1
+            if not node.children:
+                self.leaf_nodes += 1
+            if node.type == "date":
+                self.calendar_nodes += 1
+            self.used_supertag_uids.update(node.supertags)
+            stack.extend(node.children)
+
+    def summary(self) -> TanaIntermediateSummary:
+        return TanaIntermediateSummary(
+            leafNodes=self.leaf_nodes,
+            topLevelNodes=self.top_level_nodes,
+            totalNodes=self.total_nodes,
+            calendarNodes=self.calendar_nodes,
+            fields=0,
+            brokenRefs=0,
+        )
+
+    def close(self, supertags: List[TanaIntermediateSupertag]) -> TanaIntermediateSummary:
+        """
+        Writes the trailing fields and returns the summary. supertags are all
+        supertags known to the converter; only those used by written nodes are kept.
+        """
+        summary = self.summary()
+        if self.stream is not None and not self._closed:
+            trailer = {
+                "summary": dataclasses.asdict(summary),
+                "version": "TanaIntermediateFile V0.1",
+                "homeNodeIds": self.home_node_ids,
+                "attributes": [],
+                "supertags": [dataclasses.asdict(tag) for tag in supertags if tag.uid in self.used_supertag_uids],
+            }
+            closing = "\n  ]" if self.top_level_nodes else "]"
+            encoded = json.dumps(trailer, indent=2)
+            # Splice the trailer's members after the nodes array
+            self.stream.write(f"{closing},\n" + encoded[2:])
+        self._closed = True
+        return summary
@@ -1,10 +1,12 @@
 import re
 import urllib.parse
-from datetime import date, datetime
-from typing import Dict, Optional, Tuple
+from datetime import date
+from typing import Dict, Optional, Sequence, Tuple
 
+from logseq_converter.date_links import DEFAULT_DATE_LINK_FORMATS, DateLinkRecognizer
 from logseq_converter.logseq.models import ContentItem, LinkItem
-from logseq_converter.logseq.parser import BlockReferenceScanner, LogSeqParser
+from logseq_converter.logseq.parser import DEFAULT_PARSER_BACKEND, BlockReferenceScanner, LogSeqParser
+from logseq_converter.logseq.properties import lex_page_header
 
 
 class TolariaConverter:
@@ -30,8 +32,13 @@ class TolariaConverter:
         self,
         scanner: Optional[BlockReferenceScanner] = None,
         env: Optional[dict[str, str]] = None,
+        date_formats: Sequence[str] = DEFAULT_DATE_LINK_FORMATS,
+        parser_backend: str = DEFAULT_PARSER_BACKEND,
     ):
         self.scanner = scanner
+        self.date_links = DateLinkRecognizer(date_formats)
+        # Splits journals into their sections
+        self.parser = LogSeqParser(parser_backend)
         self.stats_block_refs = 0
         self.stats_links = 0
         self.stats_learnings = 0
@@ -56,45 +63,17 @@ class TolariaConverter:
         from the content, returning the remaining content and a dict of properties.
         """
         lines = content.split("\n")
+        header = lex_page_header(lines)
+
         properties = {}
-        
-        idx = 0
-        # Parse YAML Frontmatter
-        if lines and lines[0].strip() == "---":
-            idx = 1
-            while idx < len(lines):
-                line = lines[idx]
-                if line.strip() == "---":
-                    idx += 1
-                    break
-                
-                # Match yaml key: value
-                yaml_match = re.match(r"^\s*([a-zA-Z0-9_-]+):\s*(.*)$", line)
-                if yaml_match:
-                    key = yaml_match.group(1)
-                    val = yaml_match.group(2).strip("'\"")
-                    properties[key] = val
-                idx += 1
-
-        # Parse LogSeq key:: value properties at the top of the remaining content
-        while idx < len(lines):
-            line = lines[idx]
-            prop_match = re.match(r"^\s*([a-zA-Z0-9_-]+)::\s*(.+)$", line)
-            if prop_match:
-                key = prop_match.group(1)
-                val = prop_match.group(2).strip()
-                properties[key] = val
-                idx += 1
-            elif not line.strip():
-                # Skip empty lines at the top
-                idx += 1
-            else:
-                break
-                
+        for token in header.frontmatter or []:
+            properties[token.key] = token.value.strip("'\"")
+        # LogSeq key:: value properties at the top of the remaining content
+        for token in header.properties:
+            properties[token.key] = token.value.strip()
+
         # The rest is content
-        content_lines = lines[idx:]
-        
-        return "\n".join(content_lines), properties
+        return "\n".join(lines[header.body_start :]), properties
 
     def transform_page_filename(self, filename: str) -> str:
         """
@@ -183,13 +162,9 @@ class TolariaConverter:
     def _transform_date_links(self, content: str) -> str:
         # [[Date]] -> [[journal/YYYY-MM-DD]]
         def replace_date(match):
-            link_text = match.group(1)
-            for fmt in ["%d %b %Y", "%b %d, %Y", "%Y-%m-%d", "%Y/%m/%d"]:
-                try:
-                    dt = datetime.strptime(link_text, fmt)
-                    return f"[[journal/{dt.strftime('%Y-%m-%d')}]]"
-                except ValueError:
-                    continue
+            parsed = self.date_links.parse(match.group(1))
+            if parsed:
+                return f"[[journal/{parsed.strftime('%Y-%m-%d')}]]"
             return match.group(0)
 
         return re.sub(r"\[\[(.*?)\]\]", replace_date, content)
@@ -316,120 +291,37 @@ class TolariaConverter:
         Extracts specific sections from journal entries.
         Returns (modified_content, list_of_extracted_files).
         """
-        extracted_files = []
-        lines = content.split("\n")
-        new_lines = []
-
-        parser = LogSeqParser()
         from logseq_converter.utils import parse_journal_date
-        journal_date = parse_journal_date(original_filename)
-
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-            section_match = self._match_section_header(line)
-
-            if section_match:
-                section_name = section_match.group(2).lower()
-                initial_indent = len(line) - len(line.lstrip())
-
-                # Capture section lines
-                section_lines, next_idx = self._capture_section_lines(lines, i, initial_indent)
-                i = next_idx
-
-                # Process the captured section
-                new_extracted = self._process_section_content(section_lines, section_name, journal_date, parser)
-                extracted_files.extend(new_extracted)
-                continue
-
-            new_lines.append(line)
-            i += 1
-
-        return "\n".join(new_lines), extracted_files
 
-    def _match_section_header(self, line: str) -> Optional[re.Match]:
-        """Check if line is a section header."""
-        return re.match(
-            r"^(?:-\s+)?(#{1,6}\s+)?(#links|#learnings|#achievements|#highlights)\s*$",
-            line,
-            re.IGNORECASE,
-        )
-
-    def _capture_section_lines(self, lines: list[str], start_idx: int, initial_indent: int) -> tuple[list[str], int]:
-        """
-        Captures lines belonging to a section starting at start_idx.
-        Returns (captured_lines, next_line_index).
-        """
-        section_lines = [lines[start_idx]]
-        i = start_idx + 1
-
-        while i < len(lines):
-            line = lines[i]
-
-            # Empty lines are part of the section
-            if not line.strip():
-                section_lines.append(line)
-                i += 1
-                continue
-
-            current_indent = len(line) - len(line.lstrip())
-
-            # Check for heading boundaries
-            # If we started with a heading (initial_indent == 0 and starts with #),
-            # we stop at the next heading.
-            is_root_heading = initial_indent == 0 and re.match(r"^#{1,6}\s+", lines[start_idx])
-            if is_root_heading:
-                if re.match(r"^#{1,6}\s+", line):
-                    break
-                section_lines.append(line)
-                i += 1
-                continue
-
-            # Check for list item boundaries
-            # Stop if we find a new list item at same or lower indentation level
-            is_new_block = re.match(r"^(-|\*)\s+", line) and current_indent <= initial_indent
-
-            if is_new_block:
-                break
-
-            section_lines.append(line)
-            i += 1
+        journal_date = parse_journal_date(original_filename)
+        # One parse of the journal finds every section and the lines to drop
+        content, sections = self.parser.split_sections(content)
 
-        return section_lines, i
+        extracted_files = []
+        for section in sections:
+            extracted_files.extend(self._process_section_content(section.blocks, section.name, journal_date))
+        return content, extracted_files
 
     def _process_section_content(
         self,
-        section_lines: list[str],
+        content_blocks: list,
         section_name: str,
         journal_date: Optional[date],
-        parser: "LogSeqParser",
     ) -> list[tuple[str, str]]:
         """
-        Parses and converts content from a captured section.
+        Converts the items of a section.
         """
         if not journal_date:
             return []
 
         extracted = []
-        block_text = "\n".join(section_lines)
-        blocks = parser._parse_blocks(block_text)
-
-        if not blocks:
-            return []
-
-        # Determine content blocks
-        if re.match(r"^#{1,6}\s+", blocks[0].cleaned_content):
-            content_blocks = blocks[1:]
-        else:
-            content_blocks = blocks[0].children
-
         if section_name == "#links":
-            items = self._extract_link_items(content_blocks, journal_date, parser)
+            items = self._extract_link_items(content_blocks, journal_date)
             self.stats_links += len(items)
             extracted.extend(items)
         elif section_name in {"#learnings", "#achievements", "#highlights"}:
             section_type = section_name.lstrip("#")
-            items = self._extract_content_items(content_blocks, section_type, journal_date, parser)
+            items = self._extract_content_items(content_blocks, section_type, journal_date)
             if section_name == "#learnings":
                 self.stats_learnings += len(items)
             elif section_name == "#achievements":
@@ -440,12 +332,12 @@ class TolariaConverter:
 
         return extracted
 
-    def _extract_link_items(self, blocks: list, journal_date: date, parser: "LogSeqParser") -> list[tuple[str, str]]:
+    def _extract_link_items(self, blocks: list, journal_date: date) -> list[tuple[str, str]]:
         results = []
         from logseq_converter.utils import is_markdown_empty
 
         for child in blocks:
-            link_item = parser._parse_link_item(child)
+            link_item = self.parser._parse_link_item(child)
             if link_item:
                 filename, file_content = self.convert_link_item(link_item, journal_date)
                 if not is_markdown_empty(file_content):
@@ -457,13 +349,12 @@ class TolariaConverter:
         blocks: list,
         section_type: str,
         journal_date: date,
-        parser: "LogSeqParser",
     ) -> list[tuple[str, str]]:
         results = []
         from logseq_converter.utils import is_markdown_empty
 
         for child in blocks:
-            content_item = parser._parse_content_item(child, section_type)
+            content_item = self.parser._parse_content_item(child, section_type)
             if content_item:
                 filename, file_content = self.convert_content_item(content_item, journal_date)
                 if not is_markdown_empty(file_content):
@@ -511,8 +402,9 @@ class TolariaConverter:
 
         if self.llm_generator and self.llm_generator.provider != "none":
             checksum = self.llm_generator.get_content_hash(item.description, item.sub_items)
-            if checksum in self.llm_generator.cache:
-                filename = f"{self.llm_generator.cache[checksum]}.md"
+            cached_name = self.llm_generator.cache.lookup(checksum)
+            if cached_name is not None:
+                filename = f"{cached_name}.md"
             else:
                 filename = f"__PENDING_LLM__{checksum}__{fallback_name}.md"
         else:
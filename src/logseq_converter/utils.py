@@ -1,9 +1,10 @@
+import os
 import re
 import shutil
 import sys
 from datetime import date
 from pathlib import Path
-from typing import Optional
+from typing import Mapping, Optional
 
 
 def validate_output_directory(path: Path, force: bool = False) -> None:
@@ -39,9 +40,11 @@ def validate_logseq_source(path: Path) -> None:
         )
 
 
-def copy_assets(source_assets: Path, dest_assets: Path) -> None:
+def copy_assets(source_assets: Path, dest_assets: Path, skip_unchanged: bool = False) -> None:
     """
     Copies assets from source to destination.
+    With skip_unchanged, files whose destination copy has the same size and
+    mtime (copy2 preserves it) are left alone.
     """
     if not source_assets.exists():
         return
@@ -49,11 +52,37 @@ def copy_assets(source_assets: Path, dest_assets: Path) -> None:
     if not dest_assets.exists():
         dest_assets.mkdir(parents=True)
 
+    copy_function = _copy_if_changed if skip_unchanged else shutil.copy2
+
     for item in source_assets.iterdir():
         if item.is_file():
-            shutil.copy2(item, dest_assets / item.name)
+            copy_function(item, dest_assets / item.name)
         elif item.is_dir():
-            shutil.copytree(item, dest_assets / item.name, dirs_exist_ok=True)
+            shutil.copytree(item, dest_assets / item.name, dirs_exist_ok=True, copy_function=copy_function)
+
+
+def _copy_if_changed(src, dst):
+    try:
+        src_stat = os.stat(src)
+        dst_stat = os.stat(dst)
+        if src_stat.st_size == dst_stat.st_size and src_stat.st_mtime_ns == dst_stat.st_mtime_ns:
+            return dst
+    except FileNotFoundError:
+        pass
+    return shutil.copy2(src, dst)
+
+
+def get_cache_dir(env: Mapping[str, str]) -> Path:
+    """
+    Returns the per-user cache directory of the converter
+    (XDG_CACHE_HOME on POSIX, LOCALAPPDATA on Windows).
+    """
+    if os.name == "nt":
+        base = Path(env.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+    else:
+        base = Path(env.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+
+    return base / "logseq-converter"
 
 
 def log_progress(message: str) -> None:
@@ -0,0 +1,68 @@
+"""
+Polling file watcher used by the --watch mode of the conversion commands.
+
+The watched trees are snapshotted with os.scandir, which returns stat data
+without an extra system call per file on most platforms, so a poll of a large
+graph stays cheap enough to run several times per second.
+"""
+import os
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+DEFAULT_POLL_INTERVAL = 0.25
+
+Snapshot = Dict[Path, Tuple[int, int]]  # path -> (mtime_ns, size)
+
+
+def snapshot_markdown_files(directories: Iterable[Path]) -> Snapshot:
+    """Returns the mtime and size of every markdown file below the given directories."""
+    snapshot: Snapshot = {}
+    pending = [Path(d) for d in directories]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(Path(entry.path))
+                    elif entry.name.endswith(".md") and entry.is_file():
+                        stat = entry.stat()
+                        snapshot[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            # A directory removed between two polls
+            continue
+    return snapshot
+
+
+def diff_snapshots(old: Snapshot, new: Snapshot) -> Tuple[List[Path], List[Path]]:
+    """Returns (changed_or_new, removed) paths between two snapshots, both sorted."""
+    changed = sorted(path for path, state in new.items() if old.get(path) != state)
+    removed = sorted(path for path in old if path not in new)
+    return changed, removed
+
+
+def watch_files(
+    directories: Iterable[Path],
+    on_change: Callable[[List[Path], List[Path]], None],
+    interval: float = DEFAULT_POLL_INTERVAL,
+    should_stop: Callable[[], bool] = lambda: False,
+    snapshot: Optional[Snapshot] = None,
+) -> None:
+    """
+    Polls the directories every `interval` seconds and calls
+    on_change(changed, removed) whenever markdown files were added, edited or
+    deleted. Runs until should_stop() returns true or the process is interrupted.
+    The first poll is compared with snapshot if given (e.g. one taken before an
+    initial conversion, so edits made while it ran are reported), otherwise
+    with the state of the files when watching starts.
+    """
+    directories = list(directories)
+    previous = snapshot if snapshot is not None else snapshot_markdown_files(directories)
+    while not should_stop():
+        time.sleep(interval)
+        current = snapshot_markdown_files(directories)
+        changed, removed = diff_snapshots(previous, current)
+        previous = current
+        if changed or removed:
+            on_change(changed, removed)
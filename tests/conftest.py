@@ -7,3 +7,10 @@ def disable_llm_for_tests(monkeypatch):
     monkeypatch.setenv("LSC_LLM", "none")
     monkeypatch.delenv("LSC_API_KEY", raising=False)
     monkeypatch.delenv("OLLAMA_HOST", raising=False)
+
+
+@pytest.fixture(autouse=True)
+def isolate_cache_dir(monkeypatch, tmp_path):
+    # Keep block indexes and LLM caches out of the user's cache directory
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path / "cache"))
@@ -0,0 +1,35 @@
+import sys
+from unittest.mock import patch
+
+from logseq_converter.cli import main
+from logseq_converter.filename_cache import FilenameCache, filename_cache_path
+
+
+def test_cache_stats_reports_models_and_hit_rate(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path))
+    db_path = filename_cache_path({"XDG_CACHE_HOME": str(tmp_path), "LOCALAPPDATA": str(tmp_path)})
+    cache = FilenameCache(db_path, "ollama:mistral:v1")
+    cache["a"] = "Name A"
+    cache["b"] = "Name B"
+    cache.commit()
+    cache.lookup("a")
+    cache.lookup("c")
+    cache.close()
+
+    with patch.object(sys, "argv", ["logseq-converter", "cache:stats"]):
+        assert main() == 0
+
+    output = capsys.readouterr().out
+    assert f"LLM filename cache: {db_path}" in output
+    assert "ollama:mistral:v1: 2 name(s), hit rate 50.0% (1 hit(s), 0 from other models, 1 miss(es))" in output
+
+
+def test_cache_stats_of_empty_cache(tmp_path, monkeypatch, capsys):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path))
+
+    with patch.object(sys, "argv", ["logseq-converter", "cache:stats"]):
+        assert main() == 0
+
+    assert "is empty" in capsys.readouterr().out
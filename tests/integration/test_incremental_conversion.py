@@ -0,0 +1,146 @@
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from logseq_converter.cli import main
+from logseq_converter.manifest import MANIFEST_FILENAME
+from logseq_converter.obsidian.converter import ObsidianConverter
+
+
+@pytest.fixture
+def source_vault(tmp_path):
+    vault = tmp_path / "source_vault"
+    (vault / "pages").mkdir(parents=True)
+    (vault / "journals").mkdir()
+
+    (vault / "journals" / "2025_11_27.md").write_text(
+        "- Journal entry\n- #learnings\n  - Learned about manifests\n"
+    )
+    (vault / "journals" / "2025_11_28.md").write_text("- Another day\n")
+    (vault / "pages" / "Category___Topic.md").write_text("- Page content\n")
+    (vault / "pages" / "Other.md").write_text("- Other page\n")
+    return vault
+
+
+def _run(command, source, dest, *extra):
+    test_args = ["logseq-converter", command, str(source), str(dest), "--incremental", *extra]
+    with patch.object(sys, "argv", test_args), patch(
+        "logseq_converter.obsidian.configurator.configure_community_plugins"
+    ):
+        return main()
+
+
+def test_obsidian_incremental_reconverts_only_changes(source_vault, tmp_path, capsys):
+    dest = tmp_path / "dest"
+    assert _run("obsidian", source_vault, dest) == 0
+    assert (dest / MANIFEST_FILENAME).exists()
+    assert (dest / "Learnings" / "Learned manifests.md").exists()
+    capsys.readouterr()
+
+    # Nothing changed: nothing is converted
+    assert _run("obsidian", source_vault, dest) == 0
+    captured = capsys.readouterr()
+    assert "0 new or changed, 0 removed, 4 unchanged" in captured.err
+    assert "Journals: 0" in captured.out
+    assert "Pages: 0" in captured.out
+
+    # Edit a journal (its extracted learning changes) and delete a page
+    (source_vault / "journals" / "2025_11_27.md").write_text(
+        "- Journal entry edited\n- #learnings\n  - Learned about stat diffs\n"
+    )
+    (source_vault / "pages" / "Other.md").unlink()
+
+    assert _run("obsidian", source_vault, dest) == 0
+    captured = capsys.readouterr()
+    assert "1 new or changed, 1 removed, 2 unchanged" in captured.err
+    assert "Journals: 1" in captured.out
+
+    assert "edited" in (dest / "Daily" / "2025-11-27.md").read_text()
+    assert (dest / "Learnings" / "Learned stat diffs.md").exists()
+    assert not (dest / "Learnings" / "Learned manifests.md").exists()
+    assert not (dest / "Other.md").exists()
+    assert (dest / "Category" / "Topic.md").exists()
+
+
+def test_edit_saved_during_conversion_is_picked_up_next_run(source_vault, tmp_path, monkeypatch):
+    page = source_vault / "pages" / "Other.md"
+    real_convert = ObsidianConverter.convert_content
+
+    def convert_then_edit(self, content):
+        if "Other page" in content and "edited" not in page.read_text():
+            page.write_text("- Other page, edited mid-run\n")
+        return real_convert(self, content)
+
+    dest = tmp_path / "dest"
+    with monkeypatch.context() as patched:
+        patched.setattr(ObsidianConverter, "convert_content", convert_then_edit)
+        assert _run("obsidian", source_vault, dest) == 0
+    assert "edited" not in (dest / "Other.md").read_text()
+
+    assert _run("obsidian", source_vault, dest) == 0
+    assert "edited mid-run" in (dest / "Other.md").read_text()
+
+
+def test_obsidian_incremental_follows_moved_block_references(source_vault, tmp_path, capsys):
+    block_id = "64a1b2c3-0000-4000-8000-000000000001"
+    (source_vault / "pages" / "Other.md").write_text(f"- Quoted block\n  id:: {block_id}\n")
+    (source_vault / "pages" / "Referrer.md").write_text(f"- See (({block_id}))\n")
+    dest = tmp_path / "dest"
+    assert _run("obsidian", source_vault, dest) == 0
+    assert f"[[Other#^{block_id}]]" in (dest / "Referrer.md").read_text()
+
+    # Move the block to another page; the referring page itself is unchanged
+    (source_vault / "pages" / "Other.md").write_text("- Other page\n")
+    (source_vault / "pages" / "Moved.md").write_text(f"- Quoted block\n  id:: {block_id}\n")
+    capsys.readouterr()
+
+    assert _run("obsidian", source_vault, dest) == 0
+    captured = capsys.readouterr()
+    assert "2 new or changed, 0 removed, 4 unchanged" in captured.err
+    assert "1 unchanged files reference moved or removed blocks" in captured.err
+    assert f"[[Moved#^{block_id}]]" in (dest / "Referrer.md").read_text()
+
+
+def test_obsidian_incremental_removes_deleted_assets(source_vault, tmp_path, capsys):
+    (source_vault / "assets" / "nested").mkdir(parents=True)
+    (source_vault / "assets" / "image.png").write_bytes(b"png")
+    (source_vault / "assets" / "nested" / "doc.pdf").write_bytes(b"pdf")
+    dest = tmp_path / "dest"
+    assert _run("obsidian", source_vault, dest) == 0
+    assert (dest / "assets" / "nested" / "doc.pdf").exists()
+
+    (source_vault / "assets" / "nested" / "doc.pdf").unlink()
+    capsys.readouterr()
+
+    assert _run("obsidian", source_vault, dest) == 0
+    assert "removing 1 deleted assets" in capsys.readouterr().err
+    assert (dest / "assets" / "image.png").exists()
+    assert not (dest / "assets" / "nested").exists()
+
+
+def test_incremental_refuses_foreign_non_empty_destination(source_vault, tmp_path):
+    dest = tmp_path / "dest"
+    dest.mkdir()
+    (dest / "unrelated.md").write_text("user data")
+
+    assert _run("obsidian", source_vault, dest) == 1
+    assert (dest / "unrelated.md").exists()
+
+
+def test_tolaria_incremental_removes_deleted_sources(source_vault, tmp_path, capsys):
+    dest = tmp_path / "tolaria"
+    assert _run("tolaria", source_vault, dest) == 0
+    assert (dest / "Other.md").exists()
+    assert (dest / "journal" / "2025-11-28.md").exists()
+
+    (source_vault / "pages" / "Other.md").unlink()
+    (source_vault / "journals" / "2025_11_28.md").write_text("- Another day, revised\n")
+    capsys.readouterr()
+
+    assert _run("tolaria", source_vault, dest) == 0
+    captured = capsys.readouterr()
+    assert "1 new or changed, 1 removed, 2 unchanged" in captured.err
+    assert not (dest / "Other.md").exists()
+    assert "revised" in (dest / "journal" / "2025-11-28.md").read_text()
+    assert (dest / "Category - Topic.md").exists()
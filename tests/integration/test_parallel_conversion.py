@@ -0,0 +1,110 @@
+import json
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from logseq_converter.cli import _make_obsidian_worker, convert_to_blinko, convert_to_tana, main
+from logseq_converter.date_links import DEFAULT_DATE_LINK_FORMATS
+from logseq_converter.logseq.parser import BlockReferenceScanner
+
+
+@pytest.fixture
+def source_vault(tmp_path):
+    vault = tmp_path / "source_vault"
+    (vault / "pages").mkdir(parents=True)
+    (vault / "journals").mkdir()
+
+    for day in range(1, 7):
+        journal = f"""- Entry for day {day} referencing ((11111111-1111-1111-1111-11111111111{day}))
+- #links
+  - [Link {day}](https://example.com/{day})
+    - note {day}
+- #learnings
+  - Learned thing {day}
+    - detail {day}
+"""
+        (vault / "journals" / f"2025_11_0{day}.md").write_text(journal)
+
+    for idx in range(1, 7):
+        page = f"""tags:: topic{idx}
+- Page {idx} block
+  id:: 11111111-1111-1111-1111-11111111111{idx}
+- Link to [[15 Nov 2025]]
+"""
+        (vault / "pages" / f"Category___Topic {idx}.md").write_text(page)
+
+    return vault
+
+
+def _run(source, dest, extra_args):
+    test_args = ["logseq-converter", "obsidian", str(source), str(dest), *extra_args]
+    with patch.object(sys, "argv", test_args):
+        return main()
+
+
+def _snapshot(root):
+    return {
+        str(path.relative_to(root)): path.read_text()
+        for path in sorted(root.rglob("*.md"))
+        if ".obsidian" not in path.parts
+    }
+
+
+def test_parallel_conversion_matches_serial(source_vault, tmp_path, capsys):
+    serial_dest = tmp_path / "serial"
+    parallel_dest = tmp_path / "parallel"
+
+    with patch("logseq_converter.obsidian.configurator.configure_community_plugins"):
+        assert _run(source_vault, serial_dest, []) == 0
+        serial_out = capsys.readouterr().out
+        assert _run(source_vault, parallel_dest, ["--jobs", "3"]) == 0
+        parallel_out = capsys.readouterr().out
+
+    assert _snapshot(serial_dest) == _snapshot(parallel_dest)
+    assert "Journals: 6" in parallel_out
+    assert "Links: 6" in parallel_out
+    assert "Learnings: 6" in parallel_out
+    assert "Block References: 6" in parallel_out
+    # Statistics summed from the workers must match the serial run
+    assert serial_out == parallel_out
+
+
+
+def test_parallel_conversion_with_fast_parser_matches_serial(source_vault, tmp_path):
+    with patch("logseq_converter.obsidian.configurator.configure_community_plugins"):
+        assert _run(source_vault, tmp_path / "serial", []) == 0
+        assert _run(source_vault, tmp_path / "fast", ["--parser", "fast", "--jobs", "3"]) == 0
+
+    assert _snapshot(tmp_path / "fast") == _snapshot(tmp_path / "serial")
+    worker = _make_obsidian_worker(BlockReferenceScanner(), {}, DEFAULT_DATE_LINK_FORMATS, "fast")
+    assert worker.parser.backend == "fast"
+
+
+def _names(nodes):
+    return [(node["name"], node["type"], node["supertags"], _names(node["children"])) for node in nodes]
+
+
+def test_parallel_tana_conversion_matches_serial(source_vault, tmp_path):
+    outputs = []
+    for jobs in (1, 3):
+        destination = tmp_path / f"export{jobs}.json"
+        assert convert_to_tana(source_vault, destination, verbose=False, force=False, jobs=jobs) == 0
+        data = json.loads(destination.read_text())
+        # Block uids are random; compare everything else
+        outputs.append((_names(data["nodes"]), data["supertags"], data["summary"], len(data["homeNodeIds"])))
+
+    assert outputs[0] == outputs[1]
+    assert {f"topic{idx}" for idx in range(1, 7)} <= {tag["name"] for tag in outputs[1][1]}
+
+
+def test_parallel_blinko_conversion_matches_serial(source_vault, monkeypatch):
+    monkeypatch.setenv("BLINKO_TOKEN", "token")
+    notes = {}
+    for jobs in (1, 3):
+        with patch("logseq_converter.cli.BlinkoClient") as client:
+            assert convert_to_blinko(source_vault, "http://blinko.test", verbose=False, jobs=jobs) == 0
+        notes[jobs] = [call.args[0] for call in client.return_value.upsert_note.call_args_list]
+
+    assert len(notes[1]) == 12
+    assert notes[1] == notes[3]
@@ -0,0 +1,65 @@
+import json
+import sys
+from unittest.mock import patch
+
+from logseq_converter.cli import main
+
+
+def test_obsidian_profile_reports_phases_and_files(tmp_path, capsys):
+    source = tmp_path / "source_vault"
+    (source / "pages").mkdir(parents=True)
+    (source / "journals").mkdir()
+    (source / "assets").mkdir()
+    (source / "assets" / "image.png").write_bytes(b"png")
+    (source / "journals" / "2025_11_27.md").write_text("- Journal entry\n- #learnings\n  - Learned profiling\n")
+    (source / "pages" / "Page.md").write_text("- A page\n")
+    dest = tmp_path / "dest"
+    profile_path = tmp_path / "profile.json"
+
+    test_args = [
+        "logseq-converter",
+        "obsidian",
+        str(source),
+        str(dest),
+        "--profile",
+        "--profile-json",
+        str(profile_path),
+    ]
+    with patch.object(sys, "argv", test_args), patch(
+        "logseq_converter.obsidian.configurator.configure_community_plugins"
+    ):
+        assert main() == 0
+
+    output = capsys.readouterr().out
+    assert "Profile:" in output
+    assert "Slowest files (of 2):" in output
+
+    data = json.loads(profile_path.read_text())
+    assert [phase["name"] for phase in data["phases"]] == [
+        "block-id scan",
+        "copy assets",
+        "journals",
+        "llm resolution",
+        "extracted files",
+        "pages",
+        "configure vault",
+        "community plugins",
+    ]
+    assert {item["path"] for item in data["files"]["slowest"]} == {
+        str(source / "journals" / "2025_11_27.md"),
+        str(source / "pages" / "Page.md"),
+    }
+
+
+def test_obsidian_without_profile_prints_no_report(tmp_path, capsys):
+    source = tmp_path / "source_vault"
+    (source / "pages").mkdir(parents=True)
+    (source / "pages" / "Page.md").write_text("- A page\n")
+
+    test_args = ["logseq-converter", "obsidian", str(source), str(tmp_path / "dest")]
+    with patch.object(sys, "argv", test_args), patch(
+        "logseq_converter.obsidian.configurator.configure_community_plugins"
+    ):
+        assert main() == 0
+
+    assert "Profile:" not in capsys.readouterr().out
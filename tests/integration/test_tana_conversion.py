@@ -1,5 +1,7 @@
 import json
 
+import pytest
+
 from logseq_converter.cli import convert_to_tana
 
 
@@ -50,3 +52,118 @@ def test_end_to_end_conversion(tmp_path):
 
         # Check tag (should be in global supertags list)
         assert "tag" in [t["name"] for t in data["supertags"]]
+
+
+def test_fast_parser_produces_same_output(tmp_path):
+    source = tmp_path / "logseq_vault"
+    (source / "pages").mkdir(parents=True)
+    (source / "journals").mkdir(parents=True)
+    (source / "pages" / "Outline.md").write_text(
+        "tags:: project\n\n- Parent [[Other]]\n\t- Child #idea\n\t  id:: 550e8400-e29b-41d4-a716-446655440000\n"
+        "- [Link](https://example.com)\n",
+        encoding="utf-8",
+    )
+    # Uses markdown the fast parser leaves to mistletoe
+    (source / "pages" / "Code.md").write_text("- Snippet\n  ```\n  print()\n  ```\n", encoding="utf-8")
+    (source / "journals" / "2023_11_30.md").write_text("- ## #links\n  - [A](https://a.example)\n", encoding="utf-8")
+
+    outputs = []
+    for backend in ("mistletoe", "fast"):
+        destination = tmp_path / f"{backend}.json"
+        assert convert_to_tana(source, destination, verbose=False, force=False, parser_backend=backend) == 0
+        data = json.loads(destination.read_text())
+        # Uids and timestamps differ between runs; compare the node names and structure
+        outputs.append((_names(data["nodes"]), sorted(tag["name"] for tag in data["supertags"])))
+
+    assert outputs[0] == outputs[1]
+
+
+def _names(nodes):
+    return [(node["name"], node.get("type"), _names(node.get("children", []))) for node in nodes]
+
+
+def test_second_run_reuses_parse_cache(tmp_path, capsys):
+    source = tmp_path / "logseq_vault"
+    (source / "pages").mkdir(parents=True)
+    (source / "journals").mkdir(parents=True)
+    (source / "pages" / "Page1.md").write_text("- Block 1 #tag\n  - Child 1\n", encoding="utf-8")
+
+    outputs = []
+    for run in range(2):
+        destination = tmp_path / f"export{run}.json"
+        assert convert_to_tana(source, destination, verbose=True, force=False) == 0
+        outputs.append(_names(json.loads(destination.read_text())["nodes"]))
+
+    assert outputs[0] == outputs[1]
+    log = capsys.readouterr().err
+    assert "Parse cache: 0 file(s) reused, 1 parsed" in log
+    assert "Parse cache: 1 file(s) reused, 0 parsed" in log
+
+
+def test_streamed_pages_convert_like_whole_pages(tmp_path):
+    source = tmp_path / "logseq_vault"
+    (source / "pages").mkdir(parents=True)
+    (source / "journals").mkdir(parents=True)
+    (source / "pages" / "Page1.md").write_text(
+        "tags:: project\n\n- Block 1 #tag\n  - Child [[Other]]\n- Fence\n```\n- code\n```\n- Block 2\n",
+        encoding="utf-8",
+    )
+    (source / "journals" / "2023_11_30.md").write_text("- Journal Block\n", encoding="utf-8")
+
+    outputs = []
+    for threshold in (0, 8):
+        destination = tmp_path / f"export{threshold}.json"
+        ret = convert_to_tana(
+            source, destination, verbose=False, force=False, parse_cache=False, stream_threshold_mb=threshold
+        )
+        assert ret == 0
+        data = json.loads(destination.read_text())
+        outputs.append((_names(data["nodes"]), [tag["name"] for tag in data["supertags"]], data["summary"]))
+
+    assert outputs[0] == outputs[1]
+
+
+def test_page_that_fails_to_write_is_skipped(tmp_path, monkeypatch, capsys):
+    from logseq_converter.tana import writer
+
+    source = tmp_path / "logseq_vault"
+    (source / "pages").mkdir(parents=True)
+    (source / "journals").mkdir(parents=True)
+    (source / "pages" / "Bad.md").write_text("- Cannot be written\n", encoding="utf-8")
+    (source / "pages" / "Good.md").write_text("- Fine\n", encoding="utf-8")
+    encode_node = writer.encode_node
+
+    def failing_encode_node(node, indent=""):
+        if node.name == "Bad":
+            raise RecursionError("maximum recursion depth exceeded")
+        return encode_node(node, indent)
+
+    monkeypatch.setattr(writer, "encode_node", failing_encode_node)
+    destination = tmp_path / "export.json"
+
+    assert convert_to_tana(source, destination, verbose=False, force=False, parse_cache=False) == 0
+
+    data = json.loads(destination.read_text())
+    assert [node["name"] for node in data["nodes"]] == ["Good"]
+    assert data["summary"]["topLevelNodes"] == 1
+    assert "Error processing page Bad.md" in capsys.readouterr().err
+
+
+def test_failed_export_leaves_no_temporary_file(tmp_path, monkeypatch):
+    from logseq_converter.tana.writer import TanaStreamWriter
+
+    source = tmp_path / "logseq_vault"
+    (source / "pages").mkdir(parents=True)
+    (source / "journals").mkdir(parents=True)
+    (source / "pages" / "Page1.md").write_text("- Block\n", encoding="utf-8")
+
+    def failing_close(self, supertags):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(TanaStreamWriter, "close", failing_close)
+    destination = tmp_path / "export.json"
+
+    with pytest.raises(OSError):
+        convert_to_tana(source, destination, verbose=False, force=False, parse_cache=False)
+
+    assert list(tmp_path.glob("export.json*")) == []
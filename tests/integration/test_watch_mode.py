@@ -0,0 +1,97 @@
+import sys
+from unittest.mock import patch
+
+from logseq_converter.cli import main, watch_and_convert
+from logseq_converter.watch import diff_snapshots, snapshot_markdown_files
+
+
+def test_obsidian_watch_reconverts_changed_journal(tmp_path, capsys):
+    source = tmp_path / "source_vault"
+    (source / "pages").mkdir(parents=True)
+    (source / "journals").mkdir()
+    journal = source / "journals" / "2025_11_27.md"
+    journal.write_text("- Journal entry\n- #learnings\n  - Learned about manifests\n")
+    (source / "pages" / "Other.md").write_text("- Other page\n")
+    dest = tmp_path / "dest"
+
+    def fake_watch(directories, on_change, *args, **kwargs):
+        assert directories == [source / "pages", source / "journals"]
+        # The initial conversion already ran
+        assert (dest / "Learnings" / "Learned manifests.md").exists()
+        journal.write_text("- Journal entry edited\n- #learnings\n  - Learned about stat diffs\n")
+        on_change([journal], [])
+        raise KeyboardInterrupt
+
+    test_args = ["logseq-converter", "obsidian", str(source), str(dest), "--watch"]
+    with patch.object(sys, "argv", test_args), patch(
+        "logseq_converter.obsidian.configurator.configure_community_plugins"
+    ), patch("logseq_converter.watch.watch_files", fake_watch):
+        assert main() == 0
+
+    captured = capsys.readouterr()
+    assert "1 new or changed, 0 removed, 1 unchanged" in captured.err
+    assert "Stopped watching." in captured.err
+    assert "edited" in (dest / "Daily" / "2025-11-27.md").read_text()
+    assert (dest / "Learnings" / "Learned stat diffs.md").exists()
+    assert not (dest / "Learnings" / "Learned manifests.md").exists()
+
+
+def test_watch_rejects_dry_run(tmp_path):
+    test_args = ["logseq-converter", "tolaria", str(tmp_path), str(tmp_path / "dest"), "--watch", "--dry-run"]
+    with patch.object(sys, "argv", test_args):
+        assert main() == 1
+
+
+def test_watch_reruns_only_reported_files_and_survives_errors(tmp_path, capsys):
+    source = tmp_path / "source_vault"
+    (source / "pages").mkdir(parents=True)
+    (source / "journals").mkdir()
+    page = source / "pages" / "Page.md"
+    page.write_text("- Page\n")
+    other = source / "pages" / "Other.md"
+    other.write_text("- Other page\n")
+    dest = tmp_path / "dest"
+
+    def fake_watch(directories, on_change, *args, **kwargs):
+        with patch("logseq_converter.cli._plan_incremental", side_effect=RuntimeError("disk full")):
+            on_change([page], [])
+        page.write_text("- Page edited\n")
+        other.unlink()
+        with patch("logseq_converter.cli.os.walk", side_effect=AssertionError("graph rescanned")):
+            on_change([page], [other])
+        raise KeyboardInterrupt
+
+    test_args = ["logseq-converter", "tolaria", str(source), str(dest), "--watch"]
+    with patch.object(sys, "argv", test_args), patch("logseq_converter.watch.watch_files", fake_watch):
+        assert main() == 0
+
+    captured = capsys.readouterr()
+    assert "Reconversion failed, still watching: disk full" in captured.err
+    assert "1 new or changed, 1 removed, 0 unchanged" in captured.err
+    assert "edited" in (dest / "Page.md").read_text()
+    assert not (dest / "Other.md").exists()
+
+
+def test_watch_reports_edits_saved_during_the_first_conversion(tmp_path):
+    source = tmp_path / "source_vault"
+    (source / "pages").mkdir(parents=True)
+    (source / "journals").mkdir()
+    page = source / "pages" / "Page.md"
+    page.write_text("- Page\n")
+    calls = []
+
+    def convert_then_edit(**kwargs):
+        calls.append(kwargs)
+        if len(calls) == 1:
+            page.write_text("- Page, saved mid-run\n")
+        return 0
+
+    def fake_watch(directories, on_change, *args, snapshot=None, **kwargs):
+        changed, removed = diff_snapshots(snapshot, snapshot_markdown_files(directories))
+        on_change(changed, removed)
+        raise KeyboardInterrupt
+
+    with patch("logseq_converter.watch.watch_files", fake_watch):
+        assert watch_and_convert(source, convert_then_edit) == 0
+
+    assert calls[1] == {"clear_llm_cache": False, "changes": ([page], [])}
@@ -0,0 +1,98 @@
+import os
+
+from logseq_converter.logseq.block_index import PersistentBlockIndex
+
+ID_A = "64a1b2c3-0000-4000-8000-00000000000a"
+ID_B = "64a1b2c3-0000-4000-8000-00000000000b"
+
+
+def _scan(index, files):
+    for file_path in files:
+        if index.needs_scan(file_path):
+            index.scan_content(file_path, file_path.read_text())
+    index.prune(files)
+    index.save()
+
+
+def _graph(tmp_path):
+    graph = tmp_path / "graph"
+    (graph / "pages").mkdir(parents=True)
+    a = graph / "pages" / "a.md"
+    b = graph / "pages" / "b.md"
+    a.write_text(f"- block\n  id:: {ID_A}")
+    b.write_text(f"- other\n  id:: {ID_B}")
+    return graph, a, b
+
+
+def test_index_persists_and_rescans_only_changed_files(tmp_path):
+    graph, a, b = _graph(tmp_path)
+    db_path = tmp_path / "index.sqlite3"
+
+    index = PersistentBlockIndex(graph, db_path)
+    _scan(index, [a, b])
+    assert index.rescanned == 2
+
+    reopened = PersistentBlockIndex(graph, db_path)
+    assert reopened.get_file_for_block(ID_A) == a
+    assert reopened.get_file_for_block(ID_B) == b
+
+    b.write_text(f"- moved\n  id:: {ID_A}")
+    stat = b.stat()
+    os.utime(b, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    a.write_text("- no ids left")
+    os.utime(a, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2_000_000))
+
+    _scan(reopened, [a, b])
+    assert reopened.rescanned == 2
+    assert reopened.get_file_for_block(ID_A) == b
+    assert reopened.get_file_for_block(ID_B) is None
+
+    unchanged = PersistentBlockIndex(graph, db_path)
+    _scan(unchanged, [a, b])
+    assert unchanged.rescanned == 0
+    assert unchanged.get_file_for_block(ID_A) == b
+
+
+def test_removed_files_are_pruned(tmp_path):
+    graph, a, b = _graph(tmp_path)
+    db_path = tmp_path / "index.sqlite3"
+
+    _scan(PersistentBlockIndex(graph, db_path), [a, b])
+    b.unlink()
+    _scan(PersistentBlockIndex(graph, db_path), [a])
+
+    index = PersistentBlockIndex(graph, db_path)
+    assert index.get_file_for_block(ID_A) == a
+    assert index.get_file_for_block(ID_B) is None
+
+
+def test_corrupt_index_starts_empty(tmp_path):
+    graph, a, b = _graph(tmp_path)
+    db_path = tmp_path / "index.sqlite3"
+    db_path.write_bytes(b"not a database")
+
+    index = PersistentBlockIndex(graph, db_path)
+    assert index.block_map == {}
+    _scan(index, [a, b])
+    assert index.get_file_for_block(ID_A) == a
+
+
+def test_index_location_is_keyed_by_graph(tmp_path):
+    first = PersistentBlockIndex.path_for_graph(tmp_path, tmp_path / "one")
+    second = PersistentBlockIndex.path_for_graph(tmp_path, tmp_path / "two")
+    assert first != second
+    assert first.parent == tmp_path / "block_index"
+
+
+def test_forgotten_files_drop_their_blocks(tmp_path):
+    graph, a, b = _graph(tmp_path)
+    db_path = tmp_path / "index.sqlite3"
+
+    index = PersistentBlockIndex(graph, db_path)
+    _scan(index, [a, b])
+    index.forget([b, graph / "pages" / "never-indexed.md"])
+    index.save()
+
+    reloaded = PersistentBlockIndex(graph, db_path)
+    assert reloaded.get_file_for_block(ID_A) == a
+    assert reloaded.get_file_for_block(ID_B) is None
@@ -0,0 +1,87 @@
+import asyncio
+
+from logseq_converter.concurrency import AdaptiveConcurrency
+
+
+def _run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_limit_doubles_per_round_trip_until_congestion():
+    async def scenario():
+        limit = AdaptiveConcurrency(1, 16)
+        for _ in range(3):
+            tokens = [await limit.acquire() for _ in range(int(limit.limit))]
+            for token in tokens:
+                await limit.release(token, latency=1.0)
+        return limit.limit
+
+    assert _run(scenario()) == 8
+
+
+def test_limit_stays_within_bounds():
+    async def scenario():
+        limit = AdaptiveConcurrency(2, 4)
+        for _ in range(20):
+            await limit.release(await limit.acquire(), latency=1.0)
+        highest = limit.limit
+        for _ in range(5):
+            await limit.release(await limit.acquire(), congested=True)
+        return highest, limit.limit
+
+    assert _run(scenario()) == (4, 2)
+
+
+def test_rate_limit_halves_once_per_round_trip():
+    async def scenario():
+        limit = AdaptiveConcurrency(1, 16)
+        limit.limit = 8.0
+        tokens = [await limit.acquire() for _ in range(8)]
+        # Every request sent before the first rate limit was answered is rate limited too
+        for token in tokens:
+            await limit.release(token, congested=True)
+        return limit.limit
+
+    assert _run(scenario()) == 4
+
+
+def test_additive_increase_after_congestion():
+    async def scenario():
+        limit = AdaptiveConcurrency(1, 16)
+        limit.limit = 8.0
+        await limit.release(await limit.acquire(), congested=True)
+        # A round trip at the new limit of 4 adds one
+        tokens = [await limit.acquire() for _ in range(4)]
+        for token in tokens:
+            await limit.release(token, latency=1.0)
+        return limit.limit
+
+    assert 4.9 < _run(scenario()) < 5.1
+
+
+def test_rising_latency_counts_as_congestion():
+    async def scenario():
+        limit = AdaptiveConcurrency(1, 16)
+        limit.limit = 8.0
+        await limit.release(await limit.acquire(), latency=1.0)
+        before = limit.limit
+        while limit.limit >= before:
+            await limit.release(await limit.acquire(), latency=10.0)
+        return before, limit.limit
+
+    before, after = _run(scenario())
+    assert after == before / 2
+
+
+def test_acquire_waits_for_a_free_slot():
+    async def scenario():
+        limit = AdaptiveConcurrency(1, 1)
+        token = await limit.acquire()
+        waiter = asyncio.create_task(limit.acquire())
+        await asyncio.sleep(0)
+        blocked = not waiter.done()
+        await limit.release(token, latency=1.0)
+        await waiter
+        return blocked, limit.in_flight
+
+    assert _run(scenario()) == (True, 1)
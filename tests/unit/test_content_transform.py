@@ -0,0 +1,221 @@
+import random
+import re
+from pathlib import Path
+from typing import Collection
+
+import pytest
+
+from logseq_converter.logseq.parser import BlockReferenceScanner
+from logseq_converter.logseq.properties import lex_property_line, lex_yaml_line
+from logseq_converter.obsidian.converter import ObsidianConverter
+from logseq_converter.obsidian.transform import strip_logbooks
+
+UUID = "64a1b2c3-0000-4000-8000-000000000001"
+UNKNOWN_UUID = "64a1b2c3-0000-4000-8000-0000000000ff"
+
+
+# The multi-pass pipeline convert_content used before the single-pass engine, kept as its reference
+
+
+def remove_logbook(content: str) -> str:
+    # Remove :LOGBOOK: ... :END:
+    return re.sub(r":LOGBOOK:.*?:END:", "", content, flags=re.DOTALL)
+
+
+def filter_frontmatter_properties(content: str, excluded: Collection[str]) -> str:
+    """Filters excluded properties from existing YAML frontmatter."""
+    lines = content.split("\n")
+
+    # Check if content starts with frontmatter
+    if not lines or lines[0].strip() != "---":
+        return content
+
+    # Find the end of frontmatter
+    frontmatter_end_idx = None
+    for i in range(1, len(lines)):
+        if lines[i].strip() == "---":
+            frontmatter_end_idx = i
+            break
+
+    if frontmatter_end_idx is None:
+        # Malformed frontmatter, return as-is
+        return content
+
+    result_lines = [lines[0]]  # Keep opening ---
+    for i in range(1, frontmatter_end_idx):
+        token = lex_yaml_line(lines[i])
+        if token and token.key in excluded:
+            continue
+        result_lines.append(lines[i])
+    result_lines.append(lines[frontmatter_end_idx])  # Keep closing ---
+
+    # Add the rest of the content
+    result_lines.extend(lines[frontmatter_end_idx + 1 :])
+    return "\n".join(result_lines)
+
+
+def transform_properties(content: str, excluded: Collection[str]) -> str:
+    """Turns the key:: value lines at the top of the page into frontmatter."""
+    lines = content.split("\n")
+    extracted_props = {}
+
+    idx = 0
+    # Extract properties from the top of the file
+    while idx < len(lines):
+        line = lines[idx]
+        token = lex_property_line(line)
+        if token:
+            # Only include properties that are not in the exclusion list
+            if token.key not in excluded:
+                extracted_props[token.key] = token.value
+            idx += 1
+        elif line.strip() == "":
+            idx += 1
+        else:
+            break
+
+    if extracted_props:
+        frontmatter = ["---"]
+        for k, v in extracted_props.items():
+            frontmatter.append(f"{k}: {v}")
+        frontmatter.append("---\n")
+
+        return "\n".join(frontmatter) + "\n" + "\n".join(lines[idx:])
+
+    return content
+
+
+def remove_excluded_properties_from_body(content: str, excluded: Collection[str]) -> str:
+    """Removes excluded key:: value lines after the frontmatter."""
+    lines = content.split("\n")
+    result_lines = []
+    in_frontmatter = False
+    frontmatter_end = False
+
+    for i, line in enumerate(lines):
+        # Track frontmatter boundaries
+        if i == 0 and line.strip() == "---":
+            in_frontmatter = True
+            result_lines.append(line)
+            continue
+        elif in_frontmatter and line.strip() == "---":
+            in_frontmatter = False
+            frontmatter_end = True
+            result_lines.append(line)
+            continue
+        elif in_frontmatter:
+            # Keep all frontmatter content as-is
+            result_lines.append(line)
+            continue
+
+        # After frontmatter, skip lines that are only an excluded key:: value
+        if frontmatter_end or i > 0:
+            token = lex_property_line(line)
+            if token and token.key in excluded:
+                continue
+
+        result_lines.append(line)
+
+    return "\n".join(result_lines)
+
+
+def reference_convert_content(converter: ObsidianConverter, content: str) -> str:
+    excluded = converter.EXCLUDED_PROPERTIES
+    content = remove_logbook(content)
+    content = filter_frontmatter_properties(content, excluded)
+    content = transform_properties(content, excluded)
+    content = remove_excluded_properties_from_body(content, excluded)
+    content = converter._transform_block_ids(content)
+    content = converter._transform_block_refs(content)
+    return converter._transform_date_links(content)
+
+
+@pytest.fixture
+def converter():
+    scanner = BlockReferenceScanner()
+    scanner.block_map[UUID] = Path("pages/Target___Page.md")
+    return ObsidianConverter(scanner)
+
+
+FRAGMENTS = [
+    "",
+    " ",
+    "---",
+    "  ---  ",
+    "- Block",
+    "  - Child block",
+    "plain text",
+    "title:: My Page",
+    "tags:: one, two",
+    "collapsed:: true",
+    "  heading:: 2",
+    "icon:: x",
+    "key::",
+    "key:: ",
+    "key::  ",
+    "title: yaml title",
+    "alias: yaml alias",
+    "  collapsed: true",
+    ":LOGBOOK:",
+    "  :LOGBOOK:",
+    "CLOCK: [2024-01-01 Mon 10:00]",
+    ":END:",
+    "  :END:",
+    "text :LOGBOOK: inline :END: after",
+    "- a :LOGBOOK:",
+    ":END: tail :LOGBOOK: again",
+    f"id:: {UUID}",
+    f"  id:: {UNKNOWN_UUID}",
+    "  id::",
+    "id::  ",
+    f"  {UUID}",
+    f"see (({UUID})) and (({UNKNOWN_UUID}))",
+    "[[2024-01-02]] [[Jan 3, 2024]] [[4 Feb 2024]] [[Some Page]]",
+    "[[2024/05/06]] [[not]] a [[date",
+    f"id:: {UUID} (({UUID})) [[2024-01-02]]",
+    "tags:: [[2024-01-02]]",
+    "\tcollapsed:: false",
+    "line with\rcarriage return",
+]
+
+
+def _random_document(rng: random.Random) -> str:
+    return "\n".join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 14)))
+
+
+def test_single_pass_matches_reference_on_random_documents(converter):
+    rng = random.Random(20240101)
+    for _ in range(3000):
+        content = _random_document(rng)
+        assert converter.convert_content(content) == reference_convert_content(converter, content), repr(content)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "",
+        "\n",
+        "title:: Page\n",
+        "collapsed:: true\n- Block",
+        "collapsed:: true\ntags:: a\n\n- Block\n  collapsed:: true",
+        "---\ntitle: x\nalias: y\n---\n- Block\n  heading:: 2",
+        "---\ntitle: x\n- never closed\n  collapsed:: true",
+        "- Task\n  :LOGBOOK:\n  CLOCK: x\n  :END:\n- Next",
+        "- Task :LOGBOOK: never closed\n- Next",
+        f"- Block\n  id::\n\n  {UUID}\n- Ref (({UUID}))",
+        "- [[2024-01-02]] and [[Not a date]]",
+    ],
+)
+def test_single_pass_matches_reference_on_edge_cases(converter, content):
+    assert converter.convert_content(content) == reference_convert_content(converter, content)
+
+
+def test_single_pass_counts_block_refs_like_reference(converter):
+    content = f"- (({UUID}))\n- (({UUID})) (({UNKNOWN_UUID}))"
+    converter.convert_content(content)
+    assert converter.stats.block_refs == 2
+
+
+def test_strip_logbooks_joins_text_around_drawer():
+    lines = ["before :LOGBOOK:", "CLOCK", "x :END: after", "next"]
+    assert list(strip_logbooks(lines)) == ["before  after", "next"]
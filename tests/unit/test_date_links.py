@@ -0,0 +1,77 @@
+import random
+from datetime import datetime
+
+import pytest
+
+from logseq_converter.date_links import DEFAULT_DATE_LINK_FORMATS, DateLinkRecognizer, compile_date_format
+from logseq_converter.obsidian.converter import ObsidianConverter
+
+
+def strptime_parse(text, formats=DEFAULT_DATE_LINK_FORMATS):
+    for fmt in formats:
+        try:
+            return datetime.strptime(text, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "2024-01-05",
+        "2024-1-5",
+        "2024/12/31",
+        "2023-02-29",
+        "2024-02-29",
+        "0000-01-01",
+        "0999-01-01",
+        "5 Jan 2024",
+        "05 jan 2024",
+        " 5 Jan 2024",
+        "5  Jan\t2024",
+        "31 Apr 2024",
+        "Jan 5, 2024",
+        "JAN 05, 2024",
+        "January 5, 2024",
+        "2024-01-05 ",
+        "2024-01-5x",
+        "2024-13-01",
+        "Some Page",
+        "Page 2024",
+        "",
+    ],
+)
+def test_recognizer_agrees_with_strptime(text):
+    assert DateLinkRecognizer().parse(text) == strptime_parse(text)
+
+
+def test_recognizer_agrees_with_strptime_on_random_text():
+    rng = random.Random(8)
+    alphabet = "0123456789-/ ,JanFebMayDec"
+    recognizer = DateLinkRecognizer()
+    for _ in range(20000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(6, 12)))
+        assert recognizer.parse(text) == strptime_parse(text), repr(text)
+
+
+def test_custom_formats_and_strptime_fallback():
+    formats = ["%d.%m.%y", "%B %d %Y", "%Y-%j"]
+    assert compile_date_format("%Y-%j") is None
+
+    recognizer = DateLinkRecognizer(formats)
+    for text in ["05.01.24", "5.1.99", "March 3 2021", "2024-032", "2024-01-05"]:
+        assert recognizer.parse(text) == strptime_parse(text, formats)
+
+
+def test_results_are_cached():
+    recognizer = DateLinkRecognizer(cache_size=2)
+    recognizer.parse("2024-01-05")
+    recognizer.parse("2024-01-05")
+    assert recognizer.parse.cache_info().hits == 1
+
+
+def test_converter_uses_configured_formats():
+    converter = ObsidianConverter(date_formats=["%d.%m.%Y"])
+    content = "- [[05.01.2024]] [[2024-01-05]]"
+    assert converter._transform_date_links(content) == "- [[Daily/2024-01-05]] [[2024-01-05]]"
@@ -0,0 +1,201 @@
+import json
+import sqlite3
+
+from logseq_converter.filename_cache import FilenameCache, read_stats
+
+NAMESPACE = "ollama:mistral:v1"
+
+
+def test_names_persist_after_commit(tmp_path):
+    db_path = tmp_path / "filename_cache.sqlite3"
+    cache = FilenameCache(db_path, NAMESPACE)
+    cache["a"] = "Name A"
+    assert cache.get("a") == "Name A"
+    cache.commit()
+    cache["b"] = "Name B"
+    cache.close()
+
+    reopened = FilenameCache(db_path, NAMESPACE)
+    assert reopened["a"] == "Name A"
+    assert reopened["b"] == "Name B"
+    assert "c" not in reopened
+    assert len(reopened) == 2
+
+
+def test_uncommitted_names_are_not_written(tmp_path):
+    db_path = tmp_path / "filename_cache.sqlite3"
+    cache = FilenameCache(db_path, NAMESPACE)
+    cache["a"] = "Name A"
+    cache.commit()
+    cache["b"] = "Name B"
+
+    # Another process reading before the next commit sees only committed names
+    other = FilenameCache(db_path, NAMESPACE)
+    assert other.get("a") == "Name A"
+    assert other.get("b") is None
+    assert len(cache) == 2
+
+
+def test_legacy_json_is_imported_once(tmp_path):
+    legacy_path = tmp_path / "filename_cache.json"
+    legacy_path.write_text(json.dumps({"a": "Old A", "b": "Old B"}), encoding="utf-8")
+
+    cache = FilenameCache(tmp_path / "filename_cache.sqlite3", NAMESPACE, legacy_path)
+
+    assert cache.get("a") == "Old A"
+    assert len(cache) == 2
+    assert not legacy_path.exists()
+
+
+def test_corrupt_legacy_json_is_ignored(tmp_path):
+    legacy_path = tmp_path / "filename_cache.json"
+    legacy_path.write_text("{not json", encoding="utf-8")
+
+    cache = FilenameCache(tmp_path / "filename_cache.sqlite3", NAMESPACE, legacy_path)
+
+    assert cache.get("a") is None
+    assert not legacy_path.exists()
+
+
+def test_corrupt_store_is_rebuilt(tmp_path):
+    db_path = tmp_path / "filename_cache.sqlite3"
+    db_path.write_bytes(b"not a database" * 100)
+
+    cache = FilenameCache(db_path, NAMESPACE)
+    cache["a"] = "Name A"
+    cache.close()
+
+    assert FilenameCache(db_path, NAMESPACE).get("a") == "Name A"
+
+
+def test_close_compacts_a_mostly_free_store(tmp_path):
+    db_path = tmp_path / "filename_cache.sqlite3"
+    cache = FilenameCache(db_path, NAMESPACE)
+    for i in range(2000):
+        cache[f"key-{i}"] = "x" * 200
+    cache.commit()
+    size = db_path.stat().st_size
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("DELETE FROM names")
+
+    cache.close()
+
+    assert db_path.stat().st_size < size / 4
+
+
+def test_namespaces_are_separate(tmp_path):
+    db_path = tmp_path / "filename_cache.sqlite3"
+    cache = FilenameCache(db_path, NAMESPACE)
+    cache["a"] = "Mistral A"
+    cache.close()
+
+    trial = FilenameCache(db_path, "openrouter:trial-model:v1")
+    assert trial.lookup("a") is None
+    trial["a"] = "Trial A"
+    trial.close()
+
+    assert FilenameCache(db_path, NAMESPACE)["a"] == "Mistral A"
+
+
+def test_fallback_to_other_namespaces(tmp_path):
+    db_path = tmp_path / "filename_cache.sqlite3"
+    cache = FilenameCache(db_path, NAMESPACE)
+    cache["a"] = "Mistral A"
+    cache.close()
+
+    trial = FilenameCache(db_path, "openrouter:trial-model:v1", fallback=True)
+    assert trial.lookup("a") == "Mistral A"
+    assert trial.lookup("b") is None
+    trial.close()
+
+    # Fallback hits are not copied into the trial namespace
+    assert len(FilenameCache(db_path, "openrouter:trial-model:v1")) == 0
+    [mistral, trial_stats] = read_stats(db_path)
+    assert (trial_stats.hits, trial_stats.fallback_hits, trial_stats.misses) == (0, 1, 1)
+    assert trial_stats.hit_rate == 0.5
+    assert mistral.entries == 1
+
+
+def test_least_recently_used_names_are_evicted(tmp_path):
+    db_path = tmp_path / "filename_cache.sqlite3"
+    cache = FilenameCache(db_path, NAMESPACE, max_entries=2)
+    for key in ("a", "b", "c"):
+        cache[key] = f"Name {key}"
+        cache.commit()
+    # Using "a" makes "b" the least recently used
+    cache.lookup("a")
+    cache.close()
+
+    reopened = FilenameCache(db_path, NAMESPACE)
+    assert "a" in reopened
+    assert "b" not in reopened
+    assert "c" in reopened
+
+
+def test_names_unused_beyond_max_age_are_evicted(tmp_path):
+    db_path = tmp_path / "filename_cache.sqlite3"
+    cache = FilenameCache(db_path, NAMESPACE, max_age_days=30)
+    cache["old"] = "Old"
+    cache["new"] = "New"
+    cache.commit()
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("UPDATE names SET last_used = last_used - 31 * 86400 * 1000000000 WHERE key = 'old'")
+
+    cache.close()
+
+    reopened = FilenameCache(db_path, NAMESPACE)
+    assert "old" not in reopened
+    assert "new" in reopened
+
+
+def test_worker_lookups_are_recorded_by_the_main_cache(tmp_path):
+    db_path = tmp_path / "filename_cache.sqlite3"
+    cache = FilenameCache(db_path, NAMESPACE)
+    cache["a"] = "Name A"
+    cache.commit()
+
+    worker = FilenameCache(db_path, NAMESPACE)
+    worker.lookup("a")
+    worker.lookup("b")
+    cache.add_updates(worker.take_updates())
+    cache.close()
+
+    [stats] = read_stats(db_path)
+    assert (stats.namespace, stats.entries, stats.hits, stats.misses) == (NAMESPACE, 1, 1, 1)
+
+
+def test_entry_cap_applies_per_namespace(tmp_path):
+    db_path = tmp_path / "filename_cache.sqlite3"
+    usual = FilenameCache(db_path, NAMESPACE, max_entries=2)
+    usual["a"] = "Name A"
+    usual["b"] = "Name B"
+    usual.close()
+    # A model tried later fills its own namespace with more recently used names
+    trial = FilenameCache(db_path, "openrouter:trial-model:v1", max_entries=2)
+    for key in ("c", "d", "e"):
+        trial[key] = f"Trial {key}"
+        trial.commit()
+    trial.close()
+
+    assert len(FilenameCache(db_path, NAMESPACE)) == 2
+    reopened = FilenameCache(db_path, "openrouter:trial-model:v1")
+    assert len(reopened) == 2
+    assert "c" not in reopened
+
+
+def test_length_counts_many_pending_names(tmp_path):
+    cache = FilenameCache(tmp_path / "filename_cache.sqlite3", NAMESPACE)
+    cache["stored"] = "Stored"
+    cache.commit()
+    for i in range(40_000):
+        cache[f"key {i}"] = f"Name {i}"
+    cache["stored"] = "Renamed"
+
+    assert len(cache) == 40_001
+
+
+def test_stats_of_missing_store(tmp_path):
+    db_path = tmp_path / "filename_cache.sqlite3"
+
+    assert read_stats(db_path) == []
+    assert not db_path.exists()
@@ -1,3 +1,6 @@
+import pytest
+
+from logseq_converter.logseq.parser import PARSER_BACKENDS
 from logseq_converter.obsidian.converter import ObsidianConverter
 
 
@@ -41,7 +44,7 @@ def test_remove_logbook():
   :END:
 - Task 2
 """
-    result = converter.remove_logbook(content)
+    result = converter.convert_content(content)
     assert ":LOGBOOK:" not in result
     assert "CLOCK:" not in result
     assert ":END:" not in result
@@ -91,3 +94,51 @@ def test_extract_sections_with_heading_markers():
         elif "Learned" in name:
             assert "Learned something new" in file_content
             assert "- details here" in file_content
+
+
+def test_extract_sections_parses_journal_once(monkeypatch):
+    from logseq_converter.logseq.parser import LogSeqParser
+
+    parsed = []
+    parse_roots = LogSeqParser._parse_roots
+    monkeypatch.setattr(
+        LogSeqParser, "_parse_roots", lambda self, body, offset: parsed.append(body) or parse_roots(self, body, offset)
+    )
+    converter = ObsidianConverter()
+    content = "- Entry\n- #links\n  - [Google](https://google.com)\n- #learnings\n  - Something\n"
+
+    _, extracted_files = converter.extract_sections(content, "2025_11_27.md")
+
+    assert parsed == [content]
+    assert [name for name, _ in extracted_files] == ["Links/Google.md", "Learnings/Something.md"]
+    # Journals without sections are not parsed at all
+    assert converter.extract_sections("- No sections here", "2025_11_27.md") == ("- No sections here", [])
+    assert len(parsed) == 1
+
+
+@pytest.mark.parametrize("backend", PARSER_BACKENDS)
+@pytest.mark.parametrize(
+    "content, remaining, names",
+    [
+        # A bulleted section runs to the next top-level bullet, taking rules, headings and paragraphs along
+        ("- #links\n  - [Google](https://google.com)\n\n---\n- Other\n", "- Other\n", ["Links/Google.md"]),
+        ("- #learnings\n  - Something\n\nkey:: value\n- Other\n", "- Other\n", ["Learnings/Something.md"]),
+        ("- #links\n  - [Google](https://google.com)\n\n## Notes\nText\n", "", ["Links/Google.md"]),
+        # Including a heading section right after it, whose items are then not extracted
+        ("- #learnings\n  - Something\n## #highlights\n- #links\n", "", ["Learnings/Something.md"]),
+    ],
+)
+def test_extract_sections_drops_lines_up_to_the_next_bullet(backend, content, remaining, names):
+    converter = ObsidianConverter(parser_backend=backend)
+
+    modified_content, extracted_files = converter.extract_sections(content, "2025_11_27.md")
+
+    assert modified_content == remaining
+    assert [name for name, _ in extracted_files] == names
+
+
+def test_extract_sections_skips_frontmatter():
+    # Unlike the line scanner this replaced, section tags inside frontmatter are left alone
+    content = "---\ntags:\n- #links\n---\n- Entry\n"
+
+    assert ObsidianConverter().extract_sections(content, "2025_11_27.md") == (content, [])
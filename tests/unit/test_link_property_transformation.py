@@ -21,7 +21,7 @@ alias: alias1
 
 - Block 1
 """
-    assert converter._transform_properties(content) == expected
+    assert converter.convert_content(content) == expected
 
 
 def test_transform_block_ids():
@@ -1,4 +1,17 @@
-from logseq_converter.llm import LLMFilenameGenerator, OllamaLLMClient, OpenRouterLLMClient
+import asyncio
+import json
+import re
+from types import SimpleNamespace
+
+from openai import RateLimitError
+
+from logseq_converter.llm import (
+    MAX_ATTEMPTS,
+    LLMFilenameGenerator,
+    OllamaLLMClient,
+    OpenRouterLLMClient,
+    parse_filename_list,
+)
 
 
 def test_provider_resolution():
@@ -12,14 +25,14 @@ def test_provider_resolution():
     assert generator.provider == "openrouter"
     assert isinstance(generator.client, OpenRouterLLMClient)
     assert generator.client.model == "google/gemini-2.5-flash-lite"
-    assert generator.client.max_workers == 15
+    assert generator.client.max_workers == 64
 
     # Test auto-detection: OLLAMA_HOST set
     generator = LLMFilenameGenerator(env={"OLLAMA_HOST": "http://192.168.1.10:11434"})
     assert generator.provider == "ollama"
     assert isinstance(generator.client, OllamaLLMClient)
     assert generator.client.model == "gemma4:e4b"
-    assert generator.client.max_workers == 1
+    assert generator.client.max_workers == 4
 
     # Test explicit override LSC_LLM
     generator = LLMFilenameGenerator(env={"LSC_LLM": "none", "LSC_API_KEY": "sk-or-12345"})
@@ -29,7 +42,7 @@ def test_provider_resolution():
     generator = LLMFilenameGenerator(env={"LSC_LLM": "ollama", "LSC_MODEL": "mistral"})
     assert generator.provider == "ollama"
     assert generator.client.model == "mistral"
-    assert generator.client.max_workers == 1
+    assert generator.client.max_workers == 4
 
 
 def test_hashing_and_caching(tmp_path):
@@ -39,7 +52,7 @@ def test_hashing_and_caching(tmp_path):
         "XDG_CACHE_HOME": str(tmp_path),
         "LOCALAPPDATA": str(tmp_path)
     })
-    assert generator.cache_path.name == "filename_cache.json"
+    assert generator.cache_path.name == "filename_cache.sqlite3"
 
     description = "Learned how to test LLM code"
     sub_items = ["- detail 1", "- detail 2"]
@@ -113,3 +126,145 @@ def test_resolve_placeholders(tmp_path):
     # Should resolve to the fallback name based on content under none provider
     assert resolved[1][0] == "Learnings/Setting up FastAPI project.md"
     assert resolved[1][1] == extracted_files[1][1]
+
+
+def test_cache_namespace_per_model(tmp_path):
+    env = {"XDG_CACHE_HOME": str(tmp_path), "LOCALAPPDATA": str(tmp_path), "LSC_LLM": "ollama"}
+    mistral = LLMFilenameGenerator(env={**env, "LSC_MODEL": "mistral"})
+    gemma = LLMFilenameGenerator(env={**env, "LSC_MODEL": "gemma", "LSC_CACHE_FALLBACK": "1"})
+    assert mistral.cache.namespace == "ollama:mistral:v1"
+    assert not mistral.cache.fallback
+    assert gemma.cache.fallback
+
+    mistral.cache["hash"] = "Mistral Name"
+    mistral.cache.close()
+
+    assert gemma.cache.get("hash") == "Mistral Name"
+    assert LLMFilenameGenerator(env={**env, "LSC_MODEL": "gemma"}).cache.get("hash") is None
+
+
+def test_cache_caps_from_env(tmp_path):
+    generator = LLMFilenameGenerator(
+        env={"XDG_CACHE_HOME": str(tmp_path), "LSC_CACHE_MAX_ENTRIES": "10", "LSC_CACHE_MAX_AGE_DAYS": "bad"}
+    )
+    assert generator.cache.max_entries == 10
+    assert generator.cache.max_age_days == 0
+
+
+class _FakeCompletions:
+    """Answers chat completions with a name built from the note's description."""
+
+    def __init__(self, rate_limited: int = 0, reply=None):
+        self.rate_limited = rate_limited
+        # Builds the reply to a batch prompt from the notes' descriptions
+        self.reply = reply or (lambda descriptions: json.dumps([f"{d} Note" for d in descriptions]))
+        self.requests = 0
+        self.in_flight = 0
+        self.peak = 0
+
+    async def create(self, model, messages, **kwargs):
+        self.requests += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.001)
+            if self.rate_limited:
+                self.rate_limited -= 1
+                response = SimpleNamespace(status_code=429, headers={"retry-after": "0"}, request=None)
+                raise RateLimitError("Too many requests", response=response, body=None)
+            prompt = messages[1]["content"]
+            if "Content:\n" in prompt:
+                description = prompt.split("Content:\n", 1)[1].split("\n", 1)[0]
+                message = SimpleNamespace(content=f'"{description} Note.md"')
+            else:
+                descriptions = re.findall(r"^Note \d+:\n(.*)$", prompt, re.MULTILINE)
+                message = SimpleNamespace(content=self.reply(descriptions))
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+        finally:
+            self.in_flight -= 1
+
+
+class _FakeAsyncClient:
+    def __init__(self, completions: _FakeCompletions):
+        self.chat = SimpleNamespace(completions=completions)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+def _fake_client(completions: _FakeCompletions) -> OllamaLLMClient:
+    client = OllamaLLMClient()
+    client.create_client = lambda: _FakeAsyncClient(completions)
+    return client
+
+
+def test_resolve_batch_keeps_order_within_max_concurrency():
+    completions = _FakeCompletions()
+    client = _fake_client(completions)
+    client.set_concurrency(maximum=3)
+    items = [(f"Item {i}", []) for i in range(20)]
+    resolved = []
+
+    results = client.resolve_batch(items, on_resolve=lambda idx, name: resolved.append(idx))
+
+    assert results == [f"Item {i} Note" for i in range(20)]
+    assert sorted(resolved) == list(range(20))
+    assert completions.requests == 20
+    assert 1 < completions.peak <= 3
+
+
+def test_resolve_batch_retries_rate_limited_requests():
+    completions = _FakeCompletions(rate_limited=2)
+    client = _fake_client(completions)
+
+    results = client.resolve_batch([("Only item", [])])
+
+    assert results == ["Only item Note"]
+    assert completions.requests == 3
+
+
+def test_resolve_batch_falls_back_when_rate_limited_throughout():
+    completions = _FakeCompletions(rate_limited=100)
+    client = _fake_client(completions)
+
+    results = client.resolve_batch([("Setting up FastAPI project", [])])
+
+    assert results == ["Setting up FastAPI project"]
+    assert completions.requests == MAX_ATTEMPTS
+
+
+def test_resolve_batch_names_several_notes_per_request():
+    completions = _FakeCompletions()
+    client = _fake_client(completions)
+    client.batch_size = 4
+    items = [(f"Item {i}", [f"- detail {i}"]) for i in range(10)]
+
+    results = client.resolve_batch(items)
+
+    assert results == [f"Item {i} Note" for i in range(10)]
+    assert completions.requests == 3
+
+
+def test_resolve_batch_falls_back_per_note():
+    # The reply names the first two notes only, the second with an empty string
+    completions = _FakeCompletions(reply=lambda descriptions: f'```json\n["{descriptions[0]} Note.md", ""]\n```')
+    client = _fake_client(completions)
+    client.batch_size = 3
+    items = [("Learned about asyncio", []), ("Setting up FastAPI project", []), ("Read the book", [])]
+
+    results = client.resolve_batch(items)
+
+    assert results == ["Learned about asyncio Note", "Setting up FastAPI project", "Read book"]
+
+
+def test_parse_filename_list():
+    assert parse_filename_list('["One", "Two"]', 2) == ["One", "Two"]
+    assert parse_filename_list('Sure! ```json\n["One", "Two"]\n```', 2) == ["One", "Two"]
+    assert parse_filename_list('["One", 2, " ", "Four", "Extra"]', 4) == ["One", None, None, "Four"]
+    assert parse_filename_list('["One"]', 3) == ["One", None, None]
+    assert parse_filename_list('["One", "Two"', 2) == [None, None]
+    assert parse_filename_list('{"names": ["One"]}', 1) == ["One"]
+    assert parse_filename_list("One", 1) == [None]
@@ -0,0 +1,93 @@
+import os
+
+from logseq_converter.logseq.loader import read_source_text
+from logseq_converter.manifest import ConversionManifest, hash_options, remove_outputs
+
+
+def test_plan_detects_new_changed_and_removed(tmp_path):
+    src = tmp_path / "a.md"
+    src.write_text("- one")
+    dest = tmp_path / "dest"
+
+    manifest = ConversionManifest.load(dest, "1.0", hash_options({"command": "obsidian"}))
+    changed, removed = manifest.plan({"pages/a.md": src})
+    assert changed == ["pages/a.md"]
+    assert removed == []
+
+    manifest.record("pages/a.md", read_source_text(src).state, ["a.md"])
+    manifest.record("pages/gone.md", read_source_text(src).state, ["gone.md"])
+    manifest.save()
+
+    reloaded = ConversionManifest.load(dest, "1.0", hash_options({"command": "obsidian"}))
+    changed, removed = reloaded.plan({"pages/a.md": src})
+    assert changed == []
+    assert removed == ["pages/gone.md"]
+
+    src.write_text("- one changed")
+    changed, _ = reloaded.plan({"pages/a.md": src})
+    assert changed == ["pages/a.md"]
+
+
+def test_touched_file_with_same_content_is_unchanged(tmp_path):
+    src = tmp_path / "a.md"
+    src.write_text("- same")
+    manifest = ConversionManifest(tmp_path, "1.0", "opts")
+    manifest.record("pages/a.md", read_source_text(src).state, [])
+
+    stat = src.stat()
+    os.utime(src, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+    assert manifest.is_unchanged("pages/a.md", src)
+    assert manifest.entries["pages/a.md"].mtime_ns == src.stat().st_mtime_ns
+
+
+def test_manifest_invalidated_by_version_or_options(tmp_path):
+    src = tmp_path / "a.md"
+    src.write_text("- one")
+    manifest = ConversionManifest(tmp_path, "1.0", "opts")
+    manifest.record("pages/a.md", read_source_text(src).state, ["a.md"])
+    manifest.save()
+
+    other_version = ConversionManifest.load(tmp_path, "2.0", "opts")
+    assert other_version.entries == {}
+    assert other_version.invalidated_outputs == ["a.md"]
+
+    other_options = ConversionManifest.load(tmp_path, "1.0", "other")
+    assert other_options.entries == {}
+
+
+def test_remove_outputs_prunes_empty_dirs(tmp_path):
+    (tmp_path / "Links").mkdir()
+    (tmp_path / "Links" / "a.md").write_text("x")
+    (tmp_path / "keep.md").write_text("x")
+
+    removed = remove_outputs(tmp_path, ["Links/a.md", "../outside.md", "missing.md"])
+
+    assert removed == 1
+    assert not (tmp_path / "Links").exists()
+    assert (tmp_path / "keep.md").exists()
+
+
+def test_stale_references_follow_moved_blocks(tmp_path):
+    src = tmp_path / "a.md"
+    src.write_text("- see ((block))")
+    manifest = ConversionManifest(tmp_path, "1.0", "opts")
+    manifest.record("pages/a.md", read_source_text(src).state, ["a.md"], {"block": "pages/b.md", "missing": None})
+    manifest.record("pages/c.md", read_source_text(src).state, ["c.md"])
+    manifest.save()
+
+    reloaded = ConversionManifest.load(tmp_path, "1.0", "opts")
+    assert reloaded.stale_references({"block": "pages/b.md"}.get) == []
+    assert reloaded.stale_references({"block": "pages/d.md"}.get) == ["pages/a.md"]
+    assert reloaded.stale_references({}.get) == ["pages/a.md"]
+    assert reloaded.stale_references({"block": "pages/b.md", "missing": "pages/e.md"}.get) == ["pages/a.md"]
+
+
+def test_recorded_assets_survive_invalidation(tmp_path):
+    manifest = ConversionManifest(tmp_path, "1.0", "opts")
+    assert manifest.record_assets(["assets/a.png", "assets/b.png"]) == []
+    manifest.save()
+
+    reloaded = ConversionManifest.load(tmp_path, "2.0", "opts")
+    assert reloaded.entries == {}
+    assert reloaded.record_assets(["assets/b.png"]) == ["assets/a.png"]
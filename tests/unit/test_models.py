@@ -1,6 +1,6 @@
 from datetime import date
 
-from logseq_converter.logseq.models import Block, ContentItem, Journal, LinkItem
+from logseq_converter.logseq.models import EMPTY_PROPERTIES, Block, ContentItem, Journal, LinkItem, Page
 
 
 def test_block_creation():
@@ -8,7 +8,15 @@ def test_block_creation():
     assert block.content == "test content"
     assert block.id == "123"
     assert block.properties == {}
-    assert block.children == []
+    assert block.children == ()
+
+
+def test_blocks_share_empty_containers():
+    first, second = Block(content="a"), Block(content="b")
+    assert not hasattr(first, "__dict__")
+    assert first.properties is second.properties is EMPTY_PROPERTIES
+    assert first.children is second.children
+    assert first.links is second.links
 
 
 def test_journal_creation():
@@ -19,6 +27,29 @@ def test_journal_creation():
     assert journal.blocks == []
 
 
+def test_blocks_are_loaded_on_first_access():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return [Block(content="loaded")]
+
+    page = Page(filename="Page.md", content="- loaded", block_loader=loader)
+    assert calls == []
+
+    assert page.blocks[0].content == "loaded"
+    assert page.blocks is page.blocks
+    assert len(calls) == 1
+
+
+def test_given_blocks_are_kept():
+    blocks = [Block(content="given")]
+    page = Page(filename="Page.md", content="", blocks=blocks, block_loader=lambda: [Block(content="loaded")])
+
+    assert page.blocks is blocks
+    assert page == Page(filename="Page.md", content="", blocks=[Block(content="given")])
+
+
 def test_link_item_creation():
     item = LinkItem(
         caption="My Link",
@@ -0,0 +1,145 @@
+"""
+Conformance suite for the fast outline parser: on every document it must
+build the same block tree as the mistletoe backend.
+"""
+import random
+
+import pytest
+
+from logseq_converter.logseq.outline import UnsupportedOutline, parse_outline
+from logseq_converter.logseq.parser import LogSeqParser
+
+FIXTURES = [
+    "- Block 1\n  id:: 550e8400-e29b-41d4-a716-446655440000\n  prop:: val\n- Block 2\n  - Child 1",
+    "- Block 1",
+    "- #links\n  - [Google](https://google.com)\n    - search engine\n"
+    "  - [My Project](https://github.com/me/project) ([GitHub](https://github.com/me/project))\n"
+    "    - A cool project",
+    "- #learnings\n  - Learned about Rust\n    - It's memory safe\n- #achievements\n  - Completed the project\n"
+    "- #highlights\n  - Best day ever",
+    "This is just some plain text content without any list markers.",
+    "---\ntitle: My Page\ntags: test\n---\nThis is content after frontmatter without list markers.",
+    "This is a first paragraph.\n\nThis is a second paragraph after a blank line.",
+    "id:: 12345678-1234-1234-1234-123456789012\nThis is content with a block ID.",
+    "Some intro text.\n\n- First list item\n- Second list item\n\nSome more text.",
+    "# Main Title\nSome content under the heading.",
+    "- ## #links\n  - [Caption](https://example.com/a)\n    - Note\n- ## #learnings\n  - Something new",
+    "- Parent\n\t- Tab child\n\t\t- Tab grandchild\n\t- Tab sibling\n- Root [[Page]] #tag",
+    "- Parent\n\t- Child\n\t  collapsed:: true\n  \t- Mixed tab and spaces",
+    "- First line\n  continued line\nlazy continuation\n- Next",
+    "- Item\n\n  Second paragraph is not content\n  - Child after paragraph\n\nTop-level text",
+    "- :LOGBOOK:\n  CLOCK: [2024-01-01 Mon 10:00:00]--[2024-01-01 Mon 11:30:00] =>  01:30:00\n  :END:\n- Done",
+    "- Heading item\n  # Inner heading\n  - Child\n# Root heading",
+    "* Star bullet\n+ Plus bullet\n- Dash bullet",
+    "- Code `spans\n  across` lines\n- Hard break\\\n  kept",
+    "- Text with [link](http://a) and [[wiki]] and ((550e8400-e29b-41d4-a716-446655440000))",
+]
+
+# Markdown the outline scan leaves to mistletoe
+UNSUPPORTED = [
+    "- Item\n  ```\n  code\n  ```",
+    "> quote",
+    "- Item\n  > quote",
+    "1. Ordered\n2. List",
+    "| a | b |\n| - | - |\n| 1 | 2 |",
+    "Title\n=====",
+    "Title\n---",
+    "- Item\n\n---",
+    "[ref]: http://example.com\n- [Link][ref]",
+    "<div>html</div>",
+    "-\n  Marker alone",
+    "- - Nested on one line",
+    "    Indented code",
+    "- Item\n\t\tIndented code after a tab",
+]
+
+WORDS = ["alpha", "beta", "[[Page]]", "#tag", "((550e8400-e29b-41d4-a716-446655440000))", "**bold**", "`code`"]
+
+
+def _tree(blocks, depth=0):
+    for block in blocks:
+        yield (
+            depth,
+            block.content,
+            block.cleaned_content,
+            block.properties,
+            block.id,
+            block.span,
+            block.links,
+            block.property_tokens,
+        )
+        yield from _tree(block.children, depth + 1)
+
+
+def _random_outline(rng: random.Random) -> str:
+    """LogSeq-style outline: bullets indented by tabs or two spaces, properties, links and headings."""
+    indent_unit = rng.choice(["\t", "  "])
+    lines = []
+    depth = 0
+    for _ in range(rng.randint(1, 25)):
+        depth = rng.randint(0, depth + 1) if lines else 0
+        indent = indent_unit * depth
+        roll = rng.random()
+        text = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 5)))
+        if roll < 0.05:
+            lines.append(f"{indent}- ## #{rng.choice(['links', 'learnings'])}")
+        elif roll < 0.15:
+            lines.append(f"{indent}- [{text}](https://example.com/{rng.randrange(100)})")
+        else:
+            lines.append(f"{indent}- {text}")
+        cont = indent + "  "
+        if rng.random() < 0.15:
+            lines.append(f"{cont}id:: 550e8400-e29b-41d4-a716-44665544{rng.randrange(10000):04d}")
+        if rng.random() < 0.1:
+            lines.append(f"{cont}collapsed:: true")
+        if rng.random() < 0.05:
+            lines.append(f"{cont}{text}")
+        if rng.random() < 0.05:
+            lines.append("")
+    if rng.random() < 0.2:
+        lines.insert(0, f"title:: {rng.choice(WORDS)}")
+    return "\n".join(lines) + rng.choice(["", "\n"])
+
+
+@pytest.mark.parametrize("content", FIXTURES + UNSUPPORTED)
+def test_fast_backend_matches_mistletoe(content):
+    expected = list(_tree(LogSeqParser()._parse_blocks(content)))
+    assert list(_tree(LogSeqParser("fast")._parse_blocks(content))) == expected
+
+
+@pytest.mark.parametrize("content", FIXTURES)
+def test_outline_scan_supports_logseq_fixtures(content):
+    body = LogSeqParser()._extract_frontmatter(content)[1]
+    parse_outline(body.splitlines())
+
+
+@pytest.mark.parametrize("content", UNSUPPORTED)
+def test_outline_scan_rejects_other_markdown(content):
+    with pytest.raises(UnsupportedOutline):
+        parse_outline(content.splitlines())
+
+
+def test_fast_backend_matches_mistletoe_on_random_outlines():
+    rng = random.Random(12)
+    mistletoe_parser, fast_parser = LogSeqParser(), LogSeqParser("fast")
+    for _ in range(300):
+        content = _random_outline(rng)
+        expected = list(_tree(mistletoe_parser._parse_blocks(content)))
+        assert list(_tree(fast_parser._parse_blocks(content))) == expected, content
+
+
+def test_fast_backend_extracts_link_items(tmp_path):
+    f = tmp_path / "2023_11_28.md"
+    f.write_text(FIXTURES[2])
+
+    links = LogSeqParser("fast").extract_link_items(LogSeqParser("fast").parse(f))
+
+    assert [(link.caption, link.url, link.github_url) for link in links] == [
+        ("Google", "https://google.com", None),
+        ("My Project", "https://github.com/me/project", "https://github.com/me/project"),
+    ]
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError, match="Unknown parser backend"):
+        LogSeqParser("commonmark")
@@ -0,0 +1,121 @@
+import marshal
+import zlib
+
+import pytest
+
+from logseq_converter.logseq.models import Block
+from logseq_converter.logseq.parse_cache import ParseCache, decode_blocks, encode_blocks
+from logseq_converter.logseq.parser import LogSeqParser
+from logseq_converter.logseq.walk import walk
+
+CONTENT = (
+    "tags:: project\n\n- Parent [[Other]]\n  id:: 550e8400-e29b-41d4-a716-446655440000\n"
+    "  - Child #idea\n    status:: open\n  - [Link](https://example.com) ([GitHub](https://github.com/a/b))\n"
+    "- Sibling"
+)
+
+
+def _tree(blocks, depth=0):
+    for block in blocks:
+        yield (
+            depth,
+            block.content,
+            block.cleaned_content,
+            block.properties,
+            block.id,
+            block.span,
+            block.links,
+            block.property_tokens,
+        )
+        yield from _tree(block.children, depth + 1)
+
+
+def test_encoded_trees_decode_unchanged():
+    blocks = LogSeqParser()._parse_blocks(CONTENT)
+
+    decoded = decode_blocks(encode_blocks(blocks))
+
+    assert list(_tree(decoded)) == list(_tree(blocks))
+    assert decode_blocks(encode_blocks([])) == []
+
+
+def test_truncated_trees_are_rejected():
+    data = encode_blocks(LogSeqParser()._parse_blocks(CONTENT))
+    root_count, records = marshal.loads(zlib.decompress(data))
+
+    with pytest.raises(ValueError, match="Truncated"):
+        decode_blocks(zlib.compress(marshal.dumps((root_count, records[:-1]))))
+    with pytest.raises(ValueError, match="Truncated"):
+        decode_blocks(zlib.compress(marshal.dumps((root_count + 1, records))))
+
+
+def test_deep_trees_round_trip():
+    root = node = Block(content="0")
+    for level in range(1, 5_000):
+        node.children = [Block(content=str(level))]
+        node = node.children[0]
+
+    assert [depth for _, depth in walk(decode_blocks(encode_blocks([root])))] == list(range(5_000))
+
+
+def test_saved_trees_are_reused_without_parsing(tmp_path, monkeypatch):
+    page = tmp_path / "Page.md"
+    page.write_text(CONTENT, encoding="utf-8")
+    db_path = tmp_path / "parse_cache.sqlite3"
+
+    cache = ParseCache(db_path, 1024 * 1024)
+    expected = list(_tree(LogSeqParser(cache=cache).parse(page).blocks))
+    cache.close()
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    def fail(self, content):
+        raise AssertionError("parsed a cached file")
+
+    monkeypatch.setattr(LogSeqParser, "_parse_blocks", fail)
+    reopened = ParseCache(db_path, 1024 * 1024)
+    assert list(_tree(LogSeqParser(cache=reopened).parse(page).blocks)) == expected
+    assert reopened.hits == 1
+
+    page.write_text(CONTENT + "\n- Edited", encoding="utf-8")
+    with pytest.raises(AssertionError, match="parsed a cached file"):
+        _ = LogSeqParser(cache=reopened).parse(page).blocks
+
+
+def test_trees_are_cached_per_parser_backend(tmp_path):
+    cache = ParseCache(tmp_path / "parse_cache.sqlite3", 1024 * 1024)
+    cache.put(CONTENT, "mistletoe", [])
+
+    assert cache.get(CONTENT, "mistletoe") == []
+    assert cache.get(CONTENT, "fast") is None
+    assert ParseCache.key(CONTENT, "mistletoe") != ParseCache.key(CONTENT, "fast")
+
+
+def test_least_recently_used_trees_are_evicted(tmp_path):
+    db_path = tmp_path / "parse_cache.sqlite3"
+    documents = [f"- Page {index}\n  - {'text ' * 50}{index}" for index in range(3)]
+    size = len(encode_blocks(LogSeqParser()._parse_blocks(documents[0])))
+
+    cache = ParseCache(db_path, 2 * size + size // 2)
+    for content in documents[:2]:
+        cache.put(content, "mistletoe", LogSeqParser()._parse_blocks(content))
+    cache.save()
+    # Using the first tree again makes the second the least recently used
+    assert cache.get(documents[0], "mistletoe") is not None
+    cache.save()
+    cache.put(documents[2], "mistletoe", LogSeqParser()._parse_blocks(documents[2]))
+    cache.close()
+
+    reopened = ParseCache(db_path, 2 * size + size // 2)
+    assert [reopened.get(content, "mistletoe") is not None for content in documents] == [True, False, True]
+
+
+def test_unreadable_entries_are_parsed_again(tmp_path):
+    db_path = tmp_path / "parse_cache.sqlite3"
+    cache = ParseCache(db_path, 1024 * 1024)
+    cache.put(CONTENT, "mistletoe", [])
+    cache.save()
+    cache._conn.execute("UPDATE trees SET tree = ?", (b"garbage",))
+    cache._conn.commit()
+
+    assert cache.get(CONTENT, "mistletoe") is None
+    assert cache.misses == 1
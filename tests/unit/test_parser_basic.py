@@ -30,3 +30,19 @@ def test_parse_page(tmp_path):
 
     assert isinstance(page, Page)
     assert len(page.blocks) == 1
+
+
+def test_parse_defers_block_tree(tmp_path, monkeypatch):
+    f = tmp_path / "2023_11_28.md"
+    f.write_text("- Block 1\n  - Child 1")
+    parser = LogSeqParser()
+    calls = []
+    original = parser._parse_blocks
+    monkeypatch.setattr(parser, "_parse_blocks", lambda content: calls.append(content) or original(content))
+
+    journal = parser.parse(f)
+    assert journal.date.isoformat() == "2023-11-28"
+    assert calls == []
+
+    assert journal.blocks[0].children[0].content == "Child 1"
+    assert len(calls) == 1
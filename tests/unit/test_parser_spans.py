@@ -0,0 +1,105 @@
+import pytest
+
+from logseq_converter.logseq.parser import LogSeqParser
+
+
+def _lines(content, block):
+    start, stop = block.span
+    return content.split("\n")[start:stop]
+
+
+def test_block_spans_point_into_source():
+    content = (
+        "- Parent **bold**\n  id:: 11111111-2222-3333-4444-555555555555\n  - Child\n\n    still child\n- Sibling\n"
+    )
+    blocks = LogSeqParser()._parse_blocks(content)
+
+    parent, sibling = blocks
+    assert parent.span == (0, 2)
+    assert _lines(content, parent) == ["- Parent **bold**", "  id:: 11111111-2222-3333-4444-555555555555"]
+    assert parent.content == "Parent **bold**\nid:: 11111111-2222-3333-4444-555555555555"
+    assert parent.id == "11111111-2222-3333-4444-555555555555"
+    # The child's second paragraph is not part of its content
+    assert parent.children[0].span == (2, 3)
+    assert parent.children[0].content == "Child"
+    assert sibling.span == (5, 6)
+
+
+def test_content_keeps_source_formatting():
+    content = "- Code `spans\n  across` lines\n- Hard break\\\n  kept\n1. Ordered __item__\n"
+    blocks = LogSeqParser()._parse_blocks(content)
+
+    assert [block.content for block in blocks] == [
+        "Code `spans\nacross` lines",
+        "Hard break\\\nkept",
+        "Ordered __item__",
+    ]
+
+
+@pytest.mark.parametrize("backend", ["mistletoe", "fast"])
+def test_entities_are_kept_as_written(backend):
+    blocks = LogSeqParser(backend)._parse_blocks("- Fish &amp; chips &lt;b&gt; &#35;1\n\nTop &copy; level\n")
+
+    assert [block.content for block in blocks] == ["Fish &amp; chips &lt;b&gt; &#35;1", "Top &copy; level"]
+
+
+@pytest.mark.parametrize("backend", ["mistletoe", "fast"])
+def test_continuation_lines_lose_only_spaces_and_tabs(backend):
+    content = "- First\n      deeper continuation\n\t\u3000full-width indent  \n  - Child\n    \u00a0kept\n"
+    [block] = LogSeqParser(backend)._parse_blocks(content)
+
+    assert block.content == "First\ndeeper continuation\n\u3000full-width indent"
+    assert block.children[0].content == "Child\n\u00a0kept"
+
+
+def test_spans_count_frontmatter_lines():
+    content = "---\ntitle: Page\n---\n- First\n\n# Heading\n"
+    blocks = LogSeqParser()._parse_blocks(content)
+
+    assert [block.span for block in blocks] == [(3, 4), (5, 6)]
+    assert blocks[1].content == "# Heading"
+
+
+def test_marker_on_its_own_line():
+    content = "-\n  Text below the marker\n- Next\n"
+    blocks = LogSeqParser()._parse_blocks(content)
+
+    assert blocks[0].content == "Text below the marker"
+    assert blocks[0].span == (1, 2)
+
+
+def test_links_are_recorded_with_spans():
+    content = "- Read [The *Book*](https://example.com/book) and [GitHub](https://github.com/me/book) [[Wiki]]\n"
+    for backend in ("mistletoe", "fast"):
+        block = LogSeqParser(backend)._parse_blocks(content)[0]
+
+        assert [(link.caption, link.target) for link in block.links] == [
+            ("The Book", "https://example.com/book"),
+            ("GitHub", "https://github.com/me/book"),
+        ]
+        assert [block.content[slice(*link.span)] for link in block.links] == [
+            "[The *Book*](https://example.com/book)",
+            "[GitHub](https://github.com/me/book)",
+        ]
+
+
+def test_link_item_uses_recorded_links():
+    parser = LogSeqParser()
+    block = parser._parse_blocks("- [Project](https://example.com) ([GitHub](https://github.com/me/p))\n")[0]
+    block.content = "content is not parsed again"
+
+    item = parser._parse_link_item(block)
+
+    assert (item.caption, item.url, item.github_url) == (
+        "Project",
+        "https://example.com",
+        "https://github.com/me/p",
+    )
+
+
+def test_property_keys_are_interned():
+    blocks = LogSeqParser()._parse_blocks("- A\n  status:: open\n- B\n  status:: done\n- C")
+
+    first, second, plain = blocks
+    assert next(iter(first.properties)) is next(iter(second.properties))
+    assert plain.properties == {} and plain.children == () and plain.links == ()
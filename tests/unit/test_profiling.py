@@ -0,0 +1,57 @@
+import json
+
+from logseq_converter.profiling import ConversionProfile
+
+
+def test_phases_accumulate_in_first_run_order():
+    profile = ConversionProfile()
+    with profile.phase("scan"):
+        pass
+    with profile.phase("pages"):
+        pass
+    with profile.phase("scan"):
+        pass
+
+    assert list(profile.phases) == ["scan", "pages"]
+    assert all(seconds >= 0 for seconds in profile.phases.values())
+
+
+def test_phase_is_recorded_when_it_raises():
+    profile = ConversionProfile()
+    try:
+        with profile.phase("failing"):
+            raise RuntimeError
+    except RuntimeError:
+        pass
+
+    assert "failing" in profile.phases
+
+
+def test_slowest_files_are_sorted_and_limited():
+    profile = ConversionProfile()
+    profile.record_file("a.md", 0.1)
+    profile.record_file("b.md", 0.3)
+    profile.record_file("c.md", 0.2)
+
+    assert profile.slowest_files(2) == [("b.md", 0.3), ("c.md", 0.2)]
+
+
+def test_report_and_json(tmp_path, capsys):
+    profile = ConversionProfile()
+    with profile.phase("pages"):
+        profile.record_file("slow.md", 0.25)
+        profile.record_file("fast.md", 0.01)
+
+    profile.print_report(1)
+    output = capsys.readouterr().out
+    assert "pages:" in output
+    assert "Slowest files (of 2):" in output
+    assert "250.0 ms  slow.md" in output
+    assert "fast.md" not in output
+
+    path = tmp_path / "nested" / "profile.json"
+    profile.write_json(path, 1)
+    data = json.loads(path.read_text())
+    assert [phase["name"] for phase in data["phases"]] == ["pages"]
+    assert data["files"]["count"] == 2
+    assert data["files"]["slowest"] == [{"path": "slow.md", "seconds": 0.25}]
@@ -0,0 +1,81 @@
+from pathlib import Path
+
+from logseq_converter.logseq.parser import BlockReferenceScanner, LogSeqParser
+from logseq_converter.logseq.properties import (
+    find_block_id,
+    lex_page_header,
+    lex_properties,
+    property_map,
+    remove_properties,
+)
+from logseq_converter.tana.converter import TanaConverter
+
+BLOCK_ID = "550e8400-e29b-41d4-a716-446655440000"
+
+
+def test_block_properties_are_lexed_with_spans():
+    text = f"Task\nstatus:: open \nid:: {BLOCK_ID}"
+
+    tokens = lex_properties(text)
+
+    assert [(token.key, token.value) for token in tokens] == [("status", "open "), ("id", BLOCK_ID)]
+    assert [text[slice(*token.span)] for token in tokens] == ["status:: open ", f"id:: {BLOCK_ID}"]
+    assert property_map(tokens) == {"status": "open"}
+    assert find_block_id(text) == BLOCK_ID
+    assert remove_properties(text, tokens).strip() == "Task"
+
+
+def test_page_header_reads_frontmatter_then_properties():
+    lines = ["---", "title: 'Page'", "---", "alias:: Other", "", "- First block", "status:: open"]
+
+    header = lex_page_header(lines)
+
+    assert [(token.key, token.value) for token in header.frontmatter] == [("title", "'Page'")]
+    assert [(token.key, token.value) for token in header.properties] == [("alias", "Other")]
+    assert header.body_start == 5
+
+
+def test_unterminated_frontmatter_is_body():
+    header = lex_page_header(["---", "title: Page", "- Block"])
+
+    assert header.frontmatter is None
+    assert header.body_start == 0
+
+
+def test_parsed_blocks_keep_property_tokens():
+    block = LogSeqParser()._parse_blocks(f"- Task\n  tags:: [[A]], b\n  id:: {BLOCK_ID}")[0]
+
+    assert [token.key for token in block.property_tokens] == ["tags", "id"]
+    assert block.properties == {"tags": "[[A]], b"}
+    assert block.id == BLOCK_ID
+
+
+def test_block_id_after_another_property_on_the_same_line():
+    content = f"- Task status:: open id:: {BLOCK_ID}"
+    scanner = BlockReferenceScanner()
+    scanner.scan_content(Path("page.md"), content)
+
+    for backend in ("mistletoe", "fast"):
+        block = LogSeqParser(backend)._parse_blocks(content)[0]
+        assert block.id == BLOCK_ID
+        assert block.properties == {"status": f"open id:: {BLOCK_ID}"}
+    assert scanner.get_file_for_block(BLOCK_ID) == Path("page.md")
+
+
+def test_tana_reads_tags_from_property_values():
+    block = LogSeqParser()._parse_blocks("- Task\n  tags:: [[A]], b")[0]
+    converter = TanaConverter()
+
+    node = converter.convert_block(block)
+
+    assert node.name == "Task"
+    assert sorted(converter.supertags) == ["A", "b"]
+
+
+def test_tana_keeps_date_like_and_numeric_tags_as_written():
+    block = LogSeqParser()._parse_blocks("- Task\n  tags:: [[Jan 5, 2024]], 2024-01-05, 42, #later")[0]
+    converter = TanaConverter()
+
+    converter.convert_block(block)
+
+    assert sorted(converter.supertags) == ["2024-01-05", "42", "Jan 5, 2024", "later"]
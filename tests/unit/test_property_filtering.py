@@ -13,7 +13,7 @@ alias:: alias1
 
 - Block 1
 """
-    result = converter._transform_properties(content)
+    result = converter.convert_content(content)
 
     # Should only include tags and alias, not heading, collapsed, icon, or title
     expected = """---
@@ -34,7 +34,7 @@ tags:: important
 
 - Block content
 """
-    result = converter._transform_properties(content)
+    result = converter.convert_content(content)
 
     expected = """---
 tags: important
@@ -60,7 +60,7 @@ tags: important
 - Block 3
   custom:: value
 """
-    result = converter._remove_excluded_properties_from_body(content)
+    result = converter.convert_content(content)
 
     # Should remove heading, collapsed, and icon, but keep custom property
     expected = """---
@@ -134,7 +134,7 @@ author: John Doe
 
 - Block 1
 """
-    result = converter._filter_frontmatter_properties(content)
+    result = converter.convert_content(content)
 
     # Should keep tags and author
     assert "tags: tag1, tag2" in result
@@ -159,7 +159,7 @@ date: 2023-11-28
 
 - Content
 """
-    result = converter._filter_frontmatter_properties(content)
+    result = converter.convert_content(content)
 
     expected = """---
 tags: important
@@ -177,7 +177,7 @@ def test_no_frontmatter_unchanged():
     content = """- Block 1
 - Block 2
 """
-    result = converter._filter_frontmatter_properties(content)
+    result = converter.convert_content(content)
     assert result == content
 
 
@@ -0,0 +1,110 @@
+import builtins
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from logseq_converter.cli import convert_vault
+from logseq_converter.logseq.loader import SourceLoader, SourceState, read_source_text
+from logseq_converter.manifest import hash_file
+
+
+def test_loader_reuses_buffered_content(tmp_path):
+    pages = tmp_path / "pages"
+    pages.mkdir()
+    page = pages / "a.md"
+    page.write_text("- id:: 11111111-1111-1111-1111-111111111111")
+
+    loader = SourceLoader(memory_budget=1024, retain_dirs=[pages])
+    assert loader.load(page) == page.read_text()
+    assert loader.read(page).content == page.read_text()
+    assert loader.disk_reads == 1
+    assert loader.buffered_size == 0
+
+    # A second read after the buffer was handed over goes back to disk
+    loader.read(page)
+    assert loader.disk_reads == 2
+
+
+def test_loader_falls_back_to_disk_beyond_budget(tmp_path):
+    pages = tmp_path / "pages"
+    pages.mkdir()
+    small = pages / "small.md"
+    large = pages / "large.md"
+    small.write_text("- x" * 10)
+    large.write_text("- y" * 100)
+
+    loader = SourceLoader(memory_budget=50, retain_dirs=[pages])
+    loader.load(small)
+    loader.load(large)
+
+    assert loader.take(small) is not None
+    assert loader.take(large) is None
+    assert loader.read(large).content == large.read_text()
+    assert loader.disk_reads == 3
+
+
+def test_loader_budget_counts_bytes(tmp_path):
+    pages = tmp_path / "pages"
+    pages.mkdir()
+    page = pages / "a.md"
+    # 10 characters, 26 bytes of UTF-8
+    page.write_text("- " + "日" * 8, encoding="utf-8")
+
+    loader = SourceLoader(memory_budget=20, retain_dirs=[pages])
+    loader.load(page)
+    assert loader.take(page) is None
+
+    loader = SourceLoader(memory_budget=26, retain_dirs=[pages])
+    loader.load(page)
+    assert loader.buffered_size == 26
+    assert loader.take(page).content == "- " + "日" * 8
+    assert loader.buffered_size == 0
+
+
+def test_loader_only_retains_graph_dirs(tmp_path):
+    other = tmp_path / "logseq" / "bak"
+    other.mkdir(parents=True)
+    backup = other / "old.md"
+    backup.write_text("- old")
+
+    loader = SourceLoader(memory_budget=1024, retain_dirs=[tmp_path / "pages"])
+    loader.load(backup)
+    assert loader.buffered_size == 0
+
+
+def test_source_text_matches_the_file(tmp_path):
+    page = tmp_path / "a.md"
+    page.write_bytes(b"- one\r\n- two\r- three\n")
+
+    source = read_source_text(page)
+
+    assert source.content == page.read_text()
+    assert source.state == SourceState(page.stat().st_size, page.stat().st_mtime_ns, hash_file(page))
+
+
+@pytest.mark.parametrize("incremental", [False, True])
+def test_conversion_reads_each_source_once(tmp_path, monkeypatch, incremental):
+    source = tmp_path / "graph"
+    (source / "pages").mkdir(parents=True)
+    (source / "journals").mkdir()
+    (source / "pages" / "Topic.md").write_text("- block\n  id:: 11111111-1111-1111-1111-111111111111\n")
+    (source / "journals" / "2025_11_27.md").write_text("- ref ((11111111-1111-1111-1111-111111111111))\n")
+
+    reads = Counter()
+    real_open = builtins.open
+
+    def counting_open(file, mode="r", *args, **kwargs):
+        path = Path(file)
+        if "r" in mode and source in path.parents:
+            reads[path.name] += 1
+        return real_open(file, mode, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", counting_open)
+    monkeypatch.setattr("logseq_converter.obsidian.configurator.configure_community_plugins", lambda dest: None)
+
+    assert convert_vault(source, tmp_path / "out", verbose=False, incremental=incremental) == 0
+
+    assert reads == {"Topic.md": 1, "2025_11_27.md": 1}
+    journal = (tmp_path / "out" / "Daily" / "2025-11-27.md").read_text()
+    assert "[[Topic#^11111111-1111-1111-1111-111111111111]]" in journal
@@ -45,26 +45,29 @@ def test_extracted_items_tracking():
     converter._extract_link_items = MagicMock(return_value=[("link1.md", "content")])
     converter._extract_content_items = MagicMock(return_value=[("item1.md", "content")])
 
-    # Mock parser
-    parser = MagicMock()
     block_mock = MagicMock()
     block_mock.content = "some content"
     block_mock.cleaned_content = "some content"
     block_mock.children = []
-    parser._parse_blocks.return_value = [block_mock]
 
     # Test Links
-    converter._process_section_content([], "#links", MagicMock(), parser)
+    converter._process_section_content([block_mock], "#links", MagicMock())
     assert stats.links == 1
 
     # Test Learnings
-    converter._process_section_content([], "#learnings", MagicMock(), parser)
+    converter._process_section_content([block_mock], "#learnings", MagicMock())
     assert stats.learnings == 1
 
     # Test Achievements
-    converter._process_section_content([], "#achievements", MagicMock(), parser)
+    converter._process_section_content([block_mock], "#achievements", MagicMock())
     assert stats.achievements == 1
 
     # Test Highlights
-    converter._process_section_content([], "#highlights", MagicMock(), parser)
+    converter._process_section_content([block_mock], "#highlights", MagicMock())
     assert stats.highlights == 1
+
+
+def test_stats_merge():
+    stats = ConversionStats(journals=1, links=2)
+    stats.merge(ConversionStats(journals=3, pages=4, block_refs=5))
+    assert stats == ConversionStats(journals=4, pages=4, links=2, block_refs=5)
@@ -0,0 +1,78 @@
+"""
+Streaming parse: parsing a page one top-level block at a time must give the
+blocks of the whole-page parse.
+"""
+import pytest
+
+from logseq_converter.logseq.models import Journal, Page
+from logseq_converter.logseq.parser import LogSeqParser
+from logseq_converter.logseq.stream import top_level_chunks
+
+DOCUMENTS = [
+    "- Block 1\n  id:: 550e8400-e29b-41d4-a716-446655440000\n  prop:: val\n- Block 2\n  - Child 1",
+    "- #links\n  - [Google](https://google.com)\n    - search engine\n- #learnings\n  - Learned about Rust",
+    "tags:: project\n\n- Parent [[Other]]\n  - Child #idea\n    status:: open\n- Sibling",
+    "---\ntitle: My Page\ntags: test\n---\n- First\n- Second",
+    "---\nunterminated: frontmatter\n- First\n- Second",
+    "-\n\n- \n- First\n  - Child\n-\n- Second\n\n-\n-  \n",
+    "Some intro text.\n\n- First list item\n- Second list item\n\nSome more text.\n- After text",
+    "- Item\n\n---\n- After a thematic break\n***\n- Last",
+    "- Fence\n```\n- not a block\n```\n- Block after the fence",
+    "- Tilde fence\n~~~~python\n- not a block\n~~~\n- still code\n~~~~\n- After",
+    "- Comment\n<!--\n- not a block\n-->\n- After the comment",
+    "- Pre\n<pre>\n- not a block\n</pre>\n- After",
+    "- Parent\n\t- Tab child\n- Root [[Page]] #tag\n* Star\n+ Plus",
+    "- First line\n  continued line\nlazy continuation\n- Next",
+    "# Heading\n- Under the heading\n## Another\n- Last",
+    "- Unclosed fence\n```\n- inside\n- still inside",
+]
+
+
+def _tree(blocks, depth=0):
+    for block in blocks:
+        yield (
+            depth,
+            block.content,
+            block.cleaned_content,
+            block.properties,
+            block.id,
+            block.span,
+            block.links,
+            block.property_tokens,
+        )
+        yield from _tree(block.children, depth + 1)
+
+
+@pytest.mark.parametrize("backend", ["mistletoe", "fast"])
+@pytest.mark.parametrize("content", DOCUMENTS)
+def test_streamed_blocks_match_whole_page(tmp_path, backend, content):
+    path = tmp_path / "Page.md"
+    path.write_text(content, encoding="utf-8")
+    parser = LogSeqParser(backend)
+
+    page, blocks = parser.parse_streaming(path)
+
+    assert isinstance(page, Page)
+    assert page.filename == "Page.md"
+    assert list(_tree(blocks)) == list(_tree(parser.parse(path).blocks))
+
+
+def test_streaming_journal(tmp_path):
+    path = tmp_path / "2024_01_02.md"
+    path.write_text("- Day\n- Night", encoding="utf-8")
+
+    page, blocks = LogSeqParser().parse_streaming(path)
+
+    assert isinstance(page, Journal)
+    assert [block.content for block in blocks] == ["Day", "Night"]
+
+
+def test_streaming_missing_file(tmp_path):
+    assert LogSeqParser().parse_streaming(tmp_path / "missing.md") is None
+
+
+def test_chunks_split_at_root_bullets():
+    # Offsets count lines of the page after the leading empty bullet is trimmed
+    lines = ["---", "a: b", "---", "-", "- One", "  - Child", "", "- Two", "-", ""]
+
+    assert list(top_level_chunks(lines)) == [("- One\n  - Child\n", 3), ("- Two", 6)]
@@ -56,3 +56,14 @@ def test_convert_page(converter):
     assert node.name == "page"  # filename without extension
     assert len(node.children) == 1
     assert node.children[0].name == "Block 1"
+
+
+def test_merged_supertags_keep_first_seen_order(converter):
+    other = TanaConverter()
+    converter.convert_block(Block(content="A #beta"))
+    other.convert_block(Block(content="B #alpha #beta"))
+
+    converter.merge_supertags(other.supertags)
+
+    assert list(converter.supertags) == ["beta", "alpha"]
+    assert converter.supertags["alpha"] == other.supertags["alpha"]
@@ -0,0 +1,114 @@
+import dataclasses
+import io
+import json
+from datetime import date
+
+from logseq_converter.logseq.models import Block, Journal, Page
+from logseq_converter.tana.converter import TanaConverter
+from logseq_converter.tana.models import TanaIntermediateNode
+from logseq_converter.tana.writer import TanaStreamWriter, encode_node
+
+
+def _nodes(converter):
+    page = Page(
+        filename="Topic.md",
+        content="",
+        blocks=[
+            Block(content="Parent #idea", children=[Block(content="Child [[Other]]")]),
+            Block(content="Sibling"),
+        ],
+    )
+    nested = Page(filename="A___B.md", content="", blocks=[Block(content="Leaf #todo")])
+    journal = Journal(filename="2024_01_02.md", date=date(2024, 1, 2), content="", blocks=[Block(content="Day")])
+    return [converter.convert_page(p) for p in (page, nested, journal)]
+
+
+def test_streamed_file_matches_in_memory_file():
+    converter = TanaConverter()
+    nodes = _nodes(converter)
+
+    stream = io.StringIO()
+    writer = TanaStreamWriter(stream)
+    for node in nodes:
+        writer.write_node(node)
+    summary = writer.close(list(converter.supertags.values()))
+
+    expected = dataclasses.asdict(converter.create_tana_file_from_nodes(nodes))
+    assert json.loads(stream.getvalue()) == expected
+    assert dataclasses.asdict(summary) == expected["summary"]
+
+
+def test_empty_stream_is_valid_json():
+    stream = io.StringIO()
+    writer = TanaStreamWriter(stream)
+    writer.close([])
+    data = json.loads(stream.getvalue())
+    assert data["nodes"] == []
+    assert data["summary"]["totalNodes"] == 0
+
+
+def test_dry_run_writer_only_counts():
+    converter = TanaConverter()
+    writer = TanaStreamWriter(None)
+    for node in _nodes(converter):
+        writer.write_node(node)
+    summary = writer.close(list(converter.supertags.values()))
+    assert summary.topLevelNodes == 3
+    assert summary.calendarNodes == 1
+
+
+def _write(nodes, streamed_index=None, children=None):
+    stream = io.StringIO()
+    writer = TanaStreamWriter(stream)
+    for index, node in enumerate(nodes):
+        if index != streamed_index:
+            writer.write_node(node)
+            continue
+        try:
+            writer.write_streamed_node(dataclasses.replace(node, children=[]), children or iter(node.children))
+        except RuntimeError:
+            pass
+    summary = writer.close([])
+    return stream.getvalue(), summary
+
+
+def test_streamed_node_matches_write_node():
+    nodes = _nodes(TanaConverter())
+    empty = dataclasses.replace(nodes[1], uid="empty", children=[])
+
+    for index in range(len(nodes) + 1):
+        assert _write(nodes + [empty], index) == _write(nodes + [empty])
+
+
+def test_failed_streamed_node_is_taken_back():
+    nodes = _nodes(TanaConverter())
+
+    def failing_children():
+        yield from nodes[0].children
+        raise RuntimeError("parse failed")
+
+    assert _write(nodes, 0, failing_children()) == _write(nodes[1:])
+
+
+def test_encode_node_matches_json_dumps():
+    converter = TanaConverter()
+    for node in _nodes(converter):
+        for indent in ("", "    "):
+            expected = json.dumps(dataclasses.asdict(node), indent=2).replace("\n", f"\n{indent}")
+            assert encode_node(node, indent) == expected
+
+
+def test_encode_node_handles_deep_outlines():
+    root = node = TanaIntermediateNode(uid="0", name="Level 0", createdAt=0, editedAt=0)
+    for level in range(1, 5000):
+        child = TanaIntermediateNode(uid=str(level), name=f"Level {level}", createdAt=0, editedAt=0)
+        node.children = [child]
+        node = child
+
+    encoded = encode_node(root)
+
+    assert encoded.count('"name": "Level ') == 5000
+    lines = encoded.splitlines()
+    assert lines[0] == "{" and lines[-1] == "}"
+    # The innermost node sits two indentation steps deeper per level
+    assert '\n' + "  " * (2 * 4999 + 1) + '"name": "Level 4999",' in encoded
@@ -0,0 +1,127 @@
+import json
+import pickle
+import sys
+
+import pytest
+
+from logseq_converter.blinko.converter import BlinkoConverter
+from logseq_converter.cli import convert_to_tana
+from logseq_converter.logseq.models import Block, Page
+from logseq_converter.logseq.parser import LogSeqParser
+from logseq_converter.logseq.walk import flatten_tree, map_tree, unflatten_tree, walk
+from logseq_converter.tana.converter import TanaConverter
+
+# Well past the default recursion limit
+DEPTH = 5_000
+
+
+def _tree():
+    return [
+        Block(content="a", children=[Block(content="a1"), Block(content="a2", children=[Block(content="a2x")])]),
+        Block(content="b"),
+    ]
+
+
+def _chain(depth):
+    root = node = Block(content="0")
+    for level in range(1, depth):
+        child = Block(content=str(level))
+        node.children = [child]
+        node = child
+    return root
+
+
+def test_walk_pre_order_with_depth():
+    assert [(block.content, depth) for block, depth in walk(_tree())] == [
+        ("a", 0),
+        ("a1", 1),
+        ("a2", 1),
+        ("a2x", 2),
+        ("b", 0),
+    ]
+
+
+def test_walk_post_order():
+    assert [(block.content, depth) for block, depth in walk(_tree(), post_order=True)] == [
+        ("a1", 1),
+        ("a2x", 2),
+        ("a2", 1),
+        ("a", 0),
+        ("b", 0),
+    ]
+
+
+def test_map_tree_drops_subtrees_of_none():
+    converted = map_tree(_tree(), lambda block: None if block.content == "a2" else Block(content=block.content.upper()))
+
+    assert [(block.content, depth) for block, depth in walk(converted)] == [("A", 0), ("A1", 1), ("B", 0)]
+
+
+def test_deep_outlines_do_not_recurse():
+    root = _chain(DEPTH)
+
+    assert sum(1 for _ in walk([root], post_order=True)) == DEPTH
+    assert len(LogSeqParser()._flatten_block_content_with_indent([root])) == DEPTH
+
+    converter = TanaConverter()
+    node = converter.convert_block(root)
+    summary = converter.create_tana_file(node).summary
+    assert (summary.totalNodes, summary.leafNodes) == (DEPTH, 1)
+
+    markdown = BlinkoConverter().convert_page(Page(filename="Deep.md", content="", blocks=[root]))
+    assert markdown.splitlines()[-1] == f"{'  ' * (DEPTH - 1)}- {DEPTH - 1}"
+
+
+def test_flattened_trees_rebuild_unchanged():
+    expected = [(block.content, depth) for block, depth in walk(_tree())]
+
+    records = flatten_tree(_tree())
+
+    assert all(not block.children for block, _ in records)
+    assert [(block.content, depth) for block, depth in walk(unflatten_tree(records))] == expected
+
+
+def test_flattened_deep_tree_pickles():
+    node = TanaConverter().convert_block(_chain(DEPTH))
+
+    roots = unflatten_tree(pickle.loads(pickle.dumps(flatten_tree([node]))))
+
+    assert [depth for _, depth in walk(roots)] == list(range(DEPTH))
+
+
+def test_deep_outline_parses_with_fast_backend():
+    content = "\n".join(f"{'  ' * level}- {level}" for level in range(2_000))
+
+    blocks = LogSeqParser("fast")._parse_blocks(content)
+
+    assert [depth for _, depth in walk(blocks)] == list(range(2_000))
+
+
+@pytest.mark.parametrize(
+    "options", [{}, {"jobs": 2}, {"stream_threshold_mb": 0}], ids=["serial", "workers", "streamed"]
+)
+def test_deep_outline_exports_to_tana(tmp_path, options):
+    source = tmp_path / "vault"
+    (source / "pages").mkdir(parents=True)
+    (source / "pages" / "Deep.md").write_text("\n".join(f"{'  ' * level}- Level {level}" for level in range(3_000)))
+    destination = tmp_path / "export.json"
+
+    code = convert_to_tana(
+        source, destination, verbose=False, force=False, parser_backend="fast", parse_cache=False, **options
+    )
+
+    assert code == 0
+    assert not destination.with_name("export.json.tmp").exists()
+    text = destination.read_text()
+    assert text.count('"name": "Level ') == 3_000
+    # The C decoder recurses once per object and list
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(4 * 3_000 + limit)
+    try:
+        data = json.loads(text)
+    finally:
+        sys.setrecursionlimit(limit)
+    node = next(n for n in data["nodes"] if n["name"] == "Deep")
+    for level in range(3_000):
+        (node,) = node["children"]
+        assert node["name"] == f"Level {level}"
@@ -0,0 +1,70 @@
+import os
+import threading
+import time
+
+from logseq_converter.watch import diff_snapshots, snapshot_markdown_files, watch_files
+
+
+def _bump_mtime(path, ns=1_000_000):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + ns))
+
+
+def test_snapshot_diff_reports_changed_new_and_removed(tmp_path):
+    pages = tmp_path / "pages"
+    (pages / "nested").mkdir(parents=True)
+    a = pages / "a.md"
+    b = pages / "nested" / "b.md"
+    a.write_text("- a")
+    b.write_text("- b")
+    (pages / "ignored.txt").write_text("x")
+
+    before = snapshot_markdown_files([pages, tmp_path / "missing"])
+    assert set(before) == {a, b}
+
+    _bump_mtime(a)
+    b.unlink()
+    c = pages / "c.md"
+    c.write_text("- c")
+
+    changed, removed = diff_snapshots(before, snapshot_markdown_files([pages]))
+    assert changed == [a, c]
+    assert removed == [b]
+
+
+def test_watch_files_reports_edits_until_stopped(tmp_path):
+    page = tmp_path / "page.md"
+    page.write_text("- before")
+    calls = []
+    stop = threading.Event()
+
+    def on_change(changed, removed):
+        calls.append((changed, removed))
+        stop.set()
+
+    def edit():
+        time.sleep(0.05)
+        page.write_text("- after, longer")
+
+    editor = threading.Thread(target=edit)
+    editor.start()
+    watch_files([tmp_path], on_change, interval=0.01, should_stop=stop.is_set)
+    editor.join()
+
+    assert calls == [([page], [])]
+
+
+def test_watch_files_compares_with_an_earlier_snapshot(tmp_path):
+    page = tmp_path / "page.md"
+    page.write_text("- before")
+    snapshot = snapshot_markdown_files([tmp_path])
+    # Saved after the snapshot but before watching starts, e.g. during a first conversion
+    page.write_text("- after, longer")
+    calls = []
+
+    def on_change(changed, removed):
+        calls.append((changed, removed))
+
+    watch_files([tmp_path], on_change, interval=0.01, should_stop=lambda: bool(calls), snapshot=snapshot)
+
+    assert calls == [([page], [])]